@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, Dict, Optional
-
-import httpx
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
 
+from hamops.adapters.upstream import get_upstream_client
+from hamops.cache import SingleFlight, TTLCache
 from hamops.middleware.logging import log_error, log_info, log_warning
 from hamops.models.aprs import (
     APRSLocationRecord,
@@ -14,6 +16,55 @@ from hamops.models.aprs import (
     APRSWeatherRecord,
 )
 
+# Seconds a response stays fresh, by query type; aprs.fi rate-limits clients
+APRS_CACHE_TTL: Dict[str, float] = {
+    "loc": float(os.getenv("APRS_CACHE_TTL_LOC", "30")),
+    "wx": float(os.getenv("APRS_CACHE_TTL_WX", "120")),
+    "msg": float(os.getenv("APRS_CACHE_TTL_MSG", "60")),
+}
+APRS_CACHE_SIZE = int(os.getenv("APRS_CACHE_SIZE", "2048"))
+# How long past its TTL a response is still served while it is refreshed
+APRS_CACHE_MAX_STALE = float(os.getenv("APRS_CACHE_MAX_STALE", "600"))
+# aprs.fi accepts up to 20 comma-separated names per request
+APRS_BATCH_NAMES = 20
+APRS_BATCH_CONCURRENCY = int(os.getenv("APRS_BATCH_CONCURRENCY", "4"))
+
+
+def _cacheable(data: Any) -> bool:
+    """Whether an aprs.fi response is a successful answer worth caching."""
+    return isinstance(data, dict) and data.get("result") != "fail"
+
+
+_aprs_cache = TTLCache(APRS_CACHE_SIZE, APRS_CACHE_MAX_STALE, _cacheable)
+# Concurrent identical requests share one upstream call
+_aprs_flights = SingleFlight()
+
+
+# Weather stations whose last wx report had no position, most recent last;
+# their loc query is sent alongside the wx one rather than after it
+_wx_unplaced: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _remember_unplaced(name: str, unplaced: bool) -> None:
+    """Record whether station ``name``'s wx reports lack a position."""
+    if not unplaced:
+        _wx_unplaced.pop(name, None)
+        return
+    _wx_unplaced[name] = None
+    _wx_unplaced.move_to_end(name)
+    while len(_wx_unplaced) > APRS_CACHE_SIZE:
+        _wx_unplaced.popitem(last=False)
+
+
+def get_aprs_cache() -> TTLCache:
+    """Get the shared cache of aprs.fi responses."""
+    return _aprs_cache
+
+
+def get_aprs_flights() -> SingleFlight:
+    """Get the coalescer of in-flight aprs.fi requests."""
+    return _aprs_flights
+
 
 async def get_aprs_messages(callsign: str) -> list[APRSMessageRecord]:
     """Fetch APRS messages for a callsign.
@@ -63,7 +114,34 @@ def _to_int(val: Any) -> Optional[int]:
         return None
 
 
+def _normalize_name(name: str) -> str:
+    """Normalize a ``name`` parameter (callsigns, comma-separated) for caching."""
+    return ",".join(part.strip().upper() for part in str(name).split(","))
+
+
 async def _fetch_aprs(params: Dict[str, str | int | float]) -> Optional[dict]:
+    """Query the APRS.fi API through the response cache.
+
+    ``what``/``name`` queries are cached per ``(what, name)`` for that
+    query type's TTL; anything else goes straight upstream.  Either way,
+    concurrent identical requests share a single upstream call.
+    """
+    what = params.get("what")
+    ttl = APRS_CACHE_TTL.get(str(what))
+    if ttl is None or set(params) != {"what", "name"}:
+        return await _aprs_flights.do(
+            tuple(sorted(params.items())), lambda: _request_aprs(params)
+        )
+    name = _normalize_name(params["name"])
+    key = (what, name)
+    return await _aprs_cache.get(
+        key,
+        ttl,
+        lambda: _aprs_flights.do(key, lambda: _request_aprs({"what": what, "name": name})),
+    )
+
+
+async def _request_aprs(params: Dict[str, str | int | float]) -> Optional[dict]:
     """Query the APRS.fi API and return the JSON response dict, or None on error."""
     api_key = os.getenv("APRFI_API_KEY")
     if not api_key:
@@ -75,8 +153,7 @@ async def _fetch_aprs(params: Dict[str, str | int | float]) -> Optional[dict]:
     query = {**params, "apikey": api_key, "format": "json"}
     try:
         log_info("aprs_api_request", base_url=base_url, params=params)
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(base_url, params=query)
+        resp = await get_upstream_client().get(base_url, params=query)
         if resp.status_code != 200:
             log_warning(
                 "aprs_api_response_status", status_code=resp.status_code, text=resp.text
@@ -112,33 +189,49 @@ async def get_aprs_locations(callsign: str) -> list[APRSLocationRecord]:
             entry_time=entry.get("time"),
             entry=entry,
         )
-        result.append(
-            APRSLocationRecord(
-                name=entry.get("name", callsign),
-                time=_to_int(entry.get("time")),
-                lasttime=_to_int(entry.get("lasttime")),
-                lat=_to_float(entry.get("lat")),
-                lng=_to_float(entry.get("lng")),
-                course=_to_float(entry.get("course")),
-                speed=_to_float(entry.get("speed")),
-                altitude=_to_float(entry.get("altitude")),
-                symbol=entry.get("symbol"),
-                srccall=entry.get("srccall"),
-                dstcall=entry.get("dstcall"),
-                comment=entry.get("comment"),
-                path=entry.get("path"),
-                phg=entry.get("phg"),
-                status=entry.get("status"),
-                status_lasttime=_to_int(entry.get("status_lasttime")),
-            )
-        )
+        result.append(_location_record(entry, callsign))
     log_info("aprs_locations_result_count", callsign=callsign, result_count=len(result))
     return result
 
 
+def _location_record(entry: Dict[str, Any], callsign: str) -> APRSLocationRecord:
+    """Build a location record from an aprs.fi ``loc`` entry."""
+    return APRSLocationRecord(
+        name=entry.get("name", callsign),
+        time=_to_int(entry.get("time")),
+        lasttime=_to_int(entry.get("lasttime")),
+        lat=_to_float(entry.get("lat")),
+        lng=_to_float(entry.get("lng")),
+        course=_to_float(entry.get("course")),
+        speed=_to_float(entry.get("speed")),
+        altitude=_to_float(entry.get("altitude")),
+        symbol=entry.get("symbol"),
+        srccall=entry.get("srccall"),
+        dstcall=entry.get("dstcall"),
+        comment=entry.get("comment"),
+        path=entry.get("path"),
+        phg=entry.get("phg"),
+        status=entry.get("status"),
+        status_lasttime=_to_int(entry.get("status_lasttime")),
+    )
+
+
 async def get_aprs_weather(callsign: str) -> Optional[APRSWeatherRecord]:
-    """Get the latest weather report for an APRS weather station."""
-    data = await _fetch_aprs({"what": "wx", "name": callsign})
+    """Get the latest weather report for an APRS weather station.
+
+    A report without a position takes it from the station's location.
+    For stations seen to report that way before, both queries are sent
+    at once.
+    """
+    name = _normalize_name(callsign)
+    loc_data: Optional[dict] = None
+    if name in _wx_unplaced:
+        data, loc_data = await asyncio.gather(
+            _fetch_aprs({"what": "wx", "name": callsign}),
+            _fetch_aprs({"what": "loc", "name": callsign}),
+        )
+    else:
+        data = await _fetch_aprs({"what": "wx", "name": callsign})
     if not data or not isinstance(data, dict):
         return None
     entries = data.get("entries") or []
@@ -147,9 +240,11 @@ async def get_aprs_weather(callsign: str) -> Optional[APRSWeatherRecord]:
     entry = entries[0]
     lat = _to_float(entry.get("lat"))
     lng = _to_float(entry.get("lng"))
+    _remember_unplaced(name, lat is None or lng is None)
     # If lat/lng missing, try to fetch from location query
     if lat is None or lng is None:
-        loc_data = await _fetch_aprs({"what": "loc", "name": callsign})
+        if loc_data is None:
+            loc_data = await _fetch_aprs({"what": "loc", "name": callsign})
         log_info(
             "aprs_weather_location_fallback", callsign=callsign, loc_response=loc_data
         )
@@ -159,6 +254,13 @@ async def get_aprs_weather(callsign: str) -> Optional[APRSWeatherRecord]:
                 loc_entry = loc_entries[0]
                 lat = _to_float(loc_entry.get("lat"))
                 lng = _to_float(loc_entry.get("lng"))
+    return _weather_record(entry, callsign, lat, lng)
+
+
+def _weather_record(
+    entry: Dict[str, Any], callsign: str, lat: Optional[float], lng: Optional[float]
+) -> APRSWeatherRecord:
+    """Build a weather record from an aprs.fi ``wx`` entry and a position."""
     return APRSWeatherRecord(
         name=entry.get("name", callsign),
         time=_to_int(entry.get("time")),
@@ -175,3 +277,115 @@ async def get_aprs_weather(callsign: str) -> Optional[APRSWeatherRecord]:
         rain_mn=_to_float(entry.get("rain_mn")),
         luminosity=_to_float(entry.get("luminosity")),
     )
+
+
+async def _fetch_aprs_batch(what: str, names: Iterable[str]) -> Dict[str, List[dict]]:
+    """Query many station names, ``APRS_BATCH_NAMES`` per request.
+
+    Requests for the groups run concurrently, at most
+    ``APRS_BATCH_CONCURRENCY`` at a time, and go through the response
+    cache like single queries.
+
+    Returns:
+        The entries for each normalized name, in the order the names were
+        given; a name aprs.fi does not know (or an empty name, or one
+        holding a comma) maps to an empty list
+    """
+    by_name: Dict[str, List[dict]] = {
+        name: [] for name in dict.fromkeys(_normalize_name(name) for name in names)
+    }
+    # A name holding a comma would be read as several stations
+    unique = [name for name in by_name if name and "," not in name]
+    groups = [
+        unique[i:i + APRS_BATCH_NAMES] for i in range(0, len(unique), APRS_BATCH_NAMES)
+    ]
+    semaphore = asyncio.Semaphore(APRS_BATCH_CONCURRENCY)
+
+    async def fetch(group: List[str]) -> Optional[dict]:
+        async with semaphore:
+            return await _fetch_aprs({"what": what, "name": ",".join(group)})
+
+    for data in await asyncio.gather(*(fetch(group) for group in groups)):
+        if not data or not isinstance(data, dict):
+            continue
+        for entry in data.get("entries") or []:
+            entries = by_name.get(str(entry.get("name", "")).upper())
+            if entries is not None:
+                entries.append(entry)
+    log_info(
+        "aprs_batch_fetched",
+        what=what,
+        names=len(unique),
+        requests=len(groups),
+        found=sum(1 for entries in by_name.values() if entries),
+    )
+    return by_name
+
+
+async def get_aprs_locations_batch(
+    callsigns: List[str],
+) -> Dict[str, list[APRSLocationRecord]]:
+    """Return APRS location records for many callsigns at once.
+
+    Returns:
+        The records for each requested callsign, keyed as given (duplicates
+        collapse); an empty list where nothing was found
+    """
+    by_name = await _fetch_aprs_batch("loc", callsigns)
+    return {
+        callsign: [
+            _location_record(entry, callsign)
+            for entry in by_name[_normalize_name(callsign)]
+        ]
+        for callsign in callsigns
+    }
+
+
+async def get_aprs_weather_batch(
+    callsigns: List[str],
+) -> Dict[str, Optional[APRSWeatherRecord]]:
+    """Get the latest weather report for many APRS weather stations at once.
+
+    Stations whose weather report has no position are located with a
+    batched ``loc`` query, sent alongside the ``wx`` one for stations seen
+    to report that way before.
+
+    Returns:
+        The weather record for each requested callsign, keyed as given
+        (duplicates collapse); None where the station has no weather report
+    """
+    expected = [
+        callsign for callsign in callsigns if _normalize_name(callsign) in _wx_unplaced
+    ]
+    if expected:
+        wx, locations = await asyncio.gather(
+            _fetch_aprs_batch("wx", callsigns), _fetch_aprs_batch("loc", expected)
+        )
+    else:
+        wx, locations = await _fetch_aprs_batch("wx", callsigns), {}
+    reports = {name: entries[0] for name, entries in wx.items() if entries}
+    unplaced = []
+    for name, entry in reports.items():
+        missing = _to_float(entry.get("lat")) is None or _to_float(entry.get("lng")) is None
+        _remember_unplaced(name, missing)
+        if missing and name not in locations:
+            unplaced.append(name)
+    if unplaced:
+        locations.update(await _fetch_aprs_batch("loc", unplaced))
+
+    result: Dict[str, Optional[APRSWeatherRecord]] = {}
+    for callsign in callsigns:
+        name = _normalize_name(callsign)
+        entry = reports.get(name)
+        if entry is None:
+            result[callsign] = None
+            continue
+        lat = _to_float(entry.get("lat"))
+        lng = _to_float(entry.get("lng"))
+        if lat is None or lng is None:
+            loc_entries = locations.get(name) or []
+            if loc_entries:
+                lat = _to_float(loc_entries[0].get("lat"))
+                lng = _to_float(loc_entries[0].get("lng"))
+        result[callsign] = _weather_record(entry, callsign, lat, lng)
+    return result
@@ -1,128 +1,606 @@
-"""Band plan adapter for querying US amateur radio frequency allocations."""
+"""Band plan adapter for querying amateur radio frequency allocations by region."""
 
 from __future__ import annotations
 
+import gc
+import hashlib
+import heapq
+import itertools
 import json
+import os
 import re
+import sys
+import threading
+import time
+import types
+from array import array
+from bisect import bisect_right
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from hamops.middleware.logging import log_error, log_info
+from hamops.adapters.bandplan_binary import BandPlanImage
+from hamops.adapters.bandplan_classifier import get_band_classifier
+from hamops.adapters.bandplan_store import BlobTable, SegmentInterner, SegmentRecord
+from hamops.adapters.bandplan_index import (
+    BitmapIndex,
+    CoverageIndex,
+    IntervalIndex,
+    PartitionIndex,
+    PrivilegeIndex,
+    TextIndex,
+)
+from hamops.cache import LRUCache
+from hamops.middleware.logging import log_error, log_info, log_warning
 from hamops.models.bandplan import (
     BandSegment,
     FrequencyInfo,
     BandSearchResult,
     BandPlanSummary,
+    SpectrumSpan,
+    RangeCoverage,
+    ModeCoverage,
+    BandCoverage,
+    TextSearchHit,
+    TextSearchResult,
+    PrivilegeCheck,
+    PrivilegeQuery,
+    PrivilegeSpan,
+    PrivilegeMap,
 )
 
+DATA_DIR = Path("hamops/data")
+DEFAULT_REGION = os.getenv("BANDPLAN_DEFAULT_REGION", "us").lower()
+DEFAULT_DATA_FILE = DATA_DIR / f"{DEFAULT_REGION}_bandplan.json"
+SEARCH_CACHE_SIZE = int(os.getenv("BANDPLAN_SEARCH_CACHE_SIZE", "256"))
+MAX_RESIDENT_PLANS = int(os.getenv("BANDPLAN_MAX_RESIDENT", "8"))
+MAX_RESIDENT_BYTES = int(os.getenv("BANDPLAN_MAX_RESIDENT_MB", "96")) * 1024 * 1024
 
-class BandPlanAdapter:
-    """Adapter for querying the US amateur radio band plan."""
+# Relative weight of a text match in each searchable segment field
+TEXT_FIELD_WEIGHTS = {"bandName": 3.0, "mode": 2.0, "description": 1.0}
+
+# Placeholder segments that span spectrum without allocating it
+_UNALLOCATED_DESCRIPTION = "Not Allocated"
+# Region codes double as file name prefixes, so keep them to a safe alphabet
+_REGION = re.compile(r"[a-z0-9][a-z0-9_-]*")
+
+
+# Number with optional decimal part and unit, allowing surrounding whitespace
+# and spaces before the unit.  Inputs with commas or other inner spaces are
+# normalized first and matched again.
+_FREQUENCY = re.compile(r"\s*(\d*)(?:\.(\d*))?[ ]*([KMG]?HZ)?\s*", re.IGNORECASE)
+_UNIT_MULTIPLIERS = {"GHZ": 1_000_000_000, "MHZ": 1_000_000, "KHZ": 1_000, "HZ": 1}
+_PARSE_CACHE_MAX_LEN = 32
+
+
+def _parse_frequency(freq_str: str) -> Optional[int]:
+    """Parse a frequency string into Hz using exact integer arithmetic."""
+    match = _FREQUENCY.fullmatch(freq_str)
+    if match is None:
+        cleaned = freq_str.strip().replace(",", "").replace(" ", "")
+        match = _FREQUENCY.fullmatch(cleaned)
+        if match is None:
+            return None
+    whole, fraction, unit = match.groups()
+    if not whole and not fraction:
+        # "", "." or a bare unit carry no digits
+        return None
+    
+    try:
+        value = int(whole or "0")
+        if unit:
+            multiplier = _UNIT_MULTIPLIERS[unit.upper()]
+        elif fraction is not None or value < 1000:
+            # No unit: has decimal or small number - assume MHz
+            multiplier = 1_000_000
+        elif value < 1_000_000:
+            # Medium number - assume kHz
+            multiplier = 1_000
+        else:
+            # Large number - assume Hz
+            multiplier = 1
+        if not fraction:
+            return value * multiplier
+        scale = 10 ** len(fraction)
+        return (value * scale + int(fraction)) * multiplier // scale
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_frequency_cached(freq_str: str) -> Optional[int]:
+    return _parse_frequency(freq_str)
+
+
+def parse_frequency(freq_str: str) -> Optional[int]:
+    """Parse a frequency string with unit detection.
+    
+    Accepts formats like:
+    - "14.225 MHz" or "14.225MHz"
+    - "14225 kHz" or "14225kHz"  
+    - "14225000 Hz" or "14225000"
+    - "14,225,000" (with commas)
+    - "14.225" (assumes MHz if has decimal)
+    
+    The decimal value is scaled exactly, so "14.225 MHz" is 14225000 Hz;
+    any fraction of a hertz is truncated.  Results for short inputs are
+    memoized.
+    """
+    if not freq_str:
+        return None
+    if len(freq_str) > _PARSE_CACHE_MAX_LEN:
+        return _parse_frequency(freq_str)
+    return _parse_frequency_cached(freq_str)
+
+
+def parse_frequencies(freq_strs: Iterable[str]) -> List[Optional[int]]:
+    """Parse many frequency strings; unparseable entries become ``None``.
+
+    Repeated inputs within the batch are parsed once.
+    """
+    seen: Dict[str, Optional[int]] = {}
+    out: List[Optional[int]] = []
+    for freq_str in freq_strs:
+        try:
+            out.append(seen[freq_str])
+        except KeyError:
+            value = seen[freq_str] = parse_frequency(freq_str)
+            out.append(value)
+    return out
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a small value as compact JSON bytes."""
+    return _ENCODER.encode(value).encode()
+
+
+# Shared by every plan rather than held by one
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+)
+
+
+def _heap_size(root: Any) -> int:
+    """Sum ``sys.getsizeof`` over every object reachable from ``root``.
+
+    Classes, modules and functions are skipped.  A memory-mapped image
+    counts only its mapping object, since its pages are file-backed.
+    """
+    seen = set()
+    size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+class BandPlanSnapshot:
+    """One loaded band plan with its indices and caches.
+
+    A snapshot is built completely before it is published and its data is
+    never modified afterwards; only memoized results (slice models, the
+    search cache) are filled in as queries arrive.
+    """
     
-    def __init__(self):
-        """Initialize the band plan adapter and load data."""
+    def __init__(self, data_file: Optional[Path] = None, prefer_image: bool = True):
+        """Load a band plan and build its indices.
+
+        Args:
+            data_file: Band plan JSON to load (defaults to the default region's plan)
+            prefer_image: Load the sibling ``.bin`` image when it matches
+                the JSON, instead of parsing the JSON
+        """
+        self.data_file = Path(data_file or DEFAULT_DATA_FILE)
+        self.prefer_image = prefer_image
         self.data: Optional[Dict[str, Any]] = None
-        self.bands: List[Dict[str, Any]] = []
+        self.bands: List[SegmentRecord] = []
         self.indices: Dict[str, Any] = {}
+        self.plan_hash: Optional[str] = None
+        self.load_duration_ms: Optional[float] = None
+        self._heap_bytes: Optional[int] = None
+        self._image: Optional[BandPlanImage] = None
+        self._search_cache = LRUCache(SEARCH_CACHE_SIZE)
+        self._models: List[Optional[BandSegment]] = []  # Built on first use
+        self._segment_json: Sequence[bytes] = []
+        self._by_start: List[int] = []
+        self._starts: List[int] = []
+        self._interval_index = IntervalIndex([], [])
+        self._bitmaps = BitmapIndex(0)
+        self._partition = PartitionIndex([], [])
+        self._slice_group: List[int] = []
+        self._group_cover: List[Tuple[int, ...]] = []
+        self._group_json: List[bytes] = []  # Encoded aggregate members per group
+        self._group_info: List[Optional[FrequencyInfo]] = []
+        self._coverage = CoverageIndex([], [])
+        self._band_coverage: Dict[str, BandCoverage] = {}
+        self._text_index = TextIndex([], TEXT_FIELD_WEIGHTS)
+        self._privileges = PrivilegeIndex([])
+        self._class_names: Dict[str, str] = {}  # Lowercased -> as in the plan
+        self._mode_names: Dict[str, str] = {}
+        self._empty_info = self._aggregate(0, [])
+        self._empty_json = b',"bands":[]' + self._encode_info_fields(self._summarize([]))
         self._load_bandplan()
     
     def _load_bandplan(self) -> None:
-        """Load the band plan JSON data into memory."""
+        """Load the band plan into memory.
+
+        The binary image written by ``scripts/gen_bandplan.py`` is
+        memory-mapped when it was built from the current JSON; otherwise
+        the JSON is parsed and every index is built from scratch.
+        """
+        started = time.perf_counter()
         try:
-            data_file = Path("hamops/data/us_bandplan.json")
-            if not data_file.exists():
+            data_file = self.data_file
+            image_file = data_file.with_suffix(".bin")
+            if not data_file.exists() and not image_file.exists():
                 log_error(
                     "bandplan_data_missing",
                     message=f"Band plan data file not found at {data_file}. Run scripts/gen_bandplan.py first.",
                 )
                 return
             
-            with open(data_file, "r") as f:
-                self.data = json.load(f)
-                self.bands = self.data.get("bands", [])
-                self.indices = self.data.get("indices", {})
+            raw = data_file.read_bytes() if data_file.exists() else None
+            plan_hash = hashlib.sha256(raw).hexdigest()[:16] if raw is not None else None
+            image = self._open_image(image_file, plan_hash) if self.prefer_image else None
+            if image is not None:
+                self._load_image(image)
+            else:
+                data = json.loads(raw)
+                # Entries that skipped gen_bandplan.py's enrichment (e.g. from
+                # a third-party plan) are classified as they load
+                classifier = get_band_classifier()
+                interner = SegmentInterner()
+                bands = []
+                for band in data.pop("bands", []):
+                    if "minFrequencyMHz" not in band:
+                        classifier.enrich(band)
+                    bands.append(interner.record(band))
+                self.bands = bands
+                # The partition index supersedes the per-frequency index, as
+                # in the image
+                self.indices = {
+                    key: value
+                    for key, value in data.pop("indices", {}).items()
+                    if key != "frequencyIndex"
+                }
+                self.data = data
+                self.plan_hash = plan_hash
+                self._image = None
+                self._build_indices()
             
+            self.load_duration_ms = round((time.perf_counter() - started) * 1000, 2)
             log_info(
                 "bandplan_loaded",
                 segments=len(self.bands),
                 version=self.data.get("version"),
+                format="binary" if self._image is not None else "json",
+                duration_ms=self.load_duration_ms,
             )
         except Exception as e:
             log_error("bandplan_load_error", error=str(e))
             self.data = None
             self.bands = []
             self.indices = {}
+            self.plan_hash = None
+            self._image = None
+            self._build_indices()
     
-    def parse_frequency(self, freq_str: str) -> Optional[int]:
-        """Parse a frequency string with unit detection.
-        
-        Accepts formats like:
-        - "14.225 MHz" or "14.225MHz"
-        - "14225 kHz" or "14225kHz"  
-        - "14225000 Hz" or "14225000"
-        - "14,225,000" (with commas)
-        - "14.225" (assumes MHz if has decimal)
-        """
-        if not freq_str:
+    @staticmethod
+    def _open_image(image_file: Path, plan_hash: Optional[str]) -> Optional[BandPlanImage]:
+        """Map the binary image if it exists and was built from ``plan_hash``."""
+        if not image_file.exists():
             return None
-        
-        # Clean up the string
-        freq_str = freq_str.strip().upper()
-        freq_str = freq_str.replace(",", "")
-        freq_str = freq_str.replace(" ", "")
-        
-        # Extract number and unit using regex
-        match = re.match(r"^([\d.]+)([KMGH]?HZ)?$", freq_str)
-        if not match:
-            return None
-        
         try:
-            value = float(match.group(1))
-            unit = match.group(2) or ""
-            
-            # Determine multiplier based on unit
-            if unit == "GHZ":
-                return int(value * 1_000_000_000)
-            elif unit == "MHZ":
-                return int(value * 1_000_000)
-            elif unit == "KHZ":
-                return int(value * 1_000)
-            elif unit == "HZ":
-                return int(value)
-            else:
-                # No unit specified - guess based on value
-                if "." in match.group(1):
-                    # Has decimal - assume MHz
-                    return int(value * 1_000_000)
-                elif value < 1000:
-                    # Small number - assume MHz
-                    return int(value * 1_000_000)
-                elif value < 1_000_000:
-                    # Medium number - assume kHz
-                    return int(value * 1_000)
-                else:
-                    # Large number - assume Hz
-                    return int(value)
-        except ValueError:
+            image = BandPlanImage(image_file)
+        except Exception as e:
+            log_warning("bandplan_image_unreadable", path=str(image_file), error=str(e))
             return None
+        if plan_hash is not None and image.meta.get("planHash") != plan_hash:
+            log_warning("bandplan_image_stale", path=str(image_file))
+            return None
+        return image
     
-    def get_frequency_info(self, frequency: int) -> FrequencyInfo:
-        """Get information about what's available at a specific frequency.
+    def _load_image(self, image: BandPlanImage) -> None:
+        """Adopt the segments and prebuilt indices of a binary image."""
+        meta = image.meta
+        self._image = image
+        self.bands = image.bands
+        self.data = {
+            key: value
+            for key, value in meta.items()
+            if key not in ("planHash", "segmentCount", "sliceCount", "groupCount")
+        }
+        self.indices = meta.get("indices", {})
+        self.plan_hash = meta["planHash"]
+        self._search_cache.clear()
         
-        Args:
-            frequency: Frequency in Hz
-            
-        Returns:
-            FrequencyInfo with all bands containing this frequency
-        """
-        matching_bands = []
+        self._models = [None] * len(self.bands)
+        self._segment_json = image.segment_json
         
-        # Find all band segments containing this frequency
-        for band_data in self.bands:
-            if band_data["minFrequency"] <= frequency <= band_data["maxFrequency"]:
-                matching_bands.append(BandSegment(**band_data))
+        self._by_start = image.by_start
+        self._starts = [self.bands[i].minFrequency for i in self._by_start]
+        self._interval_index = IntervalIndex(
+            self._starts,
+            [self.bands[i].maxFrequency for i in self._by_start],
+            image.max_ends,
+        )
+        self._bitmaps = BitmapIndex.from_maps(len(self.bands), image.bitmaps)
         
-        # Aggregate information from matching bands
+        self._partition = PartitionIndex.from_parts(
+            image.cuts, [image.group_cover[g] for g in image.slice_group]
+        )
+        self._slice_group = image.slice_group
+        self._group_cover = image.group_cover
+        self._group_json = image.group_json
+        self._group_info = [None] * len(self._group_cover)
+        self._build_coverage()
+        self._build_text_index()
+        self._build_privileges()
+    
+    def _build_indices(self) -> None:
+        """Validate every segment once and build the derived lookup structures."""
+        self._search_cache.clear()
+        self._build_segments()
+        self._build_interval_index()
+        self._build_bitmaps()
+        self._build_partition()
+        self._build_coverage()
+        self._build_text_index()
+        self._build_privileges()
+    
+    def _build_segments(self) -> None:
+        """Validate every segment once and pre-encode its JSON.
+
+        The models themselves are not kept; ``segment`` rebuilds one when a
+        Python caller asks for it.
+        """
+        self._models = [None] * len(self.bands)
+        self._segment_json = BlobTable.from_blobs(
+            BandSegment(**band.as_dict()).model_dump_json().encode()
+            for band in self.bands
+        )
+    
+    def segment(self, idx: int) -> BandSegment:
+        """Return the ``BandSegment`` model of ``self.bands[idx]``, built once.
+
+        The model is shared by every result built from it; public methods
+        hand out copies.
+        """
+        model = self._models[idx]
+        if model is None:
+            model = self._models[idx] = BandSegment(**self.bands[idx].as_dict())
+        return model
+    
+    def _encode_segments(self, indices: Iterable[int]) -> bytes:
+        """Join the pre-encoded JSON of the given segments into a JSON array."""
+        return b"[" + b",".join(self._segment_json[idx] for idx in indices) + b"]"
+    
+    def _build_interval_index(self) -> None:
+        """Index segment frequency spans for overlap queries."""
+        self._by_start = sorted(
+            range(len(self.bands)), key=lambda i: self.bands[i].minFrequency
+        )
+        self._starts = [self.bands[i].minFrequency for i in self._by_start]
+        self._interval_index = IntervalIndex(
+            self._starts,
+            [self.bands[i].maxFrequency for i in self._by_start],
+        )
+    
+    def _build_bitmaps(self) -> None:
+        """Build per-value bitmaps for the searchable segment attributes."""
+        self._bitmaps = BitmapIndex(len(self.bands))
+        for position, idx in enumerate(self._by_start):
+            segment = self.bands[idx]
+            if segment.mode:
+                self._bitmaps.add("mode", segment.mode, position)
+            if segment.bandName:
+                self._bitmaps.add("bandName", segment.bandName, position)
+            for use in segment.typicalUses or ():
+                self._bitmaps.add("typicalUses", use, position)
+            for license_class in segment.licenseClass or ():
+                self._bitmaps.add("licenseClass", license_class, position)
+    
+    def _overlapping(self, min_freq: float, max_freq: float) -> List[int]:
+        """Return indices into ``self.bands`` overlapping ``[min_freq, max_freq]``.
+
+        Indices are ordered by ``minFrequency``.
+        """
+        return [
+            self._by_start[pos]
+            for pos in self._interval_index.overlapping(min_freq, max_freq)
+        ]
+    
+    def _build_partition(self) -> None:
+        """Precompute the aggregated ``FrequencyInfo`` for every spectrum slice.
+
+        Slices with the same covering segments share one group.  The
+        group's aggregated members are encoded here and its ``FrequencyInfo``
+        model is built on first use; a lookup only adds the frequency and
+        joins the pre-encoded covering segments.
+        """
+        self._partition = PartitionIndex(
+            [band.minFrequency for band in self.bands],
+            [band.maxFrequency for band in self.bands],
+        )
+        by_cover: Dict[tuple, int] = {}
+        slice_group = array("I")
+        self._group_cover = []
+        group_json = []
+        for cover in self._partition.covers:
+            group = by_cover.get(cover)
+            if group is None:
+                group = by_cover[cover] = len(self._group_cover)
+                self._group_cover.append(cover)
+                group_json.append(
+                    self._encode_info_fields(
+                        self._summarize([self.bands[idx] for idx in cover])
+                    )
+                )
+            slice_group.append(group)
+        self._slice_group = slice_group
+        self._group_json = BlobTable.from_blobs(group_json)
+        self._group_info = [None] * len(self._group_cover)
+    
+    def _build_coverage(self) -> None:
+        """Sweep the segment edges for gaps, overlap depth and band coverage.
+
+        Segments are treated as ``[minFrequency, maxFrequency)`` here so
+        that neighbours sharing an edge frequency do not register as
+        overlapping.  "Not Allocated" placeholders add to the overlap depth
+        but leave their spectrum unallocated.  A mode covers the parts of
+        an amateur band where a segment of that band allows it.
+        """
+        self._coverage = CoverageIndex(
+            [segment.minFrequency for segment in self.bands],
+            [segment.maxFrequency for segment in self.bands],
+            [
+                segment.description != _UNALLOCATED_DESCRIPTION
+                for segment in self.bands
+            ],
+        )
+        bounds = self._coverage.bounds
+        covered: Dict[str, int] = {}
+        by_mode: Dict[str, Dict[str, int]] = {}
+        for j in range(len(bounds) - 1):
+            width = bounds[j + 1] - bounds[j]
+            band_modes: Dict[str, set] = {}
+            for idx in self._coverage.covers[j]:
+                segment = self.bands[idx]
+                if segment.bandName:
+                    modes = band_modes.setdefault(segment.bandName, set())
+                    if segment.mode:
+                        modes.add(segment.mode)
+            for band_name, modes in band_modes.items():
+                covered[band_name] = covered.get(band_name, 0) + width
+                mode_widths = by_mode.setdefault(band_name, {})
+                for mode in modes:
+                    mode_widths[mode] = mode_widths.get(mode, 0) + width
+
+        edges: Dict[str, Tuple[int, int]] = {}
+        for segment in self.bands:
+            if segment.bandName:
+                low, high = edges.get(
+                    segment.bandName, (segment.minFrequency, segment.maxFrequency)
+                )
+                edges[segment.bandName] = (
+                    min(low, segment.minFrequency),
+                    max(high, segment.maxFrequency),
+                )
+
+        self._band_coverage = {}
+        for band_name, (low, high) in sorted(edges.items(), key=lambda kv: kv[1]):
+            total = covered.get(band_name, 0)
+            modes = sorted(
+                by_mode.get(band_name, {}).items(), key=lambda kv: (-kv[1], kv[0])
+            )
+            self._band_coverage[band_name] = BandCoverage(
+                bandName=band_name,
+                start=low,
+                end=high,
+                startMHz=low / 1_000_000,
+                endMHz=high / 1_000_000,
+                coveredHz=total,
+                modes=[
+                    ModeCoverage(
+                        mode=mode,
+                        coveredHz=width,
+                        fraction=width / total if total else 0.0,
+                    )
+                    for mode, width in modes
+                ],
+            )
+    
+    def _build_text_index(self) -> None:
+        """Index segment text fields for full-text search, in start order."""
+        self._text_index = TextIndex(
+            [
+                {field: getattr(self.bands[idx], field) for field in TEXT_FIELD_WEIGHTS}
+                for idx in self._by_start
+            ],
+            TEXT_FIELD_WEIGHTS,
+        )
+    
+    def _build_privileges(self) -> None:
+        """Merge the spectrum each license class may use, by mode.
+
+        "Not Allocated" placeholders grant nothing, whatever classes the
+        classifier gave them.
+        """
+        self._privileges = PrivilegeIndex(
+            (band.minFrequency, band.maxFrequency, band.licenseClass, band.mode)
+            for band in self.bands
+            if band.licenseClass and band.description != _UNALLOCATED_DESCRIPTION
+        )
+        self._class_names = {
+            license_class.lower(): license_class
+            for license_class in self._privileges.classes
+        }
+        self._mode_names = {
+            band.mode.lower(): band.mode for band in self.bands if band.mode
+        }
+    
+    def _slice_tail(self, slice_idx: int) -> bytes:
+        """Return the encoded ``FrequencyInfo`` tail for a slice."""
+        if slice_idx < 0:
+            return self._empty_json
+        group = self._slice_group[slice_idx]
+        return (
+            b',"bands":'
+            + self._encode_segments(self._group_cover[group])
+            + self._group_json[group]
+        )
+    
+    def _slice_template(self, slice_idx: int) -> FrequencyInfo:
+        """Return the shared ``FrequencyInfo`` for a slice, building it once."""
+        if slice_idx < 0:
+            return self._empty_info
+        group = self._slice_group[slice_idx]
+        info = self._group_info[group]
+        if info is None:
+            info = self._aggregate(
+                0, [self.segment(idx) for idx in self._group_cover[group]]
+            )
+            self._group_info[group] = info
+        return info
+    
+    @staticmethod
+    def _encode_info_fields(fields: Tuple[Any, ...]) -> bytes:
+        """Encode the aggregated members that close a ``FrequencyInfo`` object.
+
+        ``fields`` comes from ``_summarize``.  The result follows the
+        ``bands`` member, so a lookup only has to prepend the frequency and
+        the covering segments.
+        """
+        primary_band, modes, licenses, uses = fields
+        return b"".join((
+            b',"primaryBand":',
+            _dumps(primary_band),
+            b',"allowedModes":',
+            _dumps(modes),
+            b',"requiredLicense":',
+            _dumps(licenses),
+            b',"typicalUses":',
+            _dumps(uses),
+            b"}",
+        ))
+    
+    @staticmethod
+    def _summarize(
+        matching_bands: Sequence[BandSegment | SegmentRecord],
+    ) -> Tuple[Any, ...]:
+        """Return primary band, modes, licenses and uses for a set of segments."""
         all_modes = set()
         all_licenses = set()
         all_uses = set()
@@ -138,14 +616,123 @@ class BandPlanAdapter:
             if band.bandName and not primary_band:
                 primary_band = band.bandName
         
+        return primary_band, sorted(all_modes), sorted(all_licenses), sorted(all_uses)
+    
+    @classmethod
+    def _aggregate(
+        cls, frequency: int, matching_bands: List[BandSegment]
+    ) -> FrequencyInfo:
+        """Combine the segments covering a frequency into a ``FrequencyInfo``."""
+        primary_band, modes, licenses, uses = cls._summarize(matching_bands)
         return FrequencyInfo(
             frequency=frequency,
             frequencyMHz=frequency / 1_000_000,
             bands=matching_bands,
             primaryBand=primary_band,
-            allowedModes=sorted(list(all_modes)),
-            requiredLicense=sorted(list(all_licenses)),
-            typicalUses=sorted(list(all_uses)),
+            allowedModes=modes,
+            requiredLicense=licenses,
+            typicalUses=uses,
+        )
+    
+    def parse_frequency(self, freq_str: str) -> Optional[int]:
+        """Parse a frequency string with unit detection (see ``parse_frequency``)."""
+        return parse_frequency(freq_str)
+    
+    def get_frequency_info(self, frequency: int) -> FrequencyInfo:
+        """Get information about what's available at a specific frequency.
+        
+        Args:
+            frequency: Frequency in Hz
+            
+        Returns:
+            FrequencyInfo with all bands containing this frequency
+        """
+        info = self._slice_template(self._partition.slice_of(frequency))
+        return info.model_copy(
+            update={"frequency": frequency, "frequencyMHz": frequency / 1_000_000},
+            deep=True,
+        )
+    
+    def get_frequency_info_json(self, frequency: int) -> bytes:
+        """Return ``get_frequency_info(frequency)`` already encoded as JSON."""
+        return self._encode_frequency(frequency, self._partition.slice_of(frequency))
+    
+    def _encode_frequency(self, frequency: int, slice_idx: int) -> bytes:
+        """Encode the ``FrequencyInfo`` for a frequency in a known slice."""
+        tail = self._slice_tail(slice_idx)
+        head = b'{"frequency":%d,"frequencyMHz":%s' % (
+            frequency,
+            _dumps(frequency / 1_000_000),
+        )
+        return head + tail
+    
+    def parse_frequencies(self, freq_strs: Iterable[str]) -> List[Optional[int]]:
+        """Parse many frequency strings; unparseable entries become ``None``."""
+        return parse_frequencies(freq_strs)
+    
+    def _classify_sorted(self, frequencies: List[Optional[int]]) -> List[int]:
+        """Return the partition slice for each frequency, in input order.
+
+        Valid frequencies are sorted once and matched against the slice
+        boundaries in a single merge pass; invalid entries map to ``-1``.
+        """
+        order = sorted(
+            (i for i, freq in enumerate(frequencies) if freq is not None),
+            key=frequencies.__getitem__,
+        )
+        slices = self._partition.slices_of_sorted([frequencies[i] for i in order])
+        result = [-1] * len(frequencies)
+        for i, slice_idx in zip(order, slices):
+            result[i] = slice_idx
+        return result
+    
+    def get_frequency_info_batch(
+        self, freq_strs: List[str]
+    ) -> List[Optional[FrequencyInfo]]:
+        """Classify many frequency strings at once.
+
+        Args:
+            freq_strs: Frequencies in any format accepted by ``parse_frequency``
+
+        Returns:
+            A ``FrequencyInfo`` per input, in input order, or ``None`` where
+            the input could not be parsed
+        """
+        frequencies = self.parse_frequencies(freq_strs)
+        results: List[Optional[FrequencyInfo]] = []
+        for freq, slice_idx in zip(frequencies, self._classify_sorted(frequencies)):
+            if freq is None:
+                results.append(None)
+                continue
+            info = self._slice_template(slice_idx)
+            results.append(
+                info.model_copy(
+                    update={"frequency": freq, "frequencyMHz": freq / 1_000_000},
+                    deep=True,
+                )
+            )
+        return results
+    
+    def get_frequency_info_batch_json(self, freq_strs: List[str]) -> bytes:
+        """Return ``get_frequency_info_batch(...)`` already encoded as JSON.
+
+        The payload lists one record per input (``null`` when unparseable)
+        together with the positions of the inputs that failed to parse.
+        """
+        frequencies = self.parse_frequencies(freq_strs)
+        records: List[bytes] = []
+        invalid: List[int] = []
+        slices = self._classify_sorted(frequencies)
+        for i, (freq, slice_idx) in enumerate(zip(frequencies, slices)):
+            if freq is None:
+                records.append(b"null")
+                invalid.append(i)
+            else:
+                records.append(self._encode_frequency(freq, slice_idx))
+        return b'{"count":%d,"records":[%s],"invalid":%s}' % (
+            len(records),
+            b",".join(records),
+            _dumps(invalid),
         )
     
     def search_bands(
@@ -170,56 +757,144 @@ class BandPlanAdapter:
         Returns:
             BandSearchResult with matching segments
         """
-        results = []
-        candidate_indices = set()
-        
-        # Start with all bands if no specific filters
-        if not any([mode, band_name, typical_use]):
-            candidate_indices = set(range(len(self.bands)))
+        key = self._search_key(
+            "model", mode, band_name, license_class, typical_use, min_freq, max_freq
+        )
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
         
-        # Use indices for efficient filtering
-        if mode and mode in self.indices.get("modeIndex", {}):
-            mode_indices = set(self.indices["modeIndex"][mode])
-            if candidate_indices:
-                candidate_indices &= mode_indices
-            else:
-                candidate_indices = mode_indices
+        matches = self._search_indices(
+            mode, band_name, license_class, typical_use, min_freq, max_freq
+        )
+        result = BandSearchResult(
+            query=self._search_query(
+                mode, band_name, license_class, typical_use, min_freq, max_freq
+            ),
+            count=len(matches),
+            bands=[self.segment(idx) for idx in matches],
+        )
+        self._search_cache.put(key, result)
+        return result.model_copy(deep=True)
+    
+    def search_bands_json(
+        self,
+        mode: Optional[str] = None,
+        band_name: Optional[str] = None,
+        license_class: Optional[str] = None,
+        typical_use: Optional[str] = None,
+        min_freq: Optional[int] = None,
+        max_freq: Optional[int] = None,
+    ) -> bytes:
+        """Return ``search_bands(...)`` already encoded as JSON."""
+        key = self._search_key(
+            "json", mode, band_name, license_class, typical_use, min_freq, max_freq
+        )
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
         
-        if band_name and band_name in self.indices.get("bandNameIndex", {}):
-            band_indices = set(self.indices["bandNameIndex"][band_name])
-            if candidate_indices:
-                candidate_indices &= band_indices
-            else:
-                candidate_indices = band_indices
+        matches = self._search_indices(
+            mode, band_name, license_class, typical_use, min_freq, max_freq
+        )
+        query = self._search_query(
+            mode, band_name, license_class, typical_use, min_freq, max_freq
+        )
+        payload = (
+            b'{"query":%s,"count":%d,"bands":%s}'
+            % (_dumps(query), len(matches), self._encode_segments(matches))
+        )
+        self._search_cache.put(key, payload)
+        return payload
+    
+    def _text_hits(
+        self, query: str, fuzzy: bool, limit: int
+    ) -> Tuple[int, List[Tuple[int, float]]]:
+        """Return the match count and the top ``(segment index, score)`` pairs."""
+        hits = self._text_index.search(query, fuzzy=fuzzy)
+        return len(hits), [
+            (self._by_start[position], round(score, 4))
+            for position, score in hits[:limit]
+        ]
+    
+    def search_text(
+        self, query: str, fuzzy: bool = False, limit: int = 25
+    ) -> TextSearchResult:
+        """Full-text search over segment descriptions, band names and modes.
         
-        if typical_use and typical_use in self.indices.get("useIndex", {}):
-            use_indices = set(self.indices["useIndex"][typical_use])
-            if candidate_indices:
-                candidate_indices &= use_indices
-            else:
-                candidate_indices = use_indices
+        Every word of the query must match a word of the segment exactly or
+        as a prefix; with ``fuzzy``, close misspellings match too.  Band name
+        matches rank above mode matches, which rank above description ones.
         
-        # Apply additional filters
-        for idx in candidate_indices:
-            band_data = self.bands[idx]
-            
-            # Check license class
-            if license_class:
-                licenses = band_data.get("licenseClass", [])
-                if license_class not in licenses:
-                    continue
-            
-            # Check frequency range
-            if min_freq and band_data["maxFrequency"] < min_freq:
-                continue
-            if max_freq and band_data["minFrequency"] > max_freq:
-                continue
+        Args:
+            query: Free text, e.g. "satellite" or "wefax halifax"
+            fuzzy: Also match words with similar spelling
+            limit: Most results to return
             
-            results.append(BandSegment(**band_data))
+        Returns:
+            TextSearchResult with the best matches first
+        """
+        key = self._search_key("text", query, fuzzy, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
         
-        # Sort by frequency
-        results.sort(key=lambda x: x.minFrequency)
+        count, hits = self._text_hits(query, fuzzy, limit)
+        result = TextSearchResult(
+            query={"q": query, "fuzzy": fuzzy, "limit": limit},
+            count=count,
+            results=[
+                TextSearchHit(score=score, band=self.segment(idx))
+                for idx, score in hits
+            ],
+        )
+        self._search_cache.put(key, result)
+        return result.model_copy(deep=True)
+    
+    def search_text_json(
+        self, query: str, fuzzy: bool = False, limit: int = 25
+    ) -> bytes:
+        """Return ``search_text(...)`` already encoded as JSON."""
+        key = self._search_key("text-json", query, fuzzy, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
         
+        count, hits = self._text_hits(query, fuzzy, limit)
+        results = b",".join(
+            b'{"score":%s,"band":%s}' % (_dumps(score), self._segment_json[idx])
+            for idx, score in hits
+        )
+        payload = b'{"query":%s,"count":%d,"results":[%s]}' % (
+            _dumps({"q": query, "fuzzy": fuzzy, "limit": limit}),
+            count,
+            results,
+        )
+        self._search_cache.put(key, payload)
+        return payload
+    
+    def _search_key(self, kind: str, *params: Any) -> tuple:
+        """Build the search cache key for the currently loaded plan.
+
+        Including the plan hash means entries computed against older data
+        can never be served, even if they outlive a reload.
+        """
+        return (self.plan_hash, kind) + params
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the search result cache."""
+        return {"planHash": self.plan_hash, "search": self._search_cache.stats()}
+    
+    @staticmethod
+    def _search_query(
+        mode: Optional[str],
+        band_name: Optional[str],
+        license_class: Optional[str],
+        typical_use: Optional[str],
+        min_freq: Optional[int],
+        max_freq: Optional[int],
+    ) -> Dict[str, Any]:
+        """Echo the search parameters that were actually supplied."""
         query = {
             "mode": mode,
             "band_name": band_name,
@@ -228,12 +903,43 @@ class BandPlanAdapter:
             "min_freq": min_freq,
             "max_freq": max_freq,
         }
+        return {k: v for k, v in query.items() if v is not None}
+    
+    def _search_indices(
+        self,
+        mode: Optional[str],
+        band_name: Optional[str],
+        license_class: Optional[str],
+        typical_use: Optional[str],
+        min_freq: Optional[int],
+        max_freq: Optional[int],
+    ) -> List[int]:
+        """Return indices of matching segments ordered by frequency."""
+        bitmaps = self._bitmaps
+        mask = bitmaps.all
         
-        return BandSearchResult(
-            query={k: v for k, v in query.items() if v is not None},
-            count=len(results),
-            bands=results,
-        )
+        # Attribute filters: one bitmap AND each; unknown values match nothing
+        if mode:
+            mask &= bitmaps.get("mode", mode)
+        if band_name:
+            mask &= bitmaps.get("bandName", band_name)
+        if typical_use:
+            mask &= bitmaps.get("typicalUses", typical_use)
+        if license_class:
+            mask &= bitmaps.get("licenseClass", license_class)
+        
+        # Frequency filters: positions are in start order, so an upper bound
+        # is a prefix of bits; a lower bound comes from the interval index
+        if mask and max_freq:
+            mask &= (1 << bisect_right(self._starts, max_freq)) - 1
+        if mask and min_freq:
+            mask &= BitmapIndex.from_positions(
+                self._interval_index.overlapping(min_freq, max_freq or float("inf"))
+            )
+        
+        if mask == bitmaps.all:
+            return list(self._by_start)
+        return [self._by_start[pos] for pos in BitmapIndex.positions(mask)]
     
     def get_bands_in_range(self, min_freq: int, max_freq: int) -> List[BandSegment]:
         """Get all band segments within a frequency range.
@@ -245,18 +951,339 @@ class BandPlanAdapter:
         Returns:
             List of BandSegment objects that overlap with the range
         """
-        results = []
+        return [
+            self.segment(idx).model_copy(deep=True)
+            for idx in self._overlapping(min_freq, max_freq)
+        ]
+    
+    def get_bands_in_range_json(self, min_freq: int, max_freq: int) -> Tuple[int, bytes]:
+        """Return the count and JSON array of ``get_bands_in_range(...)``."""
+        matches = self._overlapping(min_freq, max_freq)
+        return len(matches), self._encode_segments(matches)
+    
+    def channel_segments(
+        self,
+        band_name: Optional[str] = None,
+        segment: Optional[int] = None,
+        min_freq: Optional[int] = None,
+        max_freq: Optional[int] = None,
+        mode: Optional[str] = None,
+    ) -> List[int]:
+        """Select the segments whose channels to enumerate.
+        
+        Args:
+            band_name: Segments of this amateur band
+            segment: The narrowest segment containing this frequency (Hz)
+            min_freq: Segments overlapping a range from here (Hz)
+            max_freq: Segments overlapping a range up to here (Hz)
+            mode: Only segments with this mode
+            
+        Returns:
+            Indices of the selected segments, ordered by ``minFrequency``
+        """
+        if segment is not None:
+            slice_idx = self._partition.slice_of(segment)
+            if slice_idx < 0 or not self._group_cover[self._slice_group[slice_idx]]:
+                return []
+            cover = self._group_cover[self._slice_group[slice_idx]]
+            narrowest = min(
+                cover,
+                key=lambda i: (self.bands[i].maxFrequency - self.bands[i].minFrequency, i),
+            )
+            indices = [narrowest]
+        else:
+            indices = self._overlapping(
+                min_freq or 0, max_freq if max_freq is not None else float("inf")
+            )
+        return [
+            idx
+            for idx in indices
+            if (not band_name or self.bands[idx].bandName == band_name)
+            and (not mode or self.bands[idx].mode == mode)
+        ]
+    
+    def iter_channels(
+        self,
+        indices: Iterable[int],
+        min_freq: int = 0,
+        max_freq: Optional[int] = None,
+        step: Optional[int] = None,
+    ) -> Iterator[Tuple[int, int]]:
+        """Lazily enumerate channel frequencies of the given segments.
         
-        for band_data in self.bands:
-            # Check if band overlaps with the range
-            if (
-                band_data["minFrequency"] <= max_freq
-                and band_data["maxFrequency"] >= min_freq
-            ):
-                results.append(BandSegment(**band_data))
+        A segment's channels are ``minFrequency + k * step`` within its edges
+        and ``[min_freq, max_freq]``, using the segment's own step unless
+        ``step`` overrides it.  Each segment is a ``range`` and they are
+        merged with a heap, so memory stays constant however many channels
+        there are, and starting past ``min_freq`` costs nothing extra.  A
+        frequency produced by several segments is yielded once, attributed
+        to the narrowest of them.
         
-        results.sort(key=lambda x: x.minFrequency)
-        return results
+        Yields:
+            ``(frequency, segment index)`` in ascending frequency
+        """
+        def channels(idx: int) -> Iterator[Tuple[int, int, int]]:
+            band = self.bands[idx]
+            low, high = band.minFrequency, band.maxFrequency
+            spacing = step or band.step
+            if not spacing or spacing <= 0:
+                return
+            first = max(low, min_freq)
+            first = low + -(-(first - low) // spacing) * spacing
+            last = high if max_freq is None else min(high, max_freq)
+            width = high - low
+            for freq in range(first, last + 1, spacing):
+                yield freq, width, idx
+        
+        previous = None
+        for freq, _, idx in heapq.merge(*(channels(idx) for idx in indices)):
+            if freq != previous:
+                previous = freq
+                yield freq, idx
+    
+    def iter_channels_json(
+        self,
+        query: Dict[str, Any],
+        indices: Iterable[int],
+        min_freq: int = 0,
+        max_freq: Optional[int] = None,
+        step: Optional[int] = None,
+        limit: int = 1000,
+    ) -> Iterator[bytes]:
+        """Stream one page of ``iter_channels`` as JSON, in chunks.
+        
+        The page ends with ``nextCursor``: the last frequency returned when
+        more channels follow, to be passed back as the next page's start
+        (exclusive), or null on the last page.
+        """
+        suffixes: Dict[int, bytes] = {}
+        
+        def suffix(idx: int) -> bytes:
+            encoded = suffixes.get(idx)
+            if encoded is None:
+                segment = self.bands[idx]
+                encoded = suffixes[idx] = (
+                    b',"step":%s,"mode":%s,"bandName":%s,"description":%s}'
+                    % (
+                        _dumps(step or segment.step),
+                        _dumps(segment.mode),
+                        _dumps(segment.bandName),
+                        _dumps(segment.description),
+                    )
+                )
+            return encoded
+        
+        yield b'{"query":%s,"channels":[' % _dumps(query)
+        count = 0
+        last = None
+        more = False
+        chunk: List[bytes] = []
+        for freq, idx in self.iter_channels(indices, min_freq, max_freq, step):
+            if count == limit:
+                more = True
+                break
+            chunk.append(
+                b'{"frequency":%d,"frequencyMHz":%s%s'
+                % (freq, repr(freq / 1_000_000).encode(), suffix(idx))
+            )
+            count += 1
+            last = freq
+            if len(chunk) == 512:
+                yield (b"," if count > 512 else b"") + b",".join(chunk)
+                chunk = []
+        if chunk:
+            yield (b"," if count > len(chunk) else b"") + b",".join(chunk)
+        yield b'],"count":%d,"nextCursor":%s}' % (
+            count,
+            _dumps(str(last) if more else None),
+        )
+    
+    @staticmethod
+    def _spans(runs: List[Tuple[int, int, int]]) -> List[SpectrumSpan]:
+        return [
+            SpectrumSpan(
+                start=start,
+                end=end,
+                startMHz=start / 1_000_000,
+                endMHz=end / 1_000_000,
+                widthHz=end - start,
+                depth=depth,
+            )
+            for start, end, depth in runs
+        ]
+    
+    def get_range_coverage(self, min_freq: int, max_freq: int) -> RangeCoverage:
+        """Analyze allocation, gaps and overlaps in ``[min_freq, max_freq)``.
+        
+        Args:
+            min_freq: Range start in Hz
+            max_freq: Range end in Hz (exclusive)
+            
+        Returns:
+            RangeCoverage answered from the coverage built at load time
+        """
+        width = max(max_freq - min_freq, 0)
+        allocated = self._coverage.allocated_width(min_freq, max_freq)
+        return RangeCoverage(
+            start=min_freq,
+            end=max_freq,
+            startMHz=min_freq / 1_000_000,
+            endMHz=max_freq / 1_000_000,
+            allocatedHz=allocated,
+            unallocatedHz=width - allocated,
+            allocatedFraction=allocated / width if width else 0.0,
+            maxDepth=self._coverage.max_depth(min_freq, max_freq),
+            gaps=self._spans(self._coverage.gaps_in(min_freq, max_freq)),
+            overlaps=self._spans(self._coverage.overlaps_in(min_freq, max_freq)),
+        )
+    
+    def get_band_coverage(self, band_name: Optional[str] = None) -> List[BandCoverage]:
+        """Get per-mode coverage of the amateur bands, in frequency order.
+        
+        Args:
+            band_name: Only report this band
+            
+        Returns:
+            List of BandCoverage records; empty if ``band_name`` is unknown
+        """
+        if band_name is None:
+            return [c.model_copy(deep=True) for c in self._band_coverage.values()]
+        coverage = self._band_coverage.get(band_name)
+        return [coverage.model_copy(deep=True)] if coverage else []
+    
+    @property
+    def license_classes(self) -> List[str]:
+        """License classes with privileges in the plan, highest first."""
+        return list(self._privileges.classes)
+    
+    def _privilege_record(
+        self, license_class: str, frequency: int, mode: Optional[str]
+    ) -> Dict[str, Any]:
+        """Answer one privilege check for a known (canonical) class."""
+        if mode is not None:
+            mode = self._mode_names.get(mode.lower(), mode)
+        return {
+            "licenseClass": license_class,
+            "frequency": frequency,
+            "frequencyMHz": frequency / 1_000_000,
+            "mode": mode,
+            "allowed": self._privileges.allows(license_class, frequency, mode),
+            "allowedModes": self._privileges.modes_at(license_class, frequency),
+        }
+    
+    def check_privilege(
+        self, license_class: str, frequency: int, mode: Optional[str] = None
+    ) -> Optional[PrivilegeCheck]:
+        """Check whether a license class may transmit at a frequency.
+        
+        A frequency is allowed exactly when it lies in one of the class's
+        ``get_privilege_map`` spans, which exclude their upper edge.
+        
+        Args:
+            license_class: License class, any case (e.g., "general")
+            frequency: Frequency in Hz
+            mode: Mode to check, any case; any mode if omitted
+            
+        Returns:
+            PrivilegeCheck, or None if the plan grants the class nothing
+        """
+        canonical = self._class_names.get(license_class.lower())
+        if canonical is None:
+            return None
+        return PrivilegeCheck(**self._privilege_record(canonical, frequency, mode))
+    
+    def check_privileges_json(self, checks: List[PrivilegeQuery]) -> bytes:
+        """Answer many privilege checks, encoded as JSON.
+
+        The payload lists one record per check in input order, ``null``
+        where the frequency cannot be parsed or the class is unknown, and
+        the positions of those checks under ``invalid``.
+        """
+        frequencies = self.parse_frequencies(check.frequency for check in checks)
+        records: List[Optional[Dict[str, Any]]] = []
+        invalid: List[int] = []
+        for i, (check, frequency) in enumerate(zip(checks, frequencies)):
+            canonical = self._class_names.get(check.licenseClass.lower())
+            if canonical is None or frequency is None:
+                records.append(None)
+                invalid.append(i)
+            else:
+                records.append(self._privilege_record(canonical, frequency, check.mode))
+        return _dumps({"count": len(records), "records": records, "invalid": invalid})
+    
+    def get_privilege_map(self, license_class: str) -> Optional[PrivilegeMap]:
+        """Get all the spectrum a license class may use, with its modes.
+        
+        Args:
+            license_class: License class, any case
+            
+        Returns:
+            PrivilegeMap, or None if the plan grants the class nothing
+        """
+        canonical = self._class_names.get(license_class.lower())
+        if canonical is None:
+            return None
+        key = self._search_key("privileges", canonical)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        
+        result = PrivilegeMap(
+            licenseClass=canonical,
+            totalHz=self._privileges.total_width(canonical),
+            modes=self._privileges.modes(canonical),
+            spans=[
+                PrivilegeSpan(
+                    start=start,
+                    end=end,
+                    startMHz=start / 1_000_000,
+                    endMHz=end / 1_000_000,
+                    widthHz=end - start,
+                    modes=list(modes),
+                )
+                for start, end, modes in self._privileges.privilege_map(canonical)
+            ],
+        )
+        self._search_cache.put(key, result)
+        return result.model_copy(deep=True)
+    
+    @property
+    def ready(self) -> bool:
+        """Whether a band plan is loaded and queryable."""
+        return self.data is not None and bool(self.bands)
+    
+    def status(self) -> Dict[str, Any]:
+        """Describe the loaded plan for readiness checks."""
+        return {
+            "ready": self.ready,
+            "segments": len(self.bands),
+            "version": self.data.get("version") if self.data else None,
+            "planHash": self.plan_hash,
+            "format": "binary" if self._image is not None else "json",
+            "loadDurationMs": self.load_duration_ms,
+        }
+    
+    def warmup(self) -> None:
+        """Exercise the common query paths so first requests find them built.
+
+        Seeds the search cache with the full plan and each amateur band.
+        Frequency lookups are answered from the pre-encoded slice JSON, so
+        the ``FrequencyInfo`` models are left to be built on first use.
+        """
+        self.search_bands_json()
+        for band_name in sorted({s.bandName for s in self.bands if s.bandName}):
+            self.search_bands_json(band_name=band_name)
+    
+    def heap_bytes(self) -> int:
+        """Heap bytes held by the snapshot, measured on first call.
+
+        Walks everything reachable from the snapshot (about 40 ms for the
+        US plan), so call it once warmed.  Strings interned across plans
+        are counted for each, and caches that fill later are not.
+        """
+        if self._heap_bytes is None:
+            self._heap_bytes = _heap_size(self)
+        return self._heap_bytes
     
     def get_summary(self) -> Optional[BandPlanSummary]:
         """Get summary information about the loaded band plan."""
@@ -270,12 +1297,12 @@ class BandPlanAdapter:
         max_freq = 0
         
         for band in self.bands:
-            if "bandName" in band:
-                band_names.add(band["bandName"])
-            if "mode" in band:
-                modes.add(band["mode"])
-            min_freq = min(min_freq, band["minFrequency"])
-            max_freq = max(max_freq, band["maxFrequency"])
+            if band.bandName is not None:
+                band_names.add(band.bandName)
+            if band.mode is not None:
+                modes.add(band.mode)
+            min_freq = min(min_freq, band.minFrequency)
+            max_freq = max(max_freq, band.maxFrequency)
         
         return BandPlanSummary(
             version=self.data.get("version", "unknown"),
@@ -288,13 +1315,252 @@ class BandPlanAdapter:
         )
 
 
+class BandPlanAdapter:
+    """Adapter for querying one region's amateur radio band plan.
+
+    Queries are answered by the current ``BandPlanSnapshot``.  Attribute
+    access is delegated to it, so each call binds to whichever snapshot is
+    current when it starts and runs to completion on that snapshot, even
+    if ``reload`` swaps in a new one meanwhile.  Readers never take a lock.
+    """
+    
+    def __init__(self, data_file: Optional[Path] = None, prefer_image: bool = True):
+        """Initialize the band plan adapter and load data.
+
+        Args:
+            data_file: Band plan JSON to load (defaults to the default region's plan)
+            prefer_image: Load the sibling ``.bin`` image when it matches
+                the JSON, instead of parsing the JSON
+        """
+        self.data_file = Path(data_file or DEFAULT_DATA_FILE)
+        self.prefer_image = prefer_image
+        self._reload_lock = threading.Lock()
+        self._snapshot = BandPlanSnapshot(self.data_file, prefer_image)
+    
+    def __getattr__(self, name: str) -> Any:
+        if name == "_snapshot":
+            raise AttributeError(name)
+        return getattr(self._snapshot, name)
+    
+    @property
+    def snapshot(self) -> BandPlanSnapshot:
+        """The snapshot currently answering queries."""
+        return self._snapshot
+    
+    def reload(self) -> bool:
+        """Rebuild the band plan from disk and swap it in atomically.
+
+        The new snapshot is loaded and warmed completely before a single
+        reference assignment publishes it.  If it fails to load, the
+        current snapshot stays in place.  Blocking; run it off the event
+        loop.
+
+        Returns:
+            True if a new snapshot was published
+        """
+        with self._reload_lock:
+            snapshot = BandPlanSnapshot(self.data_file, self.prefer_image)
+            if not snapshot.ready:
+                log_error("bandplan_reload_failed", path=str(self.data_file))
+                return False
+            snapshot.warmup()
+            snapshot.heap_bytes()
+            previous = self._snapshot
+            self._snapshot = snapshot
+        log_info(
+            "bandplan_reloaded",
+            previous_hash=previous.plan_hash,
+            plan_hash=snapshot.plan_hash,
+            segments=len(snapshot.bands),
+        )
+        return True
+
+
+class BandPlanRegistry:
+    """Band plans keyed by region, loaded on first use and evicted by LRU.
+
+    Each region's plan lives in ``data_dir`` as ``{region}_bandplan.json``
+    with its optional ``.bin`` image.  A plan is loaded and warmed the
+    first time its region is requested, then kept in an LRU of resident
+    plans bounded both by count and by their heap footprint, measured
+    when each is loaded.  The least recently used plan is dropped when either bound
+    is exceeded; the default region is never evicted.  Requests already
+    holding an evicted plan finish on it, and it is freed with the last
+    reference.
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        default_region: str = DEFAULT_REGION,
+        max_plans: int = MAX_RESIDENT_PLANS,
+        max_bytes: int = MAX_RESIDENT_BYTES,
+    ):
+        """Initialize an empty registry.
+
+        Args:
+            data_dir: Directory holding ``{region}_bandplan.json`` files
+            default_region: Region used when none is requested; pinned
+            max_plans: Most plans kept resident at once
+            max_bytes: Heap budget for resident plans
+        """
+        self.data_dir = Path(data_dir or DATA_DIR)
+        self.default_region = default_region
+        self.max_plans = max(1, max_plans)
+        self.max_bytes = max_bytes
+        # Resident plans, replaced as a whole under ``_lock`` so readers
+        # can look them up without taking it
+        self._plans: Dict[str, BandPlanAdapter] = {}
+        # Tick of each resident plan's last use, for LRU eviction
+        self._used: Dict[str, int] = {}
+        self._ticks = itertools.count()
+        # Regions being loaded, awaited by any other thread asking for them
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize_region(region: str) -> Optional[str]:
+        """Return the canonical region code, or None if it is malformed."""
+        code = region.strip().lower()
+        return code if _REGION.fullmatch(code) else None
+
+    def data_file(self, region: str) -> Path:
+        """Path of the band plan JSON for a normalized region code."""
+        return self.data_dir / f"{region}_bandplan.json"
+
+    def available(self) -> List[str]:
+        """Region codes with a band plan on disk, sorted."""
+        suffix = "_bandplan.json"
+        return sorted(
+            path.name[: -len(suffix)]
+            for path in self.data_dir.glob(f"*{suffix}")
+            if _REGION.fullmatch(path.name[: -len(suffix)])
+        )
+
+    def resident(self, region: Optional[str] = None) -> Optional[BandPlanAdapter]:
+        """Return the plan for ``region`` if it is already loaded.
+
+        Never blocks, so it is safe to call from the event loop while
+        another region loads.
+        """
+        code = self.normalize_region(region or self.default_region)
+        adapter = self._plans.get(code) if code else None
+        if adapter is not None:
+            self._used[code] = next(self._ticks)
+        return adapter
+
+    def get(self, region: Optional[str] = None) -> Optional[BandPlanAdapter]:
+        """Return the plan for ``region``, loading it if needed.
+
+        Loading blocks for as long as parsing and warming the plan takes;
+        async callers should check ``resident`` first and run this in a
+        worker thread on a miss.  Concurrent callers for the same region
+        wait for a single load, and other regions stay readable meanwhile.
+
+        Returns:
+            The region's adapter, or None if the region is malformed or
+            has no band plan on disk
+        """
+        code = self.normalize_region(region or self.default_region)
+        if code is None:
+            return None
+        adapter = self.resident(code)
+        if adapter is not None:
+            return adapter
+        with self._lock:
+            adapter = self.resident(code)
+            if adapter is not None:
+                return adapter
+            loading = self._loading.get(code)
+            if loading is None:
+                data_file = self.data_file(code)
+                if code != self.default_region and not data_file.exists():
+                    return None
+                loading = self._loading[code] = Future()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            return loading.result()
+
+        try:
+            adapter = BandPlanAdapter(data_file)
+            if adapter.ready:
+                adapter.warmup()
+            adapter.heap_bytes()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[code]
+            loading.set_exception(e)
+            raise
+        with self._lock:
+            plans = dict(self._plans)
+            plans[code] = adapter
+            self._used[code] = next(self._ticks)
+            self._evict(plans, keep=code)
+            self._plans = plans
+            del self._loading[code]
+            self.loads += 1
+        loading.set_result(adapter)
+        log_info(
+            "bandplan_region_loaded",
+            region=code,
+            segments=len(adapter.bands),
+            resident=len(plans),
+        )
+        return adapter
+
+    @staticmethod
+    def _footprint(adapter: BandPlanAdapter) -> int:
+        """Heap bytes held by a plan's current snapshot."""
+        return adapter.heap_bytes()
+
+    def _evict(self, plans: Dict[str, BandPlanAdapter], keep: str) -> None:
+        """Drop least recently used plans from ``plans`` until both bounds are met."""
+        total = sum(self._footprint(a) for a in plans.values())
+        for code in sorted(plans, key=lambda c: self._used.get(c, -1)):
+            if len(plans) <= self.max_plans and total <= self.max_bytes:
+                break
+            if code in (keep, self.default_region):
+                continue
+            adapter = plans.pop(code)
+            self._used.pop(code, None)
+            total -= self._footprint(adapter)
+            self.evictions += 1
+            log_info("bandplan_region_evicted", region=code, resident=len(plans))
+
+    def stats(self) -> Dict[str, Any]:
+        """Describe resident plans and the registry bounds."""
+        plans = sorted(self._plans.items(), key=lambda item: self._used.get(item[0], -1))
+        return {
+            "defaultRegion": self.default_region,
+            "resident": [code for code, _ in plans],
+            "residentBytes": sum(self._footprint(a) for _, a in plans),
+            "maxPlans": self.max_plans,
+            "maxBytes": self.max_bytes,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+
 # Create a singleton instance
-_bandplan_adapter = None
+_bandplan_registry = None
+
+
+def get_bandplan_registry() -> BandPlanRegistry:
+    """Get the singleton band plan registry instance."""
+    global _bandplan_registry
+    if _bandplan_registry is None:
+        _bandplan_registry = BandPlanRegistry()
+    return _bandplan_registry
+
 
+def get_bandplan_adapter(region: Optional[str] = None) -> Optional[BandPlanAdapter]:
+    """Get the band plan adapter for ``region`` (the default region if omitted).
 
-def get_bandplan_adapter() -> BandPlanAdapter:
-    """Get the singleton band plan adapter instance."""
-    global _bandplan_adapter
-    if _bandplan_adapter is None:
-        _bandplan_adapter = BandPlanAdapter()
-    return _bandplan_adapter
+    The default region always yields an adapter, loaded or not; other
+    regions yield None when no plan exists for them.
+    """
+    return get_bandplan_registry().get(region)
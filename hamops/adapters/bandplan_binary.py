@@ -0,0 +1,310 @@
+"""Compact binary form of a loaded band plan.
+
+``scripts/gen_bandplan.py`` writes this next to the JSON file so that cold
+starts can memory-map the plan instead of parsing ~30k lines of JSON and
+rebuilding every index.  The file holds packed segment columns, an
+interned string table, the pre-encoded segment JSON and the prebuilt
+interval, partition and bitmap indices.
+
+Layout (little-endian)::
+
+    header     4s magic, u16 format version, u16 section count, u32 reserved
+    directory  per section: 8s name, u64 offset, u64 length
+    sections   meta, strings, tuples, segments, segjson, order, cuts,
+               groups, bitmaps
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .bandplan_store import BlobTable, SegmentInterner, SegmentRecord
+
+MAGIC = b"HBPL"
+FORMAT_VERSION = 1
+NONE = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHI")
+_SECTION = struct.Struct("<8sQQ")
+_SEGMENT = struct.Struct("<qqddq8I")
+_BITMAP = struct.Struct("<III")
+_NO_STEP = -(2**63)
+
+_STRING_FIELDS = (
+    "minFrequencyDisplay",
+    "maxFrequencyDisplay",
+    "mode",
+    "description",
+    "bandName",
+    "color",
+)
+
+
+def _pack_array(typecode: str, values: Sequence[int]) -> bytes:
+    """Pack integers as a little-endian array."""
+    arr = array(typecode, values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _unpack_array(typecode: str, buf: memoryview) -> List[int]:
+    """Unpack a little-endian array into a list of ints."""
+    arr = array(typecode)
+    arr.frombytes(buf)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tolist()
+
+
+def _pack_blobs(blobs: Sequence[bytes]) -> bytes:
+    """Pack byte strings as ``count+1`` u32 offsets followed by the data."""
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return _pack_array("I", offsets) + b"".join(blobs)
+
+
+def _unpack_blobs(buf: memoryview, count: int) -> BlobTable:
+    """Wrap ``count`` blobs of a ``_pack_blobs`` section without copying."""
+    head = 4 * (count + 1)
+    return BlobTable(buf[head:], _unpack_array("I", buf[:head]))
+
+
+class _Interner:
+    """Assign stable ids to strings and string tuples while packing."""
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self.tuples: List[Tuple[int, ...]] = []
+        self._string_ids: Dict[str, int] = {}
+        self._tuple_ids: Dict[Tuple[int, ...], int] = {}
+
+    def string(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        sid = self._string_ids.get(value)
+        if sid is None:
+            sid = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+    def tuple(self, values: Optional[Sequence[str]]) -> int:
+        if values is None:
+            return NONE
+        key = tuple(self.string(v) for v in values)
+        tid = self._tuple_ids.get(key)
+        if tid is None:
+            tid = self._tuple_ids[key] = len(self.tuples)
+            self.tuples.append(key)
+        return tid
+
+
+def pack_bandplan(snapshot: Any) -> bytes:
+    """Serialize a loaded ``BandPlanSnapshot`` into the binary format."""
+    interner = _Interner()
+    records = []
+    for segment in snapshot.bands:
+        records.append(
+            _SEGMENT.pack(
+                segment.minFrequency,
+                segment.maxFrequency,
+                segment.minFrequencyMHz,
+                segment.maxFrequencyMHz,
+                _NO_STEP if segment.step is None else segment.step,
+                *(interner.string(getattr(segment, f)) for f in _STRING_FIELDS),
+                interner.tuple(segment.licenseClass),
+                interner.tuple(segment.typicalUses),
+            )
+        )
+
+    bitmap_entries = []
+    for field, values in snapshot._bitmaps.items():
+        for value, mask in values.items():
+            raw = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+            bitmap_entries.append(
+                _BITMAP.pack(interner.string(field), interner.string(value), len(raw))
+                + raw
+            )
+
+    meta = {
+        key: value
+        for key, value in (snapshot.data or {}).items()
+        if key not in ("bands", "indices")
+    }
+    meta["planHash"] = snapshot.plan_hash
+    meta["segmentCount"] = len(snapshot.bands)
+    meta["sliceCount"] = len(snapshot._partition.cuts)
+    meta["groupCount"] = len(snapshot._group_cover)
+    meta["indices"] = {
+        key: value
+        for key, value in snapshot.indices.items()
+        if key != "frequencyIndex"
+    }
+
+    groups = snapshot._group_cover
+    sections = [
+        (b"meta", json.dumps(meta, separators=(",", ":")).encode()),
+        (
+            b"strings",
+            _pack_array("I", [len(interner.strings)])
+            + _pack_blobs([s.encode() for s in interner.strings]),
+        ),
+        (
+            b"tuples",
+            _pack_array("I", [len(interner.tuples)])
+            + _pack_blobs([_pack_array("I", t) for t in interner.tuples]),
+        ),
+        (b"segments", b"".join(records)),
+        (b"segjson", _pack_blobs([bytes(b) for b in snapshot._segment_json])),
+        (
+            b"order",
+            _pack_array("I", snapshot._by_start)
+            + _pack_array("q", snapshot._interval_index.max_ends),
+        ),
+        (
+            b"cuts",
+            _pack_array("q", snapshot._partition.cuts)
+            + _pack_array("I", snapshot._slice_group),
+        ),
+        (
+            b"groups",
+            _pack_blobs([_pack_array("I", cover) for cover in groups])
+            + _pack_blobs([bytes(tail) for tail in snapshot._group_json]),
+        ),
+        (
+            b"bitmaps",
+            _pack_array("I", [len(bitmap_entries)]) + b"".join(bitmap_entries),
+        ),
+    ]
+
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    directory = []
+    for name, body in sections:
+        directory.append(_SECTION.pack(name, offset, len(body)))
+        offset += len(body)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), 0)
+    return header + b"".join(directory) + b"".join(body for _, body in sections)
+
+
+def read_image_meta(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the metadata of an image without mapping or decoding the rest.
+
+    Returns:
+        The ``meta`` section, or None if ``path`` is missing or is not a
+        band plan image of this format version
+    """
+    try:
+        with open(path, "rb") as f:
+            magic, version, count, _ = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != FORMAT_VERSION:
+                return None
+            for _ in range(count):
+                name, offset, length = _SECTION.unpack(f.read(_SECTION.size))
+                if name.rstrip(b"\0") == b"meta":
+                    f.seek(offset)
+                    return json.loads(f.read(length))
+    except (OSError, struct.error, ValueError):
+        return None
+    return None
+
+
+class BandPlanImage:
+    """A band plan memory-mapped from the binary format.
+
+    Segment and slice JSON are exposed as ``memoryview`` slices of the
+    mapping, so they are paged in on demand and shared between worker
+    processes rather than copied onto each heap.
+    """
+
+    def __init__(self, path: Path):
+        """Map ``path`` and decode its sections.
+
+        Raises:
+            ValueError: If the file is not a band plan image of this version
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mmap)
+        magic, version, count, _ = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported band plan image: {magic!r} v{version}")
+        sections: Dict[bytes, memoryview] = {}
+        for i in range(count):
+            name, offset, length = _SECTION.unpack_from(
+                buf, _HEADER.size + i * _SECTION.size
+            )
+            sections[name.rstrip(b"\0")] = buf[offset:offset + length]
+
+        self.meta: Dict[str, Any] = json.loads(bytes(sections[b"meta"]))
+        n = self.meta["segmentCount"]
+        slices = self.meta["sliceCount"]
+        groups = self.meta["groupCount"]
+
+        strings_buf = sections[b"strings"]
+        string_count = _unpack_array("I", strings_buf[:4])[0]
+        interner = SegmentInterner()
+        strings = [
+            interner.string(str(blob, "utf-8"))
+            for blob in _unpack_blobs(strings_buf[4:], string_count)
+        ]
+        tuples_buf = sections[b"tuples"]
+        tuple_count = _unpack_array("I", tuples_buf[:4])[0]
+        tuples = [
+            interner.strings(strings[sid] for sid in _unpack_array("I", blob))
+            for blob in _unpack_blobs(tuples_buf[4:], tuple_count)
+        ]
+
+        self.bands: List[SegmentRecord] = []
+        for record in _SEGMENT.iter_unpack(sections[b"segments"]):
+            fields = {
+                field: strings[sid]
+                for field, sid in zip(_STRING_FIELDS, record[5:11])
+                if sid != NONE
+            }
+            self.bands.append(SegmentRecord(
+                minFrequency=record[0],
+                maxFrequency=record[1],
+                minFrequencyMHz=record[2],
+                maxFrequencyMHz=record[3],
+                step=None if record[4] == _NO_STEP else record[4],
+                licenseClass=None if record[11] == NONE else tuples[record[11]],
+                typicalUses=None if record[12] == NONE else tuples[record[12]],
+                **fields,
+            ))
+
+        self.segment_json = _unpack_blobs(sections[b"segjson"], n)
+
+        order = sections[b"order"]
+        self.by_start = _unpack_array("I", order[:4 * n])
+        self.max_ends = _unpack_array("q", order[4 * n:])
+
+        cuts = sections[b"cuts"]
+        self.cuts = _unpack_array("q", cuts[:8 * slices])
+        self.slice_group = _unpack_array("I", cuts[8 * slices:])
+
+        groups_buf = sections[b"groups"]
+        cover_head = 4 * (groups + 1)
+        cover_offsets = _unpack_array("I", groups_buf[:cover_head])
+        cover_size = cover_head + cover_offsets[-1]
+        self.group_cover = [
+            tuple(_unpack_array("I", blob))
+            for blob in _unpack_blobs(groups_buf[:cover_size], groups)
+        ]
+        self.group_json = _unpack_blobs(groups_buf[cover_size:], groups)
+
+        self.bitmaps: Dict[str, Dict[str, int]] = {}
+        bitmaps = sections[b"bitmaps"]
+        pos = 4
+        for _ in range(_unpack_array("I", bitmaps[:4])[0]):
+            field, value, length = _BITMAP.unpack_from(bitmaps, pos)
+            pos += _BITMAP.size
+            mask = int.from_bytes(bitmaps[pos:pos + length], "little")
+            pos += length
+            self.bitmaps.setdefault(strings[field], {})[strings[value]] = mask
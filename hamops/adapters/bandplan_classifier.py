@@ -0,0 +1,252 @@
+"""Rule-based classification of band plan segments.
+
+Assigns the amateur band name, license classes and typical uses that
+``scripts/gen_bandplan.py`` adds to every segment.  The rules are compiled
+once: band edges into sorted arrays searched with a bisect, and every
+description keyword into one Aho-Corasick automaton, so a segment is
+classified with one pass over its description instead of a substring test
+per keyword.  The same classifier can enrich third-party plans at runtime.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# Amateur radio bands with their typical ranges (in Hz)
+AMATEUR_BANDS: Dict[str, Tuple[int, int]] = {
+    "2200m": (135_700, 137_800),
+    "630m": (472_000, 479_000),
+    "160m": (1_800_000, 2_000_000),
+    "80m": (3_500_000, 4_000_000),
+    "60m": (5_330_500, 5_406_400),
+    "40m": (7_000_000, 7_300_000),
+    "30m": (10_100_000, 10_150_000),
+    "20m": (14_000_000, 14_350_000),
+    "17m": (18_068_000, 18_168_000),
+    "15m": (21_000_000, 21_450_000),
+    "12m": (24_890_000, 24_990_000),
+    "10m": (28_000_000, 29_700_000),
+    "6m": (50_000_000, 54_000_000),
+    "2m": (144_000_000, 148_000_000),
+    "1.25m": (219_000_000, 225_000_000),
+    "70cm": (420_000_000, 450_000_000),
+    "33cm": (902_000_000, 928_000_000),
+    "23cm": (1_240_000_000, 1_300_000_000),
+    "13cm": (2_300_000_000, 2_450_000_000),
+}
+
+# License classes by description keyword, first match wins.  Above this
+# frequency (VHF/UHF) the Technician rule applies unless an earlier one does.
+LICENSE_RULES: Sequence[Tuple[Tuple[str, ...], List[str]]] = (
+    (("extra",), ["Extra"]),
+    (("advanced",), ["Extra", "Advanced"]),
+    (("general",), ["Extra", "Advanced", "General"]),
+    (("technician",), ["Extra", "Advanced", "General", "Technician"]),
+    (("novice",), ["Extra", "Advanced", "General", "Technician", "Novice"]),
+)
+ALL_CLASSES_ABOVE_HZ = 50_000_000
+
+# Typical uses by description keyword, in output order
+USE_RULES: Sequence[Tuple[str, Tuple[str, ...]]] = (
+    ("CW", ("cw", "morse")),
+    ("Phone", ("phone", "ssb", "voice")),
+    ("Digital", ("digital", "rtty", "psk")),
+    ("Data", ("data", "packet")),
+    ("FM", ("fm", "repeater")),
+    ("EME", ("eme", "moonbounce")),
+    ("Satellite", ("satellite",)),
+    ("Beacon", ("beacon",)),
+    ("Emergency", ("emergency", "ares")),
+)
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton reporting which keywords occur in a text.
+
+    The keyword trie is compiled with failure links and merged outputs, so
+    ``find`` reports every keyword occurring anywhere in the text, as a
+    substring test per keyword would, in a single left-to-right scan.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile the automaton for ``keywords``."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[str]] = [frozenset()]
+        pending: List[set] = [set()]
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = self._goto[state][char] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    pending.append(set())
+                state = nxt
+            pending[state].add(keyword)
+
+        # Breadth-first, so a state's failure target is final before its children
+        queue = deque(self._goto[0].values())
+        order = []
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for char, child in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                queue.append(child)
+        self._out = [frozenset(keywords) for keywords in pending]
+        # Fold the failure links into a full transition table, so the scan
+        # takes exactly one dict lookup per character
+        self._delta: List[Dict[str, int]] = [dict(self._goto[0])] + [{}] * len(order)
+        for state in order:
+            self._out[state] = self._out[state] | self._out[self._fail[state]]
+            self._delta[state] = {**self._delta[self._fail[state]], **self._goto[state]}
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Return the set of keywords that occur in ``text``."""
+        delta, out = self._delta, self._out
+        state = 0
+        found: Optional[set] = None
+        for char in text:
+            state = delta[state].get(char, 0)
+            if out[state]:
+                if found is None:
+                    found = set(out[state])
+                else:
+                    found.update(out[state])
+        return frozenset(found) if found else frozenset()
+
+
+class BandClassifier:
+    """Compiled band plan rules: band edges, license classes, typical uses."""
+
+    def __init__(
+        self,
+        bands: Dict[str, Tuple[int, int]] = AMATEUR_BANDS,
+        license_rules: Sequence[Tuple[Tuple[str, ...], List[str]]] = LICENSE_RULES,
+        use_rules: Sequence[Tuple[str, Tuple[str, ...]]] = USE_RULES,
+        all_classes_above_hz: int = ALL_CLASSES_ABOVE_HZ,
+    ):
+        """Compile the given rules.
+
+        Band ranges must not overlap; they are searched by their lower edge.
+        """
+        edges = sorted((low, high, name) for name, (low, high) in bands.items())
+        self._lows = [low for low, _, _ in edges]
+        self._highs = [high for _, high, _ in edges]
+        self._names = [name for _, _, name in edges]
+        self._license_rules = license_rules
+        self._use_rules = use_rules
+        self._all_classes_above_hz = all_classes_above_hz
+        self._matcher = KeywordMatcher(
+            [kw for keywords, _ in license_rules for kw in keywords]
+            + [kw for _, keywords in use_rules for kw in keywords]
+        )
+        # The rule that grants every class above ``all_classes_above_hz``
+        self._all_classes_rule = next(
+            (
+                i
+                for i, (rule_keywords, _) in enumerate(license_rules)
+                if "technician" in rule_keywords
+            ),
+            None,
+        )
+        # Descriptions repeat a lot within and across plans
+        self._rules_for = lru_cache(maxsize=4096)(self._match_rules)
+
+    def band_name(self, frequency: float) -> Optional[str]:
+        """Return the amateur band containing ``frequency`` (Hz), if any."""
+        i = bisect_right(self._lows, frequency) - 1
+        if i >= 0 and frequency <= self._highs[i]:
+            return self._names[i]
+        return None
+
+    def _match_rules(self, description: str) -> Tuple[Optional[int], Tuple[str, ...]]:
+        """Return the first matching license rule and the matching uses."""
+        keywords = self._matcher.find(description)
+        license_rule = next(
+            (
+                i
+                for i, (rule_keywords, _) in enumerate(self._license_rules)
+                if not keywords.isdisjoint(rule_keywords)
+            ),
+            None,
+        )
+        uses = tuple(
+            use
+            for use, rule_keywords in self._use_rules
+            if not keywords.isdisjoint(rule_keywords)
+        )
+        return license_rule, uses
+
+    def classify(
+        self, description: str, frequency: float
+    ) -> Tuple[Optional[List[str]], List[str]]:
+        """Return the license classes and typical uses for a description.
+
+        Args:
+            description: Segment description, any case
+            frequency: Segment center frequency in Hz
+
+        Returns:
+            License classes (None if no rule applies) and typical uses
+        """
+        license_rule, uses = self._rules_for(description.lower())
+        if (
+            frequency > self._all_classes_above_hz
+            and self._all_classes_rule is not None
+            and (license_rule is None or license_rule > self._all_classes_rule)
+        ):
+            # VHF/UHF typically available to all
+            license_rule = self._all_classes_rule
+        classes = None
+        if license_rule is not None:
+            classes = list(self._license_rules[license_rule][1])
+        return classes, list(uses)
+
+    def enrich(self, band: Dict[str, Any]) -> Dict[str, Any]:
+        """Add band name, MHz edges, license classes and uses to ``band`` in place."""
+        min_freq = band["minFrequency"]
+        max_freq = band["maxFrequency"]
+        center_freq = (min_freq + max_freq) / 2
+
+        band_name = self.band_name(center_freq)
+        if band_name is not None:
+            band["bandName"] = band_name
+
+        # Add frequency display in MHz for readability
+        band["minFrequencyMHz"] = round(min_freq / 1_000_000, 6)
+        band["maxFrequencyMHz"] = round(max_freq / 1_000_000, 6)
+
+        if "description" in band:
+            classes, uses = self.classify(band["description"], center_freq)
+            if classes is not None:
+                band["licenseClass"] = classes
+            if uses:
+                band["typicalUses"] = uses
+        return band
+
+    def enrich_all(self, bands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich every band in place and return the list."""
+        for band in bands:
+            self.enrich(band)
+        return bands
+
+
+_classifier: Optional[BandClassifier] = None
+
+
+def get_band_classifier() -> BandClassifier:
+    """Get the singleton classifier compiled from the default rules."""
+    global _classifier
+    if _classifier is None:
+        _classifier = BandClassifier()
+    return _classifier
@@ -0,0 +1,549 @@
+"""Index structures used by the band plan adapter.
+
+The band plan is static once loaded, so everything here is built a single
+time from the list of segments and then only queried.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Stands in for the open ends of the spans outside every interval
+UNBOUNDED = 1 << 63
+
+
+class IntervalIndex:
+    """Augmented interval tree over closed ``[start, end]`` intervals.
+
+    The tree is stored implicitly: intervals are sorted by start and the
+    node for any slice ``[lo, hi)`` is its midpoint.  Each node records the
+    largest end in its subtree, which lets an overlap query skip every
+    subtree that ends before the query starts and every right subtree that
+    starts after it ends.  Queries therefore cost ``O(log n + k)`` and
+    return positions in start order.
+    """
+
+    def __init__(
+        self,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        max_ends: Optional[Sequence[int]] = None,
+    ):
+        """Build the index from parallel start/end arrays sorted by start.
+
+        ``max_ends`` may carry the subtree maxima from a previous build of
+        the same intervals, in which case the tree is not rebuilt.
+        """
+        self._starts = list(starts)
+        self._ends = list(ends)
+        if max_ends is not None:
+            self._max_end = list(max_ends)
+        else:
+            self._max_end = list(self._ends)
+            if self._starts:
+                self._build(0, len(self._starts))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def max_ends(self) -> List[int]:
+        """Largest interval end within each node's subtree, by position."""
+        return self._max_end
+
+    def _build(self, lo: int, hi: int) -> int:
+        """Fill ``_max_end`` for the subtree rooted at the midpoint of ``[lo, hi)``."""
+        mid = (lo + hi) // 2
+        best = self._ends[mid]
+        if lo < mid:
+            best = max(best, self._build(lo, mid))
+        if mid + 1 < hi:
+            best = max(best, self._build(mid + 1, hi))
+        self._max_end[mid] = best
+        return best
+
+    def overlapping(self, low: int, high: int) -> List[int]:
+        """Return positions of intervals with ``start <= high`` and ``end >= low``."""
+        out: List[int] = []
+        if self._starts:
+            self._collect(0, len(self._starts), low, high, out)
+        return out
+
+    def _collect(self, lo: int, hi: int, low: int, high: int, out: List[int]) -> None:
+        mid = (lo + hi) // 2
+        if self._max_end[mid] < low:
+            return
+        if lo < mid:
+            self._collect(lo, mid, low, high, out)
+        if self._starts[mid] > high:
+            return
+        if self._ends[mid] >= low:
+            out.append(mid)
+        if mid + 1 < hi:
+            self._collect(mid + 1, hi, low, high, out)
+
+
+class PartitionIndex:
+    """Elementary partition of the spectrum cut at every interval boundary.
+
+    Every start and every ``end + 1`` becomes a cut point, so within each
+    resulting slice ``[cuts[j], cuts[j + 1])`` the set of covering intervals
+    is constant.  The covers are computed with one sweep over the sorted
+    cut points, after which a point lookup is a single bisect.
+    """
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]):
+        """Build the partition from parallel start/end arrays."""
+        opening: Dict[int, List[int]] = {}
+        closing: Dict[int, List[int]] = {}
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            if start > end:
+                continue
+            opening.setdefault(start, []).append(i)
+            closing.setdefault(end + 1, []).append(i)
+
+        self.cuts: List[int] = sorted(opening.keys() | closing.keys())
+        self.covers: List[Tuple[int, ...]] = []
+        active: Set[int] = set()
+        for cut in self.cuts:
+            active.difference_update(closing.get(cut, ()))
+            active.update(opening.get(cut, ()))
+            self.covers.append(tuple(sorted(active)))
+
+    @classmethod
+    def from_parts(
+        cls, cuts: List[int], covers: List[Tuple[int, ...]]
+    ) -> "PartitionIndex":
+        """Rebuild a partition from previously computed cuts and covers."""
+        index = cls.__new__(cls)
+        index.cuts = cuts
+        index.covers = covers
+        return index
+
+    def __len__(self) -> int:
+        return len(self.cuts)
+
+    def slice_of(self, point: int) -> int:
+        """Return the slice containing ``point``, or ``-1`` before the first cut."""
+        return bisect_right(self.cuts, point) - 1
+
+    def slices_of_sorted(self, points: Sequence[int]) -> List[int]:
+        """Return the slice of every point in an ascending sequence.
+
+        Walks the points and the cut list together in a single merge pass.
+        Each step advances the cut cursor with a bisect bounded below by the
+        previous position, so sparse batches skip ahead instead of visiting
+        every cut and dense batches mostly stay on the current slice.
+        """
+        cuts = self.cuts
+        j = -1
+        out: List[int] = []
+        for point in points:
+            lo = j if j > 0 else 0
+            if j + 1 < len(cuts) and cuts[j + 1] <= point:
+                j = bisect_right(cuts, point, lo) - 1
+            out.append(j)
+        return out
+
+
+class BitmapIndex:
+    """Integer bitmaps of interval positions keyed by attribute value.
+
+    Bit ``p`` of a bitmap is set when the interval at position ``p`` carries
+    the value, so multi-attribute filters reduce to ``&`` on Python ints.
+    Positions follow the start order used by ``IntervalIndex``, which means
+    walking set bits from the lowest yields results in frequency order.
+    """
+
+    def __init__(self, size: int):
+        """Create an empty index over ``size`` positions."""
+        self.size = size
+        self.all = (1 << size) - 1
+        self._maps: Dict[str, Dict[str, int]] = {}
+
+    def add(self, field: str, value: str, position: int) -> None:
+        """Mark ``position`` as carrying ``value`` for ``field``."""
+        values = self._maps.setdefault(field, {})
+        values[value] = values.get(value, 0) | (1 << position)
+
+    @classmethod
+    def from_maps(cls, size: int, maps: Dict[str, Dict[str, int]]) -> "BitmapIndex":
+        """Rebuild an index from previously computed bitmaps."""
+        index = cls(size)
+        index._maps = maps
+        return index
+
+    def items(self) -> Iterable[Tuple[str, Dict[str, int]]]:
+        """Iterate ``(field, {value: bitmap})`` pairs."""
+        return self._maps.items()
+
+    def get(self, field: str, value: str) -> int:
+        """Return the bitmap for ``value``; unknown values match nothing."""
+        return self._maps.get(field, {}).get(value, 0)
+
+    @staticmethod
+    def from_positions(positions: Iterable[int]) -> int:
+        """Build a bitmap with the given positions set."""
+        mask = 0
+        for position in positions:
+            mask |= 1 << position
+        return mask
+
+    @staticmethod
+    def positions(mask: int) -> List[int]:
+        """Return the set bit positions of ``mask`` in ascending order."""
+        bits = format(mask, "b")[::-1]
+        out: List[int] = []
+        pos = bits.find("1")
+        while pos >= 0:
+            out.append(pos)
+            pos = bits.find("1", pos + 1)
+        return out
+
+
+class CoverageIndex:
+    """Sweep-line coverage of half-open ``[start, end)`` intervals.
+
+    One pass over the sorted endpoints splits the line into spans of
+    constant cover, recording for each span the covering intervals and
+    whether any ``counted`` interval is among them.  Prefix sums of
+    counted width and the runs of uncounted spans (gaps) and multiply
+    covered spans (overlaps) are derived from that once, so range
+    questions reduce to a bisect plus a walk over the runs they touch.
+    Everything below the first and above the last endpoint is a gap.
+    """
+
+    def __init__(
+        self,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        counted: Optional[Sequence[bool]] = None,
+    ):
+        """Build the coverage from parallel start/end arrays.
+
+        ``counted[i]`` says whether interval ``i`` allocates its span;
+        intervals that do not still add to the overlap depth.  All
+        intervals count when it is omitted.  Empty intervals are ignored.
+        """
+        opening: Dict[int, List[int]] = {}
+        closing: Dict[int, List[int]] = {}
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            if start >= end:
+                continue
+            opening.setdefault(start, []).append(i)
+            closing.setdefault(end, []).append(i)
+
+        # Span j is [bounds[j], bounds[j + 1]); the last one is always empty
+        self.bounds: List[int] = sorted(opening.keys() | closing.keys())
+        self.covers: List[Tuple[int, ...]] = []
+        self.allocated: List[bool] = []
+        active: Set[int] = set()
+        for bound in self.bounds:
+            active.difference_update(closing.get(bound, ()))
+            active.update(opening.get(bound, ()))
+            cover = tuple(sorted(active))
+            self.covers.append(cover)
+            self.allocated.append(
+                bool(cover) if counted is None else any(counted[i] for i in cover)
+            )
+
+        self._allocated_before = [0]
+        for j in range(len(self.bounds) - 1):
+            width = self.bounds[j + 1] - self.bounds[j] if self.allocated[j] else 0
+            self._allocated_before.append(self._allocated_before[-1] + width)
+
+        self.gaps = self._runs(lambda depth, allocated: not allocated)
+        self.overlaps = self._runs(lambda depth, allocated: depth > 1)
+        self._gap_ends = [end for _, end, _ in self.gaps]
+        self._overlap_ends = [end for _, end, _ in self.overlaps]
+
+    def _spans(self) -> Iterable[Tuple[int, int, int, bool]]:
+        """Yield ``(start, end, depth, allocated)`` for every span, outer ones included."""
+        bounds = self.bounds
+        if not bounds:
+            yield -UNBOUNDED, UNBOUNDED, 0, False
+            return
+        yield -UNBOUNDED, bounds[0], 0, False
+        for j in range(len(bounds) - 1):
+            yield bounds[j], bounds[j + 1], len(self.covers[j]), self.allocated[j]
+        yield bounds[-1], UNBOUNDED, 0, False
+
+    def _runs(self, keep: Callable[[int, bool], bool]) -> List[Tuple[int, int, int]]:
+        """Merge adjacent kept spans of equal depth into ``(start, end, depth)`` runs."""
+        runs: List[Tuple[int, int, int]] = []
+        for start, end, depth, allocated in self._spans():
+            if not keep(depth, allocated):
+                continue
+            if runs and runs[-1][1] == start and runs[-1][2] == depth:
+                runs[-1] = (runs[-1][0], end, depth)
+            else:
+                runs.append((start, end, depth))
+        return runs
+
+    def _allocated_below(self, point: int) -> int:
+        """Total allocated width in ``(-inf, point)``."""
+        bounds = self.bounds
+        if not bounds or point <= bounds[0]:
+            return 0
+        if point >= bounds[-1]:
+            return self._allocated_before[-1]
+        j = bisect_right(bounds, point) - 1
+        partial = point - bounds[j] if self.allocated[j] else 0
+        return self._allocated_before[j] + partial
+
+    def allocated_width(self, low: int, high: int) -> int:
+        """Width of ``[low, high)`` covered by at least one counted interval."""
+        if high <= low:
+            return 0
+        return self._allocated_below(high) - self._allocated_below(low)
+
+    @staticmethod
+    def _clip(
+        runs: List[Tuple[int, int, int]], ends: List[int], low: int, high: int
+    ) -> List[Tuple[int, int, int]]:
+        """Return the runs intersecting ``[low, high)``, clipped to it."""
+        out: List[Tuple[int, int, int]] = []
+        for k in range(bisect_right(ends, low), len(runs)):
+            start, end, depth = runs[k]
+            if start >= high:
+                break
+            out.append((max(start, low), min(end, high), depth))
+        return out
+
+    def gaps_in(self, low: int, high: int) -> List[Tuple[int, int, int]]:
+        """Unallocated runs within ``[low, high)`` as ``(start, end, depth)``."""
+        return self._clip(self.gaps, self._gap_ends, low, high)
+
+    def overlaps_in(self, low: int, high: int) -> List[Tuple[int, int, int]]:
+        """Runs covered more than once within ``[low, high)`` as ``(start, end, depth)``."""
+        return self._clip(self.overlaps, self._overlap_ends, low, high)
+
+    def max_depth(self, low: int, high: int) -> int:
+        """Largest number of intervals covering any point of ``[low, high)``."""
+        bounds = self.bounds
+        best = 0
+        j = max(bisect_right(bounds, low) - 1, 0)
+        while j < len(bounds) - 1 and bounds[j] < high:
+            if bounds[j + 1] > low:
+                best = max(best, len(self.covers[j]))
+            j += 1
+        return best
+
+
+class TextIndex:
+    """Inverted index over short text fields with prefix and fuzzy lookup.
+
+    Each token maps to the documents containing it, with the summed weight
+    of the fields it appears in.  The sorted vocabulary answers prefix
+    queries with a bisect, and a trigram index over the vocabulary finds
+    tokens close to a misspelt query term.  Scores add, per query term,
+    the best match's ``idf * field weight * match weight``; every term
+    must match for a document to be returned.
+    """
+
+    EXACT = 1.0
+    PREFIX = 0.6
+    FUZZY = 0.4
+    FUZZY_MIN_SIMILARITY = 0.4
+
+    _TOKEN = re.compile(r"[0-9a-z]+(?:\.[0-9a-z]+)*")
+
+    def __init__(
+        self, documents: Sequence[Dict[str, Optional[str]]], weights: Dict[str, float]
+    ):
+        """Index ``documents``, each a mapping of field name to text.
+
+        Args:
+            documents: Field texts per document; document ids are positions
+            weights: Weight of a match in each field; other fields are skipped
+        """
+        self._postings: Dict[str, Dict[int, float]] = {}
+        for doc, fields in enumerate(documents):
+            for field, weight in weights.items():
+                for token in set(self.tokenize(fields.get(field) or "")):
+                    postings = self._postings.setdefault(token, {})
+                    postings[doc] = postings.get(doc, 0.0) + weight
+        self._vocab = sorted(self._postings)
+        count = max(len(documents), 1)
+        self._idf = {
+            token: math.log(1 + count / len(postings))
+            for token, postings in self._postings.items()
+        }
+        self._trigrams: Dict[str, List[str]] = {}
+        for token in self._vocab:
+            for gram in self._grams(token):
+                self._trigrams.setdefault(gram, []).append(token)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Split text into lower-case alphanumeric tokens (``1.25m`` stays whole)."""
+        return cls._TOKEN.findall(text.lower())
+
+    @staticmethod
+    def _grams(token: str) -> Set[str]:
+        padded = f"${token}$"
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _expand(self, term: str, prefix: bool, fuzzy: bool) -> Dict[str, float]:
+        """Vocabulary tokens matching ``term`` with their match weights."""
+        matches: Dict[str, float] = {}
+        if fuzzy:
+            grams = self._grams(term)
+            shared: Dict[str, int] = {}
+            for gram in grams:
+                for token in self._trigrams.get(gram, ()):
+                    shared[token] = shared.get(token, 0) + 1
+            for token, common in shared.items():
+                similarity = common / (len(grams) + len(self._grams(token)) - common)
+                if similarity >= self.FUZZY_MIN_SIMILARITY:
+                    matches[token] = self.FUZZY * similarity
+        if prefix:
+            lo = bisect_left(self._vocab, term)
+            hi = bisect_left(self._vocab, term + "\uffff", lo)
+            for token in self._vocab[lo:hi]:
+                matches[token] = self.PREFIX
+        if term in self._postings:
+            matches[term] = self.EXACT
+        return matches
+
+    def search(
+        self, query: str, prefix: bool = True, fuzzy: bool = False
+    ) -> List[Tuple[int, float]]:
+        """Return ``(document, score)`` for documents matching every query term.
+
+        Results are ordered by descending score, then by document id.
+        """
+        terms = list(dict.fromkeys(self.tokenize(query)))
+        if not terms:
+            return []
+        scores: Optional[Dict[int, float]] = None
+        for term in terms:
+            best: Dict[int, float] = {}
+            for token, match in self._expand(term, prefix, fuzzy).items():
+                idf = self._idf[token]
+                for doc, weight in self._postings[token].items():
+                    score = match * idf * weight
+                    if score > best.get(doc, 0.0):
+                        best[doc] = score
+            if scores is None:
+                scores = best
+            else:
+                scores = {
+                    doc: score + best[doc] for doc, score in scores.items() if doc in best
+                }
+            if not scores:
+                return []
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+class PrivilegeIndex:
+    """Spectrum each license class may use, broken down by mode.
+
+    For every class the spans of the segments that grant it are merged
+    into sorted, disjoint interval lists, one per mode plus one for any
+    mode, so a check is a single bisect into one list.  Spans are
+    half-open ``[start, end)``, as for coverage: segments sharing an edge
+    do not both claim it, and a segment's upper edge is not in it.
+    """
+
+    def __init__(self, grants: Iterable[Tuple[int, int, Iterable[str], Optional[str]]]):
+        """Build the index from ``(start, end, classes, mode)`` per granting segment."""
+        any_spans: Dict[str, List[Tuple[int, int]]] = {}
+        mode_spans: Dict[str, Dict[str, List[Tuple[int, int]]]] = {}
+        for start, end, classes, mode in grants:
+            for license_class in classes:
+                any_spans.setdefault(license_class, []).append((start, end))
+                if mode:
+                    mode_spans.setdefault(license_class, {}).setdefault(
+                        mode, []
+                    ).append((start, end))
+        self._any = {cls: self._merge(spans) for cls, spans in any_spans.items()}
+        self._by_mode = {
+            cls: {mode: self._merge(spans) for mode, spans in sorted(modes.items())}
+            for cls, modes in mode_spans.items()
+        }
+        # In the order the plan first mentions them
+        self.classes: List[str] = list(self._any)
+
+    @staticmethod
+    def _merge(spans: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        """Merge half-open spans into sorted, disjoint start and end lists."""
+        starts: List[int] = []
+        ends: List[int] = []
+        for start, end in sorted(spans):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
+
+    @staticmethod
+    def _contains(spans: Tuple[List[int], List[int]], point: int) -> bool:
+        """Whether ``point`` falls in one of the merged spans."""
+        starts, ends = spans
+        i = bisect_right(starts, point) - 1
+        return i >= 0 and point < ends[i]
+
+    def modes(self, license_class: str) -> List[str]:
+        """Return the modes ``license_class`` may use anywhere."""
+        return list(self._by_mode.get(license_class, {}))
+
+    def spans(
+        self, license_class: str, mode: Optional[str] = None
+    ) -> List[Tuple[int, int]]:
+        """Return the merged ``[start, end)`` spans of a class, for one mode or any."""
+        if mode is None:
+            merged = self._any.get(license_class, ([], []))
+        else:
+            merged = self._by_mode.get(license_class, {}).get(mode, ([], []))
+        return list(zip(*merged))
+
+    def total_width(self, license_class: str) -> int:
+        """Return the width in Hz a class may use."""
+        starts, ends = self._any.get(license_class, ([], []))
+        return sum(end - start for start, end in zip(starts, ends))
+
+    def allows(self, license_class: str, frequency: int, mode: Optional[str] = None) -> bool:
+        """Whether ``license_class`` may transmit at ``frequency``, in ``mode`` if given."""
+        if mode is None:
+            spans = self._any.get(license_class)
+        else:
+            spans = self._by_mode.get(license_class, {}).get(mode)
+        return spans is not None and self._contains(spans, frequency)
+
+    def modes_at(self, license_class: str, frequency: int) -> List[str]:
+        """Return the modes ``license_class`` may use at ``frequency``."""
+        return [
+            mode
+            for mode, spans in self._by_mode.get(license_class, {}).items()
+            if self._contains(spans, frequency)
+        ]
+
+    def privilege_map(self, license_class: str) -> List[Tuple[int, int, Tuple[str, ...]]]:
+        """Return a class's spectrum as ``[start, end)`` spans of constant modes.
+
+        A frequency is in a returned span exactly when ``allows`` accepts
+        it.  Spans are sorted, disjoint and maximal: neighbours differ in
+        their modes or are separated by spectrum the class may not use.
+        """
+        any_mode = self._any.get(license_class, ([], []))
+        by_mode = self._by_mode.get(license_class, {})
+        lists = [any_mode, *by_mode.values()]
+        bounds = sorted(
+            {start for starts, _ in lists for start in starts}
+            | {end for _, ends in lists for end in ends}
+        )
+        result: List[Tuple[int, int, Tuple[str, ...]]] = []
+        for low, high in zip(bounds, bounds[1:]):
+            if not self._contains(any_mode, low):
+                continue
+            modes = tuple(mode for mode, spans in by_mode.items() if self._contains(spans, low))
+            if result and result[-1][1] == low and result[-1][2] == modes:
+                result[-1] = (result[-1][0], high, modes)
+            else:
+                result.append((low, high, modes))
+        return result
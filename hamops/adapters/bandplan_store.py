@@ -0,0 +1,166 @@
+"""Compact in-memory storage for band plan segments.
+
+A plan holds about as many segments as it has distinct descriptions, but
+only a few dozen distinct modes, colors, band names and license or use
+lists.  Segments are kept as ``__slots__`` records whose strings are
+interned and whose license and use lists are tuples shared by every
+segment with the same list, instead of one JSON dict (and one validated
+model) per segment each holding its own copies.  Encoded JSON is kept as
+one buffer sliced on demand rather than an object per segment.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+_STRING_FIELDS = (
+    "minFrequencyDisplay",
+    "maxFrequencyDisplay",
+    "bandName",
+    "mode",
+    "description",
+    "color",
+)
+
+
+class SegmentRecord:
+    """One band plan segment, with the attributes of ``BandSegment``.
+
+    Records are shared by every structure built over a plan and must not
+    be modified.  ``licenseClass`` and ``typicalUses`` are tuples.
+    """
+
+    __slots__ = (
+        "minFrequency",
+        "maxFrequency",
+        "minFrequencyMHz",
+        "maxFrequencyMHz",
+        "minFrequencyDisplay",
+        "maxFrequencyDisplay",
+        "bandName",
+        "mode",
+        "description",
+        "licenseClass",
+        "typicalUses",
+        "color",
+        "step",
+    )
+
+    def __init__(
+        self,
+        minFrequency: int,
+        maxFrequency: int,
+        minFrequencyMHz: float,
+        maxFrequencyMHz: float,
+        minFrequencyDisplay: str,
+        maxFrequencyDisplay: str,
+        bandName: Optional[str] = None,
+        mode: Optional[str] = None,
+        description: Optional[str] = None,
+        licenseClass: Optional[Tuple[str, ...]] = None,
+        typicalUses: Optional[Tuple[str, ...]] = None,
+        color: Optional[str] = None,
+        step: Optional[int] = None,
+    ):
+        self.minFrequency = minFrequency
+        self.maxFrequency = maxFrequency
+        self.minFrequencyMHz = minFrequencyMHz
+        self.maxFrequencyMHz = maxFrequencyMHz
+        self.minFrequencyDisplay = minFrequencyDisplay
+        self.maxFrequencyDisplay = maxFrequencyDisplay
+        self.bandName = bandName
+        self.mode = mode
+        self.description = description
+        self.licenseClass = licenseClass
+        self.typicalUses = typicalUses
+        self.color = color
+        self.step = step
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the segment as a band plan JSON entry.
+
+        Optional fields that are unset are left out, as in the data file.
+        """
+        band: Dict[str, Any] = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if value is not None:
+                band[field] = list(value) if isinstance(value, tuple) else value
+        return band
+
+    def __repr__(self) -> str:
+        return f"SegmentRecord({self.as_dict()!r})"
+
+
+class SegmentInterner:
+    """Build ``SegmentRecord``s that share equal strings and lists.
+
+    Strings go through ``sys.intern``, so they are also shared between
+    plans of different regions loaded in the same process.
+    """
+
+    def __init__(self) -> None:
+        self._tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def string(self, value: Optional[str]) -> Optional[str]:
+        """Return the interned copy of ``value``."""
+        return None if value is None else sys.intern(value)
+
+    def strings(self, values: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+        """Return the shared tuple equal to ``values``."""
+        if values is None:
+            return None
+        key = tuple(sys.intern(value) for value in values)
+        return self._tuples.setdefault(key, key)
+
+    def record(self, band: Dict[str, Any]) -> SegmentRecord:
+        """Build the record for a band plan JSON entry."""
+        return SegmentRecord(
+            minFrequency=band["minFrequency"],
+            maxFrequency=band["maxFrequency"],
+            minFrequencyMHz=band["minFrequencyMHz"],
+            maxFrequencyMHz=band["maxFrequencyMHz"],
+            licenseClass=self.strings(band.get("licenseClass")),
+            typicalUses=self.strings(band.get("typicalUses")),
+            step=band.get("step"),
+            **{field: self.string(band.get(field)) for field in _STRING_FIELDS},
+        )
+
+
+class BlobTable(Sequence[Union[bytes, memoryview]]):
+    """A sequence of byte strings stored in one buffer.
+
+    Items are sliced out on access; only the buffer and an offset array
+    are resident, however many blobs there are.
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data: Union[bytes, memoryview], offsets: Sequence[int]):
+        """Wrap ``data`` where blob ``i`` is ``data[offsets[i]:offsets[i + 1]]``."""
+        self._data = data
+        self._offsets = array("I", offsets)
+
+    @classmethod
+    def from_blobs(cls, blobs: Iterable[bytes]) -> "BlobTable":
+        """Concatenate ``blobs`` into a table."""
+        chunks: List[bytes] = []
+        offsets = [0]
+        for blob in blobs:
+            chunks.append(blob)
+            offsets.append(offsets[-1] + len(blob))
+        return cls(b"".join(chunks), offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("blob index out of range")
+        return self._data[self._offsets[idx]:self._offsets[idx + 1]]
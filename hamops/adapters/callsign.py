@@ -2,10 +2,15 @@
 
 from typing import Any, Optional
 
-import httpx
-
+from hamops.adapters.upstream import get_upstream_client
+from hamops.cache import SingleFlight
 from hamops.models import CallsignRecord
 
+HAMDB_BASE_URL = "http://api.hamdb.org"
+
+# Concurrent lookups of the same callsign share one HamDB request
+_lookups = SingleFlight()
+
 
 def _to_float(x: Any) -> Optional[float]:
     """Best-effort float conversion returning ``None`` on failure."""
@@ -19,11 +24,16 @@ async def lookup_callsign(callsign: str) -> Optional[CallsignRecord]:
     """Minimal, forgiving HamDB lookup.
 
     Returns ``None`` on any error or when the callsign isn't found.
+    Concurrent lookups of the same callsign share a single request.
     """
-    url = f"http://api.hamdb.org/{callsign.upper()}/json"
+    return await _lookups.do(callsign.upper(), lambda: _lookup_callsign(callsign))
+
+
+async def _lookup_callsign(callsign: str) -> Optional[CallsignRecord]:
+    """Query HamDB for one callsign (see ``lookup_callsign``)."""
+    url = f"{HAMDB_BASE_URL}/{callsign.upper()}/json"
     try:
-        async with httpx.AsyncClient(timeout=6, follow_redirects=True) as client:
-            r = await client.get(url)
+        r = await get_upstream_client().get(url, timeout=6, follow_redirects=True)
     except Exception:
         return None
 
@@ -0,0 +1,118 @@
+"""Shared HTTP client for the upstream APIs (aprs.fi, HamDB).
+
+One ``httpx.AsyncClient`` is opened by the app lifespan and reused by
+every adapter call, so requests to the same host share pooled keep-alive
+connections instead of paying a TCP and TLS handshake each.  Pool limits
+and timeouts come from the environment; HTTP/2 is used when enabled and
+the ``h2`` package is installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from hamops.middleware.logging import log_info, log_warning
+
+UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "50"))
+UPSTREAM_MAX_KEEPALIVE = int(os.getenv("UPSTREAM_MAX_KEEPALIVE", "20"))
+UPSTREAM_KEEPALIVE_EXPIRY = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", "60"))
+UPSTREAM_CONNECT_TIMEOUT = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "5"))
+UPSTREAM_TIMEOUT = float(os.getenv("UPSTREAM_TIMEOUT", "10"))
+UPSTREAM_HTTP2 = os.getenv("UPSTREAM_HTTP2", "false").lower() in ("1", "true", "yes")
+UPSTREAM_PREWARM = os.getenv("UPSTREAM_PREWARM", "true").lower() in ("1", "true", "yes")
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_prewarm_task: Optional[asyncio.Task] = None
+
+
+def _http2_available() -> bool:
+    """Whether HTTP/2 was requested and ``h2`` is installed to provide it."""
+    if not UPSTREAM_HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        log_warning(
+            "upstream_http2_unavailable",
+            message="UPSTREAM_HTTP2 is set but the h2 package is not installed; using HTTP/1.1.",
+        )
+        return False
+    return True
+
+
+def _new_client() -> httpx.AsyncClient:
+    """Create a pooled client configured from the environment."""
+    return httpx.AsyncClient(
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=UPSTREAM_MAX_CONNECTIONS,
+            max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE,
+            keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(UPSTREAM_TIMEOUT, connect=UPSTREAM_CONNECT_TIMEOUT),
+    )
+
+
+def get_upstream_client() -> httpx.AsyncClient:
+    """Return the shared client, for use from the event loop.
+
+    The lifespan opens it; callers outside the app (scripts, a bare
+    ``asyncio.run``) get one created on first use.  Pooled connections
+    belong to the loop that opened them, so a different loop gets its own
+    client.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _new_client()
+        _client_loop = loop
+    return _client
+
+
+async def _prewarm(urls: Iterable[str]) -> None:
+    """Open a pooled connection to each upstream origin."""
+    client = get_upstream_client()
+
+    async def warm(url: str) -> None:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}/"
+        try:
+            await client.head(origin, timeout=UPSTREAM_CONNECT_TIMEOUT)
+            log_info("upstream_prewarmed", origin=origin)
+        except Exception as e:
+            log_warning("upstream_prewarm_failed", origin=origin, error=str(e))
+
+    await asyncio.gather(*(warm(url) for url in dict.fromkeys(urls)))
+
+
+async def start_upstream_client(prewarm: Iterable[str] = ()) -> httpx.AsyncClient:
+    """Open the shared client and pre-warm connections in the background.
+
+    Args:
+        prewarm: URLs whose origins should have a connection ready before
+            the first request needs one; startup does not wait for them
+    """
+    global _prewarm_task
+    client = get_upstream_client()
+    urls = list(prewarm)
+    if UPSTREAM_PREWARM and urls:
+        _prewarm_task = asyncio.create_task(_prewarm(urls))
+    return client
+
+
+async def close_upstream_client() -> None:
+    """Cancel any pre-warming and close the shared client's connections."""
+    global _client, _client_loop, _prewarm_task
+    if _prewarm_task is not None:
+        _prewarm_task.cancel()
+        await asyncio.gather(_prewarm_task, return_exceptions=True)
+        _prewarm_task = None
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
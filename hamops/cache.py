@@ -0,0 +1,223 @@
+"""In-process caches shared by the adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """A bounded least-recently-used mapping with hit/miss counters.
+
+    Not thread-safe by design: it is only touched from the event loop, and
+    a lost update under contention merely costs a recomputation.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """Create a cache holding at most ``maxsize`` entries."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key`` or ``None`` on a miss."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the current size, capacity and hit/miss counters."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class TTLCache:
+    """A bounded cache of awaited results that serves stale while revalidating.
+
+    An entry younger than its TTL is returned as is.  Once it is older, but
+    not by more than ``max_stale`` seconds past the TTL, it is still
+    returned at once while a single background task fetches a fresh value;
+    older entries are refetched in line.  Only results that ``cacheable``
+    accepts are stored, so failures are retried rather than remembered.
+
+    Like ``LRUCache`` it is only touched from the event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        max_stale: float = 300.0,
+        cacheable: Callable[[Any], bool] = lambda value: value is not None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a cache holding at most ``maxsize`` entries."""
+        self.maxsize = maxsize
+        self.max_stale = max_stale
+        self.cacheable = cacheable
+        self.clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        """Store a fetched value if it may be cached, evicting the oldest entry."""
+        if self.maxsize <= 0 or not self.cacheable(value):
+            return
+        self._data[key] = (value, self.clock())
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Replace a stale entry in the background, keeping it on failure."""
+        try:
+            value = await fetch()
+            if self.cacheable(value):
+                self.refreshes += 1
+                self._put(key, value)
+            else:
+                self.refresh_errors += 1
+        except Exception:
+            self.refresh_errors += 1
+        finally:
+            if self._refreshing.get(key) is asyncio.current_task():
+                del self._refreshing[key]
+
+    async def get(
+        self, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the value for ``key``, calling ``fetch`` when it must be (re)loaded.
+
+        Args:
+            key: Cache key
+            ttl: Seconds a stored value stays fresh
+            fetch: Coroutine factory producing a fresh value
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = self.clock() - stored_at
+            if age < ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            if age < ttl + self.max_stale:
+                self._data.move_to_end(key)
+                self.stale_hits += 1
+                task = self._refreshing.get(key)
+                # A refresh left behind by a loop that has since closed never finishes
+                if task is None or task.get_loop() is not asyncio.get_running_loop():
+                    self._refreshing[key] = asyncio.create_task(self._refresh(key, fetch))
+                return value
+        self.misses += 1
+        value = await fetch()
+        self._put(key, value)
+        return value
+
+    async def close(self) -> None:
+        """Cancel any background refreshes still running."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshing.clear()
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._data.clear()
+        self.hits = self.stale_hits = self.misses = 0
+        self.refreshes = self.refresh_errors = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the current size, capacity and hit/miss/refresh counters."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "staleHits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refreshErrors": self.refresh_errors,
+            "refreshing": len(self._refreshing),
+        }
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one call.
+
+    The first caller for a key starts the call as its own task; callers
+    arriving while it runs await that task instead of starting another.
+    Every caller gets the same result or exception, and the key is free
+    again as soon as the call finishes, so failures are not remembered.
+    A caller that is cancelled stops waiting without cancelling the call
+    the others are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        """Free ``key`` and mark the outcome as seen, even if no one awaits it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``await fn()``, sharing one call among concurrent callers of ``key``."""
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.calls += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the calls made, callers coalesced and calls in flight."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
@@ -9,32 +9,116 @@ so that ASGI servers like Uvicorn can discover it automatically.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import secrets
+import time
+from contextlib import asynccontextmanager
 from importlib import resources
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.security import APIKeyHeader
 from fastapi_mcp import FastApiMCP
 from fastapi.staticfiles import StaticFiles
 
 
-from .adapters.callsign import lookup_callsign
+from .adapters.callsign import HAMDB_BASE_URL, lookup_callsign
 from .adapters.aprs import (
+    APRS_CACHE_TTL,
+    get_aprs_cache,
+    get_aprs_flights,
     get_aprs_locations,
+    get_aprs_locations_batch,
     get_aprs_weather,
+    get_aprs_weather_batch,
     get_aprs_messages,
 )
-from .adapters.bandplan import get_bandplan_adapter
-from .middleware import RequestLogMiddleware
+from .adapters.bandplan import (
+    BandPlanAdapter,
+    get_bandplan_adapter,
+    get_bandplan_registry,
+)
+from .adapters.upstream import close_upstream_client, start_upstream_client
+from .models.aprs import APRSBatchRequest
+from .models.bandplan import FrequencyBatchRequest, PrivilegeBatchRequest
+from .middleware import ETagMiddleware, RequestLogMiddleware
+from .middleware.logging import log_info
 
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Admin routes are disabled unless this key is set
+BANDPLAN_ADMIN_KEY = os.getenv("BANDPLAN_ADMIN_KEY")
+# Band plan responses: browser max-age, then shared (CDN) max-age, in seconds.
+# A reload changes the plan, so shared caches must not outlive it for long
+BANDPLAN_MAX_AGE = int(os.getenv("BANDPLAN_MAX_AGE", "300"))
+BANDPLAN_CDN_MAX_AGE = int(os.getenv("BANDPLAN_CDN_MAX_AGE", str(BANDPLAN_MAX_AGE)))
+
+
+def _record_response(payload: bytes) -> Response:
+    """Wrap pre-encoded JSON in the ``{"record": ...}`` envelope."""
+    return Response(b'{"record":' + payload + b"}", media_type="application/json")
+
+
+def _warm_bandplan() -> None:
+    """Load the band plan singleton and build its lazy structures."""
+    started = time.perf_counter()
+    adapter = get_bandplan_adapter()
+    if adapter.ready:
+        adapter.warmup()
+    log_info(
+        "bandplan_warmup_complete",
+        ready=adapter.ready,
+        duration_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+
+
+async def _bandplan(region: Optional[str]) -> BandPlanAdapter:
+    """Resolve the band plan for a ``region`` query parameter.
+
+    Resident plans are returned directly; the first request for a region
+    loads it in a worker thread so the event loop keeps serving.
+    """
+    registry = get_bandplan_registry()
+    adapter = registry.resident(region)
+    if adapter is None:
+        adapter = await asyncio.to_thread(registry.get, region)
+    if adapter is None:
+        raise HTTPException(
+            status_code=404, detail=f"Unknown band plan region: {region}"
+        )
+    return adapter
+
+
+def _resident_plan_hash(region: Optional[str]) -> Optional[str]:
+    """Content hash of the resident plan for ``region``, if it's loaded."""
+    adapter = get_bandplan_registry().resident(region)
+    return adapter.plan_hash if adapter is not None else None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm data-backed adapters and open upstream connections.
+
+    The band plan is ready before the server accepts traffic; upstream
+    connections are pre-warmed in the background.
+    """
+    prewarm = [HAMDB_BASE_URL]
+    if os.getenv("APRFI_API_KEY"):
+        prewarm.append(os.getenv("APRS_API_BASE_URL", "https://api.aprs.fi/api/get"))
+    await start_upstream_client(prewarm)
+    try:
+        await asyncio.to_thread(_warm_bandplan)
+        yield
+    finally:
+        await get_aprs_cache().close()
+        await close_upstream_client()
 
 
 def create_app() -> FastAPI:
@@ -46,12 +130,23 @@ def create_app() -> FastAPI:
     mounted with the operation identifiers defined on the route
     decorators.
     """
-    app = FastAPI(title="Hamops")
+    app = FastAPI(title="Hamops", lifespan=lifespan)
 
     app.mount("/web", StaticFiles(directory="hamops/web"), name="web")
     # -----------------------------------------------------------------------
     # Middleware
     # -----------------------------------------------------------------------
+    # Band plan responses change only with the plan; the cache stats and
+    # region residency are live state.  Added before CORS so that CORS wraps
+    # it and early 304s carry the CORS headers too
+    app.add_middleware(
+        ETagMiddleware,
+        plan_hash=_resident_plan_hash,
+        exclude=("/api/bands/cache", "/api/bands/regions"),
+        cache_control=(
+            f"public, max-age={BANDPLAN_MAX_AGE}, s-maxage={BANDPLAN_CDN_MAX_AGE}"
+        ),
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -71,6 +166,16 @@ def create_app() -> FastAPI:
         if OPENAI_API_KEY and x_api_key != OPENAI_API_KEY:
             raise HTTPException(status_code=401, detail="Missing or invalid API key")
 
+    def require_admin_key(x_api_key: str = Depends(api_key_header)) -> None:
+        """Validate the ``x-api-key`` header against ``BANDPLAN_ADMIN_KEY``.
+
+        Fails closed: without a configured key, admin routes are refused.
+        """
+        if not BANDPLAN_ADMIN_KEY:
+            raise HTTPException(status_code=403, detail="Admin API is disabled")
+        if not x_api_key or not secrets.compare_digest(x_api_key, BANDPLAN_ADMIN_KEY):
+            raise HTTPException(status_code=401, detail="Missing or invalid admin key")
+
     # -----------------------------------------------------------------------
     # Routes
     # -----------------------------------------------------------------------
@@ -92,6 +197,7 @@ def create_app() -> FastAPI:
             "service": "HAM Ops",
             "docs": "/docs",
             "health": "/health",
+            "ready": "/ready",
             "mcp": "/mcp",
         }
 
@@ -100,6 +206,19 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"ok": True}
 
+    @app.get("/ready")
+    def ready() -> JSONResponse:
+        """Readiness check endpoint.
+
+        Returns 200 once the band plan is loaded and queryable, with its
+        load duration and segment count; 503 until then.
+        """
+        status = get_bandplan_adapter().status()
+        return JSONResponse(
+            {"ok": status["ready"], "bandplan": status},
+            status_code=200 if status["ready"] else 503,
+        )
+
     @app.get(
         "/api/callsign/{callsign}",
         operation_id="callsign_lookup",
@@ -151,6 +270,54 @@ def create_app() -> FastAPI:
             )
         return JSONResponse({"record": record.model_dump()})
 
+    @app.post(
+        "/api/aprs/locations",
+        operation_id="aprs_locations_batch",
+        tags=["APRS"],
+    )
+    async def rest_aprs_locations_batch(request: APRSBatchRequest) -> JSONResponse:
+        """Fetch APRS location records for many callsigns in one request.
+
+        Callsigns are sent to aprs.fi 20 per upstream call, concurrently.
+        Returns ``results`` with the records of each callsign that was
+        found, in request order, and the rest under ``notFound``.
+        """
+        found = await get_aprs_locations_batch(request.callsigns)
+        results = [
+            {"callsign": callsign, "records": [rec.model_dump() for rec in records]}
+            for callsign, records in found.items()
+            if records
+        ]
+        return JSONResponse({
+            "count": len(results),
+            "results": results,
+            "notFound": [callsign for callsign, records in found.items() if not records],
+        })
+
+    @app.post(
+        "/api/aprs/weather",
+        operation_id="aprs_weather_batch",
+        tags=["APRS"],
+    )
+    async def rest_aprs_weather_batch(request: APRSBatchRequest) -> JSONResponse:
+        """Retrieve the latest weather reports for many APRS stations at once.
+
+        Callsigns are sent to aprs.fi 20 per upstream call, concurrently.
+        Returns ``results`` with the weather record of each station that
+        has one, in request order, and the rest under ``notFound``.
+        """
+        found = await get_aprs_weather_batch(request.callsigns)
+        results = [
+            {"callsign": callsign, "record": record.model_dump()}
+            for callsign, record in found.items()
+            if record is not None
+        ]
+        return JSONResponse({
+            "count": len(results),
+            "results": results,
+            "notFound": [callsign for callsign, record in found.items() if record is None],
+        })
+
     @app.get(
         "/api/aprs/messages/{callsign}",
         operation_id="aprs_messages",
@@ -167,6 +334,25 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=404, detail="No APRS messages found")
         return JSONResponse({"records": [rec.model_dump() for rec in records]})
 
+    @app.get(
+        "/api/aprs/cache",
+        tags=["APRS"],
+    )
+    async def rest_aprs_cache_stats() -> JSONResponse:
+        """Report hit/miss/refresh counters for the aprs.fi response cache.
+
+        ``staleHits`` were answered from an expired entry while it was
+        refreshed in the background; ``singleFlight.coalesced`` counts
+        requests that shared another's in-flight upstream call.
+        """
+        return JSONResponse({
+            "record": {
+                **get_aprs_cache().stats(),
+                "ttlSeconds": APRS_CACHE_TTL,
+                "singleFlight": get_aprs_flights().stats(),
+            }
+        })
+
     # -----------------------------------------------------------------------
     # Band Plan Routes
     # -----------------------------------------------------------------------
@@ -175,7 +361,10 @@ def create_app() -> FastAPI:
         operation_id="band_at_frequency",
         tags=["Band Plan"],
     )
-    async def rest_band_at_frequency(frequency: str) -> JSONResponse:
+    async def rest_band_at_frequency(
+        frequency: str,
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> Response:
         """Get band information for a specific frequency.
 
         The frequency parameter can be in various formats:
@@ -187,7 +376,7 @@ def create_app() -> FastAPI:
         Returns information about what bands, modes, and privileges
         are available at the specified frequency.
         """
-        adapter = get_bandplan_adapter()
+        adapter = await _bandplan(region)
         freq_hz = adapter.parse_frequency(frequency)
         
         if freq_hz is None:
@@ -196,8 +385,28 @@ def create_app() -> FastAPI:
                 detail=f"Invalid frequency format: {frequency}"
             )
         
-        info = adapter.get_frequency_info(freq_hz)
-        return JSONResponse({"record": info.model_dump()})
+        return _record_response(adapter.get_frequency_info_json(freq_hz))
+
+    @app.post(
+        "/api/bands/frequencies",
+        operation_id="bands_at_frequencies",
+        tags=["Band Plan"],
+    )
+    async def rest_bands_at_frequencies(
+        request: FrequencyBatchRequest,
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> Response:
+        """Get band information for many frequencies in one call.
+
+        Accepts a JSON body ``{"frequencies": [...]}`` using the same formats
+        as ``/api/bands/frequency/{frequency}``.  Returns one record per input
+        in the original order; inputs that cannot be parsed yield ``null``
+        and their positions are listed under ``invalid``.
+        """
+        adapter = await _bandplan(region)
+        return _record_response(
+            adapter.get_frequency_info_batch_json(request.frequencies)
+        )
 
     @app.get(
         "/api/bands/search",
@@ -211,7 +420,8 @@ def create_app() -> FastAPI:
         typical_use: Optional[str] = Query(None, description="Filter by typical use (e.g., Phone, Digital, Satellite)"),
         min_frequency: Optional[str] = Query(None, description="Minimum frequency (with units)"),
         max_frequency: Optional[str] = Query(None, description="Maximum frequency (with units)"),
-    ) -> JSONResponse:
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> Response:
         """Search for band segments matching specified criteria.
 
         All parameters are optional. Frequencies can be specified with units
@@ -219,7 +429,7 @@ def create_app() -> FastAPI:
 
         Returns a list of band segments matching the search criteria.
         """
-        adapter = get_bandplan_adapter()
+        adapter = await _bandplan(region)
         
         # Parse frequency bounds if provided
         min_freq_hz = None
@@ -241,7 +451,7 @@ def create_app() -> FastAPI:
                     detail=f"Invalid maximum frequency format: {max_frequency}"
                 )
         
-        result = adapter.search_bands(
+        result = adapter.search_bands_json(
             mode=mode,
             band_name=band_name,
             license_class=license_class,
@@ -250,7 +460,28 @@ def create_app() -> FastAPI:
             max_freq=max_freq_hz,
         )
         
-        return JSONResponse({"record": result.model_dump()})
+        return _record_response(result)
+
+    @app.get(
+        "/api/bands/text-search",
+        operation_id="search_band_text",
+        tags=["Band Plan"],
+    )
+    async def rest_search_band_text(
+        q: str = Query(..., min_length=1, max_length=200, description="Words to find (e.g., satellite, beacon, wefax)"),
+        fuzzy: bool = Query(False, description="Also match similar spellings"),
+        limit: int = Query(25, ge=1, le=500, description="Maximum results"),
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> Response:
+        """Full-text search over segment descriptions, band names and modes.
+
+        Every word must match a word of the segment, exactly or as a
+        prefix ("sat" finds "Satellite"); ``fuzzy`` also accepts close
+        misspellings.  Returns ranked results, best first, each with its
+        score and segment, plus the total number of matches.
+        """
+        adapter = await _bandplan(region)
+        return _record_response(adapter.search_text_json(q, fuzzy, limit))
 
     @app.get(
         "/api/bands/range/{start_frequency}/{end_frequency}",
@@ -260,14 +491,146 @@ def create_app() -> FastAPI:
     async def rest_bands_in_range(
         start_frequency: str,
         end_frequency: str,
-    ) -> JSONResponse:
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> Response:
         """Get all band segments within a frequency range.
 
         Frequencies can be specified with units (e.g., "14 MHz", "14.350 MHz").
 
         Returns all band segments that overlap with the specified range.
         """
-        adapter = get_bandplan_adapter()
+        adapter = await _bandplan(region)
+        
+        start_hz = adapter.parse_frequency(start_frequency)
+        if start_hz is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid start frequency format: {start_frequency}"
+            )
+        
+        end_hz = adapter.parse_frequency(end_frequency)
+        if end_hz is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid end frequency format: {end_frequency}"
+            )
+        
+        if start_hz > end_hz:
+            raise HTTPException(
+                status_code=400,
+                detail="Start frequency must be less than end frequency"
+            )
+        
+        count, bands_json = adapter.get_bands_in_range_json(start_hz, end_hz)
+        range_json = json.dumps({
+            "start": start_hz,
+            "end": end_hz,
+            "startMHz": start_hz / 1_000_000,
+            "endMHz": end_hz / 1_000_000,
+        }, separators=(",", ":")).encode()
+        return Response(
+            b'{"range":%s,"count":%d,"bands":%s}' % (range_json, count, bands_json),
+            media_type="application/json",
+        )
+
+    @app.get(
+        "/api/bands/channels",
+        operation_id="band_channels",
+        tags=["Band Plan"],
+    )
+    async def rest_band_channels(
+        band_name: Optional[str] = Query(None, description="Amateur band (e.g., 2m, 20m)"),
+        segment: Optional[str] = Query(None, description="A frequency inside the segment (e.g., 146.52 MHz)"),
+        start: Optional[str] = Query(None, description="Range start (e.g., 144 MHz)"),
+        end: Optional[str] = Query(None, description="Range end (e.g., 148 MHz)"),
+        mode: Optional[str] = Query(None, description="Only segments with this mode"),
+        step: Optional[int] = Query(None, ge=1, description="Channel spacing in Hz instead of the segment's step"),
+        cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
+        limit: int = Query(1000, ge=1, le=100_000, description="Maximum channels per page"),
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> StreamingResponse:
+        """Enumerate the channel frequencies of a band, segment or range.
+
+        Channels are spaced by each segment's tuning step (or ``step``)
+        from its lower edge.  Select segments by ``band_name``, by a
+        frequency inside one ``segment``, or by a ``start``/``end`` range;
+        these combine with ``mode``.  Results are paged: pass the returned
+        ``nextCursor`` back as ``cursor`` until it is null.
+        """
+        adapter = await _bandplan(region)
+        
+        if band_name is None and segment is None and start is None and end is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Specify band_name, segment, or a start/end range"
+            )
+        
+        frequencies = {}
+        for name, value in (("segment", segment), ("start", start), ("end", end)):
+            if value is not None:
+                frequencies[name] = adapter.parse_frequency(value)
+                if frequencies[name] is None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid {name} frequency format: {value}"
+                    )
+        start_hz = frequencies.get("start")
+        end_hz = frequencies.get("end")
+        if start_hz is not None and end_hz is not None and start_hz > end_hz:
+            raise HTTPException(
+                status_code=400,
+                detail="Start frequency must be less than end frequency"
+            )
+        
+        min_hz = start_hz or 0
+        if cursor is not None:
+            if not cursor.isdigit():
+                raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+            min_hz = max(min_hz, int(cursor) + 1)
+        
+        # Segment indices are only meaningful in the snapshot that produced
+        # them, so a reload must not land between selecting and streaming
+        snapshot = adapter.snapshot
+        indices = snapshot.channel_segments(
+            band_name=band_name,
+            segment=frequencies.get("segment"),
+            min_freq=start_hz,
+            max_freq=end_hz,
+            mode=mode,
+        )
+        query = {
+            "band_name": band_name,
+            "segment": frequencies.get("segment"),
+            "start": start_hz,
+            "end": end_hz,
+            "mode": mode,
+            "step": step,
+            "cursor": cursor,
+            "limit": limit,
+        }
+        return StreamingResponse(
+            snapshot.iter_channels_json(query, indices, min_hz, end_hz, step, limit),
+            media_type="application/json",
+        )
+
+    @app.get(
+        "/api/bands/coverage/{start_frequency}/{end_frequency}",
+        operation_id="band_coverage",
+        tags=["Band Plan"],
+    )
+    async def rest_band_coverage(
+        start_frequency: str,
+        end_frequency: str,
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
+        """Analyze how a frequency range is allocated.
+
+        Frequencies can be specified with units (e.g., "3.5 MHz", "4 MHz");
+        the end is exclusive.  Returns the allocated and unallocated width,
+        the unallocated gaps, and the spans where segments overlap with
+        how many segments cover them.
+        """
+        adapter = await _bandplan(region)
         
         start_hz = adapter.parse_frequency(start_frequency)
         if start_hz is None:
@@ -289,30 +652,122 @@ def create_app() -> FastAPI:
                 detail="Start frequency must be less than end frequency"
             )
         
-        bands = adapter.get_bands_in_range(start_hz, end_hz)
+        coverage = adapter.get_range_coverage(start_hz, end_hz)
+        return JSONResponse({"record": coverage.model_dump()})
+
+    @app.get(
+        "/api/bands/coverage",
+        operation_id="band_mode_coverage",
+        tags=["Band Plan"],
+    )
+    async def rest_band_mode_coverage(
+        band_name: Optional[str] = Query(None, description="Only this band (e.g., 20m, 2m, 70cm)"),
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
+        """Get how much of each amateur band each mode may use.
+
+        Returns one record per band with its edges, the width its segments
+        cover, and the width and fraction of that covered by each mode.
+        """
+        adapter = await _bandplan(region)
+        records = adapter.get_band_coverage(band_name)
+        if band_name and not records:
+            raise HTTPException(status_code=404, detail=f"Unknown band: {band_name}")
         return JSONResponse({
-            "range": {
-                "start": start_hz,
-                "end": end_hz,
-                "startMHz": start_hz / 1_000_000,
-                "endMHz": end_hz / 1_000_000,
-            },
-            "count": len(bands),
-            "bands": [band.model_dump() for band in bands],
+            "count": len(records),
+            "records": [record.model_dump() for record in records],
         })
 
+    @app.get(
+        "/api/bands/privileges/check",
+        operation_id="check_privilege",
+        tags=["Band Plan"],
+    )
+    async def rest_check_privilege(
+        license_class: str = Query(..., description="License class (e.g., General, Technician)"),
+        frequency: str = Query(..., description="Frequency with units (e.g., 14.230 MHz)"),
+        mode: Optional[str] = Query(None, description="Mode to check (e.g., USB, CW); any mode if omitted"),
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
+        """Check whether a license class may transmit at a frequency.
+
+        Answers questions such as "can a General transmit USB on 14.230
+        MHz?".  Returns whether it is allowed (in ``mode``, or in any mode
+        when none is given) and every mode the class may use there.
+        """
+        adapter = await _bandplan(region)
+        freq_hz = adapter.parse_frequency(frequency)
+        if freq_hz is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid frequency format: {frequency}"
+            )
+        
+        result = adapter.check_privilege(license_class, freq_hz, mode)
+        if result is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Unknown license class: {license_class}"
+            )
+        return JSONResponse({"record": result.model_dump()})
+
+    @app.post(
+        "/api/bands/privileges/check",
+        operation_id="check_privileges",
+        tags=["Band Plan"],
+    )
+    async def rest_check_privileges(
+        request: PrivilegeBatchRequest,
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> Response:
+        """Answer many privilege checks in one call.
+
+        Accepts a JSON body ``{"checks": [{"licenseClass": ..., "frequency":
+        ..., "mode": ...}, ...]}``.  Returns one record per check in the
+        original order; checks with an unparseable frequency or unknown
+        class yield ``null`` and their positions are listed under
+        ``invalid``.
+        """
+        adapter = await _bandplan(region)
+        return _record_response(adapter.check_privileges_json(request.checks))
+
+    @app.get(
+        "/api/bands/privileges/{license_class}",
+        operation_id="license_privileges",
+        tags=["Band Plan"],
+    )
+    async def rest_license_privileges(
+        license_class: str,
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
+        """Get all the spectrum a license class may use, for rendering.
+
+        Returns sorted, non-overlapping spans, each with the modes the
+        class may use throughout it, plus the total width.
+        """
+        adapter = await _bandplan(region)
+        result = adapter.get_privilege_map(license_class)
+        if result is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Unknown license class: {license_class}"
+            )
+        return JSONResponse({"record": result.model_dump()})
+
     @app.get(
         "/api/bands/summary",
         operation_id="band_plan_summary",
         tags=["Band Plan"],
     )
-    async def rest_band_plan_summary() -> JSONResponse:
+    async def rest_band_plan_summary(
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
         """Get summary information about the loaded band plan.
 
         Returns metadata about the band plan including version, source,
         available bands, modes, and frequency coverage.
         """
-        adapter = get_bandplan_adapter()
+        adapter = await _bandplan(region)
         summary = adapter.get_summary()
         
         if not summary:
@@ -323,6 +778,72 @@ def create_app() -> FastAPI:
         
         return JSONResponse({"record": summary.model_dump()})
 
+    @app.get(
+        "/api/bands/cache",
+        tags=["Band Plan"],
+    )
+    async def rest_band_cache_stats(
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
+        """Report hit/miss counters for the band plan query caches.
+
+        Also reports which regions are resident in the plan registry.
+        """
+        adapter = await _bandplan(region)
+        return JSONResponse({
+            "record": {
+                **adapter.cache_stats(),
+                "registry": get_bandplan_registry().stats(),
+            }
+        })
+
+    @app.get(
+        "/api/bands/regions",
+        operation_id="band_plan_regions",
+        tags=["Band Plan"],
+    )
+    async def rest_band_plan_regions() -> JSONResponse:
+        """List the band plan regions that can be queried.
+
+        Every band plan endpoint accepts one of these codes as its
+        ``region`` parameter.  Plans load on first use, so ``resident``
+        shows which ones are currently in memory.
+        """
+        registry = get_bandplan_registry()
+        resident = set(registry.stats()["resident"])
+        return JSONResponse({
+            "default": registry.default_region,
+            "records": [
+                {"region": code, "resident": code in resident}
+                for code in registry.available()
+            ],
+        })
+
+    @app.post(
+        "/api/admin/bands/reload",
+        tags=["Admin"],
+        dependencies=[Depends(require_admin_key)],
+    )
+    async def rest_reload_bandplan(
+        region: Optional[str] = Query(None, description="Band plan region code (see /api/bands/regions)"),
+    ) -> JSONResponse:
+        """Reload the band plan data from disk without a restart.
+
+        The new plan is built and warmed in a worker thread and then swapped
+        in atomically; requests already running finish on the old plan.
+        Returns 500 and keeps serving the old plan if loading fails.  A
+        region that is not resident is simply loaded.
+        """
+        adapter = get_bandplan_registry().resident(region)
+        if adapter is None:
+            adapter = await _bandplan(region)
+        elif not await asyncio.to_thread(adapter.reload):
+            raise HTTPException(
+                status_code=500,
+                detail="Band plan reload failed; previous data kept",
+            )
+        return JSONResponse({"record": adapter.status()})
+
     # -----------------------------------------------------------------------
     # MCP server mount
     # -----------------------------------------------------------------------
@@ -332,12 +853,23 @@ def create_app() -> FastAPI:
         include_operations=[
             "callsign_lookup",
             "aprs_locations",
+            "aprs_locations_batch",
             "aprs_weather",
+            "aprs_weather_batch",
             "aprs_messages",
             "band_at_frequency",
+            "bands_at_frequencies",
             "search_bands",
+            "search_band_text",
             "bands_in_range",
+            "band_channels",
+            "band_coverage",
+            "band_mode_coverage",
+            "check_privilege",
+            "check_privileges",
+            "license_privileges",
             "band_plan_summary",
+            "band_plan_regions",
         ],
     )
     mcp.mount()
@@ -1,5 +1,6 @@
 """Middleware exports."""
 
+from .caching import ETagMiddleware
 from .logging import RequestLogMiddleware
 
-__all__ = ["RequestLogMiddleware"]
+__all__ = ["ETagMiddleware", "RequestLogMiddleware"]
@@ -0,0 +1,102 @@
+"""Conditional request and HTTP caching middleware for band plan routes."""
+
+import hashlib
+from typing import Callable, Iterable, Optional
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Apply the weak comparison ``If-None-Match`` calls for."""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """Strong ETags and ``Cache-Control`` for responses derived from a plan.
+
+    A response under ``prefix`` depends only on the band plan it was
+    computed from and on the request, so its ETag is a hash of the plan's
+    content hash, the path and the sorted query string.  That makes it
+    known before the route runs: a matching ``If-None-Match`` is answered
+    with 304 straight away, and a reload that changes the plan changes
+    every tag.
+    """
+
+    def __init__(
+        self,
+        app,
+        plan_hash: Callable[[Optional[str]], Optional[str]],
+        prefix: str = "/api/bands/",
+        exclude: Iterable[str] = (),
+        cache_control: str = "public, max-age=300",
+    ) -> None:
+        """Configure the middleware.
+
+        Args:
+            app: The ASGI application
+            plan_hash: Returns the content hash of a region's resident
+                plan (None for the default region), or None if the plan
+                isn't loaded
+            prefix: Path prefix of the routes to tag
+            exclude: Paths under ``prefix`` whose responses aren't a pure
+                function of the plan
+            cache_control: ``Cache-Control`` value for tagged responses
+        """
+        super().__init__(app)
+        self.plan_hash = plan_hash
+        self.prefix = prefix
+        self.exclude = frozenset(exclude)
+        self.cache_control = cache_control
+
+    def _etag(self, request: Request) -> Optional[str]:
+        """Return the ETag for ``request``, if its plan is resident."""
+        plan_hash = self.plan_hash(request.query_params.get("region"))
+        if plan_hash is None:
+            return None
+        query = "&".join(
+            f"{key}={value}" for key, value in sorted(request.query_params.multi_items())
+        )
+        digest = hashlib.sha256(
+            f"{plan_hash}\n{request.url.path}\n{query}".encode()
+        ).hexdigest()[:32]
+        return f'"{digest}"'
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """Answer matching conditional requests and tag fresh responses."""
+        path = request.url.path
+        if (
+            request.method != "GET"
+            or not path.startswith(self.prefix)
+            or path in self.exclude
+        ):
+            return await call_next(request)
+
+        etag = self._etag(request)
+        if etag is not None:
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and _matches(if_none_match, etag):
+                return Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": self.cache_control},
+                )
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        # The first request for a region loads its plan; a reload during
+        # the request may have changed it, so only tag a consistent body
+        after = self._etag(request)
+        if after is not None and (etag is None or after == etag):
+            response.headers["ETag"] = after
+            response.headers["Cache-Control"] = self.cache_control
+        return response
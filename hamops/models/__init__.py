@@ -1,7 +1,29 @@
 """Model exports."""
 
-from .aprs import APRSLocationRecord, APRSMessageRecord, APRSWeatherRecord
-from .bandplan import BandSegment, FrequencyInfo, BandSearchResult, BandPlanSummary
+from .aprs import (
+    APRSBatchRequest,
+    APRSLocationRecord,
+    APRSMessageRecord,
+    APRSWeatherRecord,
+)
+from .bandplan import (
+    BandSegment,
+    FrequencyInfo,
+    FrequencyBatchRequest,
+    BandSearchResult,
+    TextSearchHit,
+    TextSearchResult,
+    BandPlanSummary,
+    SpectrumSpan,
+    RangeCoverage,
+    ModeCoverage,
+    BandCoverage,
+    PrivilegeCheck,
+    PrivilegeQuery,
+    PrivilegeBatchRequest,
+    PrivilegeSpan,
+    PrivilegeMap,
+)
 from .callsign import CallsignRecord
 
 __all__ = [
@@ -9,8 +31,21 @@ __all__ = [
     "APRSLocationRecord",
     "APRSWeatherRecord",
     "APRSMessageRecord",
+    "APRSBatchRequest",
     "BandSegment",
     "FrequencyInfo",
+    "FrequencyBatchRequest",
     "BandSearchResult",
+    "TextSearchHit",
+    "TextSearchResult",
     "BandPlanSummary",
+    "SpectrumSpan",
+    "RangeCoverage",
+    "ModeCoverage",
+    "BandCoverage",
+    "PrivilegeCheck",
+    "PrivilegeQuery",
+    "PrivilegeBatchRequest",
+    "PrivilegeSpan",
+    "PrivilegeMap",
 ]
@@ -8,9 +8,9 @@ liberally to accommodate missing data.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class APRSLocationRecord(BaseModel):
@@ -66,3 +66,9 @@ class APRSMessageRecord(BaseModel):
     message: Optional[str] = None
     path: Optional[str] = None
     type: Optional[str] = None
+
+
+class APRSBatchRequest(BaseModel):
+    """A batch of callsigns to query in one request."""
+
+    callsigns: List[str] = Field(min_length=1, max_length=1000)
@@ -8,11 +8,17 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BandSegment(BaseModel):
-    """A segment of radio spectrum with specific allocations and rules."""
+    """A segment of radio spectrum with specific allocations and rules.
+
+    Segments are validated once when the band plan loads and then shared
+    between responses, so instances are frozen.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     minFrequency: int  # Frequency in Hz
     maxFrequency: int  # Frequency in Hz
@@ -41,6 +47,12 @@ class FrequencyInfo(BaseModel):
     typicalUses: List[str]  # Common activities at this frequency
 
 
+class FrequencyBatchRequest(BaseModel):
+    """A batch of frequencies to classify in one request."""
+    
+    frequencies: List[str] = Field(max_length=100_000)  # Any parse_frequency format
+
+
 class BandSearchResult(BaseModel):
     """Results from searching the band plan."""
     
@@ -49,6 +61,21 @@ class BandSearchResult(BaseModel):
     bands: List[BandSegment]  # Matching band segments
 
 
+class TextSearchHit(BaseModel):
+    """A band segment matched by full-text search."""
+    
+    score: float  # Relevance; higher is better
+    band: BandSegment
+
+
+class TextSearchResult(BaseModel):
+    """Ranked results of a full-text band plan search."""
+    
+    query: dict  # The search parameters used
+    count: int  # Number of matching segments before the limit
+    results: List[TextSearchHit]  # Best matches first
+
+
 class BandPlanSummary(BaseModel):
     """Summary information about the band plan."""
     
@@ -59,3 +86,94 @@ class BandPlanSummary(BaseModel):
     amateurBands: List[str]  # List of band names (e.g., ["160m", "80m", ...])
     availableModes: List[str]  # All modes in the band plan
     frequencyRange: dict  # {"min": Hz, "max": Hz}
+
+
+class SpectrumSpan(BaseModel):
+    """A contiguous stretch of spectrum ``[start, end)``."""
+    
+    start: int  # First frequency in Hz
+    end: int  # Frequency in Hz just past the span
+    startMHz: float
+    endMHz: float
+    widthHz: int
+    depth: int  # Number of segments covering the span
+
+
+class RangeCoverage(BaseModel):
+    """Allocation, gap and overlap analysis of a frequency range."""
+    
+    start: int  # Range start in Hz
+    end: int  # Range end in Hz (exclusive)
+    startMHz: float
+    endMHz: float
+    allocatedHz: int  # Width covered by an allocated segment
+    unallocatedHz: int  # Width with no allocated segment
+    allocatedFraction: float  # allocatedHz / range width
+    maxDepth: int  # Most segments covering any single frequency
+    gaps: List[SpectrumSpan]  # Unallocated spans
+    overlaps: List[SpectrumSpan]  # Spans covered by two or more segments
+
+
+class ModeCoverage(BaseModel):
+    """How much of an amateur band a mode is allowed on."""
+    
+    mode: str
+    coveredHz: int
+    fraction: float  # coveredHz / band coveredHz
+
+
+class BandCoverage(BaseModel):
+    """Extent of an amateur band and its coverage by mode."""
+    
+    bandName: str
+    start: int  # Lowest segment edge in Hz
+    end: int  # Highest segment edge in Hz
+    startMHz: float
+    endMHz: float
+    coveredHz: int  # Width covered by the band's segments
+    modes: List[ModeCoverage]  # Largest coverage first
+
+
+class PrivilegeCheck(BaseModel):
+    """Whether a license class may transmit at a frequency."""
+    
+    licenseClass: str
+    frequency: int  # The queried frequency in Hz
+    frequencyMHz: float
+    mode: Optional[str] = None  # The queried mode, if any
+    allowed: bool  # In the given mode, or in any mode if none was given
+    allowedModes: List[str]  # Modes the class may use at this frequency
+
+
+class PrivilegeQuery(BaseModel):
+    """One question for a batch privilege check."""
+    
+    licenseClass: str  # e.g., "General"
+    frequency: str  # Any parse_frequency format
+    mode: Optional[str] = None  # e.g., "USB"; any mode if omitted
+
+
+class PrivilegeBatchRequest(BaseModel):
+    """A batch of privilege checks to answer in one request."""
+    
+    checks: List[PrivilegeQuery] = Field(max_length=100_000)
+
+
+class PrivilegeSpan(BaseModel):
+    """A stretch of spectrum ``[start, end)`` usable in the same modes."""
+    
+    start: int  # First frequency in Hz
+    end: int  # Frequency in Hz just past the span
+    startMHz: float
+    endMHz: float
+    widthHz: int
+    modes: List[str]
+
+
+class PrivilegeMap(BaseModel):
+    """All the spectrum a license class may use, for rendering."""
+    
+    licenseClass: str
+    totalHz: int  # Width of all spans
+    modes: List[str]  # Modes usable somewhere
+    spans: List[PrivilegeSpan]  # Sorted by frequency
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Latency benchmark for APRS weather lookups against a stand-in aprs.fi.
+
+Starts a local HTTP server that answers aprs.fi ``wx`` and ``loc`` queries
+after a fixed delay, then times ``get_aprs_weather`` with the response
+cache cleared before each call:
+
+    python scripts/bench_aprs.py [--delay 0.05] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Awaitable, Callable, List
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hamops.adapters import aprs  # noqa: E402
+from hamops.adapters.upstream import close_upstream_client  # noqa: E402
+
+
+def _stand_in_upstream(delay: float) -> ThreadingHTTPServer:
+    """Serve aprs.fi-shaped answers after ``delay`` seconds, in a thread.
+
+    Weather stations whose name starts with ``POS`` report a position in
+    their ``wx`` entries; all others only have one in ``loc``.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            query = parse_qs(urlparse(self.path).query)
+            what = query["what"][0]
+            time.sleep(delay)
+            entries = []
+            for name in query["name"][0].split(","):
+                if what == "wx":
+                    entry = {"name": name, "time": "1", "temp": "20.5"}
+                    if name.startswith("POS"):
+                        entry.update(lat="45.0", lng="-75.0")
+                else:
+                    entry = {"name": name, "time": "1", "lat": "45.0", "lng": "-75.0"}
+                entries.append(entry)
+            body = json.dumps(
+                {"result": "ok", "found": len(entries), "entries": entries}
+            ).encode()
+            self.wfile.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _latencies(call: Callable[[], Awaitable[object]], count: int) -> List[float]:
+    """Time ``count`` sequential calls, in milliseconds."""
+    out = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await call()
+        out.append((time.perf_counter() - start) * 1000)
+    return out
+
+
+def _report(label: str, samples: List[float]) -> None:
+    """Print the p50 and p95 of ``samples``."""
+    cuts = statistics.quantiles(samples, n=20)
+    print(f"  {label:<34}  {statistics.median(samples):>8.1f}  {cuts[18]:>8.1f}")
+
+
+async def bench_weather(count: int) -> None:
+    """Compare a position fallback sent after the wx query with one sent alongside."""
+    cache = aprs.get_aprs_cache()
+
+    async def positioned() -> None:
+        cache.clear()
+        await aprs.get_aprs_weather("POS1")
+
+    async def first_sight() -> None:
+        cache.clear()
+        aprs._wx_unplaced.clear()
+        await aprs.get_aprs_weather("NOPOS1")
+
+    async def remembered() -> None:
+        cache.clear()
+        await aprs.get_aprs_weather("NOPOS1")
+
+    # Open the pooled connections before timing
+    await positioned()
+    await remembered()
+    print("get_aprs_weather, cache cleared per call (milliseconds)")
+    print(f"  {'':<34}  {'p50':>8}  {'p95':>8}")
+    _report("position in wx report", await _latencies(positioned, count))
+    _report("no position, first sight", await _latencies(first_sight, count))
+    _report("no position, remembered", await _latencies(remembered, count))
+    await cache.close()
+    await close_upstream_client()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--delay", type=float, default=0.05, help="upstream response delay (seconds)"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="calls per case")
+    args = parser.parse_args()
+
+    logging.getLogger("hamops").setLevel(logging.WARNING)
+    server = _stand_in_upstream(args.delay)
+    os.environ["APRFI_API_KEY"] = "bench"
+    os.environ["APRS_API_BASE_URL"] = f"http://127.0.0.1:{server.server_port}/api/get"
+    print(f"Stand-in aprs.fi answering after {args.delay * 1000:.0f} ms")
+    try:
+        asyncio.run(bench_weather(args.requests))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
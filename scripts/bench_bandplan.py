@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the band plan query engine.
+
+Run from the repository root after generating the band plan data:
+
+    python scripts/bench_bandplan.py
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hamops.adapters.bandplan import (  # noqa: E402
+    BandPlanAdapter,
+    _parse_frequency,
+    _parse_frequency_cached,
+    parse_frequencies,
+    parse_frequency,
+)
+
+
+def _random_frequencies(adapter: BandPlanAdapter, count: int) -> List[str]:
+    """Build frequency strings spread over the segments of the plan."""
+    rng = random.Random(count)
+    out = []
+    for _ in range(count):
+        band = rng.choice(adapter.bands)
+        low, high = band.minFrequency, max(band.minFrequency, band.maxFrequency)
+        out.append(f"{rng.randint(low, high) / 1_000_000:.6f} MHz")
+    return out
+
+
+def _best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest wall time of ``repeat`` runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _legacy_parse_frequency(freq_str: str) -> Optional[int]:
+    """The original regex + float parser, kept as the benchmark baseline."""
+    if not freq_str:
+        return None
+    freq_str = freq_str.strip().upper().replace(",", "").replace(" ", "")
+    match = re.match(r"^([\d.]+)([KMGH]?HZ)?$", freq_str)
+    if not match:
+        return None
+    try:
+        value = float(match.group(1))
+        unit = match.group(2) or ""
+        if unit == "GHZ":
+            return int(value * 1_000_000_000)
+        elif unit == "MHZ":
+            return int(value * 1_000_000)
+        elif unit == "KHZ":
+            return int(value * 1_000)
+        elif unit == "HZ":
+            return int(value)
+        elif "." in match.group(1) or value < 1000:
+            return int(value * 1_000_000)
+        elif value < 1_000_000:
+            return int(value * 1_000)
+        return int(value)
+    except ValueError:
+        return None
+
+
+def bench_parse_frequency(adapter: BandPlanAdapter) -> None:
+    """Compare the exact parser (cold and memoized) with the legacy parser."""
+    freqs = _random_frequencies(adapter, 50_000)
+    # Typical traffic repeats a small working set of frequencies
+    repeated = [freqs[i % 500] for i in range(50_000)]
+
+    def legacy() -> None:
+        for freq in freqs:
+            _legacy_parse_frequency(freq)
+
+    def exact_uncached() -> None:
+        for freq in freqs:
+            _parse_frequency(freq)
+
+    def exact_cold() -> None:
+        _parse_frequency_cached.cache_clear()
+        for freq in freqs:
+            parse_frequency(freq)
+
+    def exact_warm() -> None:
+        for freq in repeated:
+            parse_frequency(freq)
+
+    def exact_batch() -> None:
+        parse_frequencies(repeated)
+
+    mismatches = sum(
+        1 for freq in freqs if _legacy_parse_frequency(freq) != parse_frequency(freq)
+    )
+    print("Frequency parsing (strings/second, 50k inputs)")
+    for label, fn in (
+        ("legacy regex + float", legacy),
+        ("exact, no memo", exact_uncached),
+        ("exact, unique inputs", exact_cold),
+        ("exact, repeated inputs", exact_warm),
+        ("exact batch, repeated", exact_batch),
+    ):
+        print(f"  {label:<24}  {len(freqs) / _best_of(fn):>12,.0f}")
+    print(f"  legacy results off by float rounding: {mismatches:,} of {len(freqs):,}")
+
+
+def bench_batch_classification(adapter: BandPlanAdapter) -> None:
+    """Compare per-frequency lookups with the sorted merge-sweep batch API."""
+    print("Batch frequency classification, in process (frequencies/second)")
+    print(f"  {'batch':>8}  {'single':>12}  {'batch':>12}  {'speedup':>8}")
+    for size in (1, 10, 100, 1_000, 10_000, 100_000):
+        freqs = _random_frequencies(adapter, size)
+
+        def single() -> None:
+            for freq in freqs:
+                adapter.get_frequency_info_json(adapter.parse_frequency(freq))
+
+        def batch() -> None:
+            adapter.get_frequency_info_batch_json(freqs)
+
+        repeat = 5 if size <= 10_000 else 2
+        t_single = _best_of(single, repeat)
+        t_batch = _best_of(batch, repeat)
+        print(
+            f"  {size:>8}  {size / t_single:>12,.0f}  {size / t_batch:>12,.0f}"
+            f"  {t_single / t_batch:>7.2f}x"
+        )
+
+
+def bench_batch_http(adapter: BandPlanAdapter) -> None:
+    """Compare one request per frequency with a single batch request."""
+    from fastapi.testclient import TestClient
+
+    from hamops.main import app
+
+    client = TestClient(app)
+    print("Batch frequency classification, over HTTP (frequencies/second)")
+    print(f"  {'batch':>8}  {'per-request':>12}  {'batch':>12}  {'speedup':>8}")
+    for size in (1, 10, 100, 1_000, 10_000):
+        freqs = _random_frequencies(adapter, size)
+        # Time a bounded sample of single requests; the rate is per frequency.
+        sample = freqs[:500]
+
+        def single() -> None:
+            for freq in sample:
+                client.get(f"/api/bands/frequency/{freq}")
+
+        def batch() -> None:
+            client.post("/api/bands/frequencies", json={"frequencies": freqs})
+
+        single_rate = len(sample) / _best_of(single, 2)
+        batch_rate = size / _best_of(batch, 3)
+        print(
+            f"  {size:>8}  {single_rate:>12,.0f}  {batch_rate:>12,.0f}"
+            f"  {batch_rate / single_rate:>7.2f}x"
+        )
+
+
+def main():
+    """Run all benchmarks."""
+    logging.getLogger("hamops").setLevel(logging.WARNING)
+    adapter = BandPlanAdapter()
+    if not adapter.bands:
+        print("✗ Band plan data not loaded. Run scripts/gen_bandplan.py first.")
+        sys.exit(1)
+    bench_parse_frequency(adapter)
+    bench_batch_classification(adapter)
+    bench_batch_http(adapter)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,61 @@
 #!/usr/bin/env python3
-"""Script to fetch and process US band plan data from SDR-Band-Plans repo.
+"""Script to fetch and process band plan data from SDR-Band-Plans repo.
 
-This script fetches the US Amateur Radio band plan XML from the GitHub repo
-and converts it to a structured JSON format for efficient querying.
+This script fetches a region's band plan XML from the GitHub repo (the US
+plan by default) and converts it to a structured JSON format for efficient
+querying.  It also writes a compact binary image of the plan
+(``{region}_bandplan.bin``) with the runtime indices prebuilt, which the
+API memory-maps on startup.
+
+Refreshes are incremental: downloads are conditional on the cached ETag
+and Last-Modified, only entries whose content changed are re-enriched,
+and a diff of added, removed and changed segments is written next to the
+cache (``.cache/bandplan/<region>/diff.json``).
+
+Usage:
+    python scripts/gen_bandplan.py                # fetch, write JSON + image
+    python scripts/gen_bandplan.py --image-only   # rebuild image from JSON
+    python scripts/gen_bandplan.py --offline      # build from the cached XML
+    python scripts/gen_bandplan.py --region uk --upstream-dir UK \\
+        --country "United Kingdom"                # another region's plan
+    python scripts/gen_bandplan.py --all-regions  # every region, in parallel
+    python scripts/gen_bandplan.py --all-regions \\
+        --source-dir ../SDR-Band-Plans            # from a local checkout
 """
 
+import argparse
+import hashlib
+import inspect
+import io
 import json
+import os
+import re
+import sys
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
 
 import httpx
 
+# Allow importing the hamops package when run as ``python scripts/...``
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+UPSTREAM_URL = "https://raw.githubusercontent.com/Arrin-KN1E/SDR-Band-Plans/master"
+UPSTREAM_TREE_URL = (
+    "https://api.github.com/repos/Arrin-KN1E/SDR-Band-Plans/git/trees/master?recursive=1"
+)
+
+# Region codes the API accepts (see ``BandPlanRegistry``).  Checked here
+# rather than imported so that a no-op refresh does not load the app.
+REGION_CODE = re.compile(r"[a-z0-9][a-z0-9_-]*")
+
+# Country names for regions whose upstream folder name is not descriptive
+COUNTRY_NAMES = {"us": "United States"}
+
 
 def parse_frequency(freq_str: str) -> int:
     """Convert frequency string to Hz.
@@ -39,62 +83,109 @@ def parse_frequency(freq_str: str) -> int:
     return freq_val * 1000
 
 
-def fetch_bandplan_xml() -> str:
-    """Fetch the US Amateur Radio band plan XML from GitHub."""
-    # The file is located at US/SDR#/BandPlan.xml
+def bandplan_url(upstream_dir: str = "US", base_url: str = UPSTREAM_URL) -> str:
+    """URL of a region's band plan XML on GitHub."""
+    # The file is located at <region>/SDR#/BandPlan.xml
     # The # character needs to be URL encoded as %23
-    url = "https://raw.githubusercontent.com/Arrin-KN1E/SDR-Band-Plans/master/US/SDR%23/BandPlan.xml"
+    return f"{base_url}/{quote(upstream_dir)}/{quote('SDR#')}/BandPlan.xml"
+
+
+def fetch_bandplan_xml(
+    upstream_dir: str = "US",
+    validators: Optional[Dict[str, str]] = None,
+    base_url: str = UPSTREAM_URL,
+) -> Tuple[Optional[str], Dict[str, str]]:
+    """Fetch a region's band plan XML from GitHub.
+
+    ``validators`` holds the ``etag`` and ``lastModified`` of a previous
+    response; when given, the request is conditional.
+
+    Returns:
+        The XML, or None if the server answered 304 Not Modified, and the
+        validators of this response
+    """
+    url = bandplan_url(upstream_dir, base_url)
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("lastModified"):
+            headers["If-Modified-Since"] = validators["lastModified"]
     
     print(f"Fetching band plan from: {url}")
     
     with httpx.Client() as client:
-        response = client.get(url, follow_redirects=True)
+        response = client.get(url, headers=headers, follow_redirects=True)
+        if response.status_code == 304:
+            return None, dict(validators or {})
         response.raise_for_status()
-        return response.text
+        return response.text, {
+            "etag": response.headers.get("ETag"),
+            "lastModified": response.headers.get("Last-Modified"),
+        }
 
 
-def parse_bandplan_xml(xml_content: str) -> List[Dict[str, Any]]:
-    """Parse the SDR# band plan XML format."""
-    root = ET.fromstring(xml_content)
+def _parse_entry(entry: ET.Element) -> Optional[Dict[str, Any]]:
+    """Convert one ``RangeEntry`` element into a band dict."""
+    # Extract attributes
+    minfreq = entry.get("minFrequency")
+    maxfreq = entry.get("maxFrequency")
     
-    bands = []
-    
-    # SDR# format has RangeEntry elements
-    for entry in root.findall(".//RangeEntry"):
-        # Extract attributes
-        minfreq = entry.get("minFrequency")
-        maxfreq = entry.get("maxFrequency")
+    if not minfreq or not maxfreq:
+        return None
         
-        if not minfreq or not maxfreq:
-            continue
-            
-        band = {
-            "minFrequency": parse_frequency(minfreq),
-            "maxFrequency": parse_frequency(maxfreq),
-            "minFrequencyDisplay": minfreq,
-            "maxFrequencyDisplay": maxfreq,
-        }
-        
-        # Add optional attributes if present
-        if entry.get("mode"):
-            band["mode"] = entry.get("mode")
-        
-        if entry.get("step"):
-            band["step"] = int(entry.get("step"))
-            
-        if entry.get("color"):
-            band["color"] = entry.get("color")
-            
-        # The text content often contains the band description
-        if entry.text and entry.text.strip():
-            band["description"] = entry.text.strip()
+    band = {
+        "minFrequency": parse_frequency(minfreq),
+        "maxFrequency": parse_frequency(maxfreq),
+        "minFrequencyDisplay": minfreq,
+        "maxFrequencyDisplay": maxfreq,
+    }
+    
+    # Add optional attributes if present
+    if entry.get("mode"):
+        band["mode"] = entry.get("mode")
+    
+    if entry.get("step"):
+        band["step"] = int(entry.get("step"))
         
-        # Some entries have additional info in attributes
-        for attr in ["name", "comment", "info"]:
-            if entry.get(attr):
-                band[attr] = entry.get(attr)
+    if entry.get("color"):
+        band["color"] = entry.get("color")
         
-        bands.append(band)
+    # The text content often contains the band description
+    if entry.text and entry.text.strip():
+        band["description"] = entry.text.strip()
+    
+    # Some entries have additional info in attributes
+    for attr in ["name", "comment", "info"]:
+        if entry.get(attr):
+            band[attr] = entry.get(attr)
+    
+    return band
+
+
+def parse_bandplan_xml(source: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Parse the SDR# band plan XML format.
+
+    ``source`` is the XML text or the path of an XML file.  The document
+    is stream-parsed and each entry is detached from the root once read,
+    so the parsed tree does not grow with the size of the document.
+    """
+    stream = open(source, "rb") if isinstance(source, Path) else io.StringIO(source)
+    bands = []
+    
+    # SDR# format has RangeEntry elements
+    with stream:
+        root = None
+        for event, entry in ET.iterparse(stream, events=("start", "end")):
+            if root is None:
+                root = entry
+            if event != "end" or entry.tag != "RangeEntry":
+                continue
+            band = _parse_entry(entry)
+            # Entries sit directly under the root; drop every finished one
+            root.clear()
+            if band:
+                bands.append(band)
     
     # Sort by minimum frequency
     bands.sort(key=lambda x: x["minFrequency"])
@@ -105,98 +196,13 @@ def parse_bandplan_xml(xml_content: str) -> List[Dict[str, Any]]:
 def enrich_band_data(bands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Add additional metadata to band entries based on frequency ranges.
     
-    This adds standard amateur radio band names, license classes, and typical uses.
+    This adds standard amateur radio band names, license classes, and typical
+    uses.  The rules live in ``hamops.adapters.bandplan_classifier`` so the
+    API can apply them to other plans at runtime.
     """
+    from hamops.adapters.bandplan_classifier import get_band_classifier
     
-    # Define amateur radio bands with their typical ranges (in Hz)
-    amateur_bands = {
-        "2200m": (135_700, 137_800),
-        "630m": (472_000, 479_000),
-        "160m": (1_800_000, 2_000_000),
-        "80m": (3_500_000, 4_000_000),
-        "60m": (5_330_500, 5_406_400),
-        "40m": (7_000_000, 7_300_000),
-        "30m": (10_100_000, 10_150_000),
-        "20m": (14_000_000, 14_350_000),
-        "17m": (18_068_000, 18_168_000),
-        "15m": (21_000_000, 21_450_000),
-        "12m": (24_890_000, 24_990_000),
-        "10m": (28_000_000, 29_700_000),
-        "6m": (50_000_000, 54_000_000),
-        "2m": (144_000_000, 148_000_000),
-        "1.25m": (219_000_000, 225_000_000),
-        "70cm": (420_000_000, 450_000_000),
-        "33cm": (902_000_000, 928_000_000),
-        "23cm": (1_240_000_000, 1_300_000_000),
-        "13cm": (2_300_000_000, 2_450_000_000),
-    }
-    
-    # License class privileges (simplified - actual rules are more complex)
-    license_privileges = {
-        "CW": ["Extra", "Advanced", "General", "Technician"],
-        "Phone": ["Extra", "Advanced", "General", "Technician"],
-        "Digital": ["Extra", "Advanced", "General", "Technician"],
-        "Data": ["Extra", "Advanced", "General", "Technician"],
-    }
-    
-    for band in bands:
-        min_freq = band["minFrequency"]
-        max_freq = band["maxFrequency"]
-        center_freq = (min_freq + max_freq) / 2
-        
-        # Determine which amateur band this belongs to
-        for band_name, (band_min, band_max) in amateur_bands.items():
-            if band_min <= center_freq <= band_max:
-                band["bandName"] = band_name
-                break
-        
-        # Add frequency display in MHz for readability
-        band["minFrequencyMHz"] = round(min_freq / 1_000_000, 6)
-        band["maxFrequencyMHz"] = round(max_freq / 1_000_000, 6)
-        
-        # Determine license class based on frequency and mode
-        # This is simplified - actual rules depend on specific frequency segments
-        if "description" in band:
-            desc_lower = band["description"].lower()
-            
-            # Extra class segments typically mentioned explicitly
-            if "extra" in desc_lower:
-                band["licenseClass"] = ["Extra"]
-            elif "advanced" in desc_lower:
-                band["licenseClass"] = ["Extra", "Advanced"]
-            elif "general" in desc_lower:
-                band["licenseClass"] = ["Extra", "Advanced", "General"]
-            elif "technician" in desc_lower or center_freq > 50_000_000:
-                # VHF/UHF typically available to all
-                band["licenseClass"] = ["Extra", "Advanced", "General", "Technician"]
-            elif "novice" in desc_lower:
-                band["licenseClass"] = ["Extra", "Advanced", "General", "Technician", "Novice"]
-            
-            # Identify common uses
-            uses = []
-            if "cw" in desc_lower or "morse" in desc_lower:
-                uses.append("CW")
-            if "phone" in desc_lower or "ssb" in desc_lower or "voice" in desc_lower:
-                uses.append("Phone")
-            if "digital" in desc_lower or "rtty" in desc_lower or "psk" in desc_lower:
-                uses.append("Digital")
-            if "data" in desc_lower or "packet" in desc_lower:
-                uses.append("Data")
-            if "fm" in desc_lower or "repeater" in desc_lower:
-                uses.append("FM")
-            if "eme" in desc_lower or "moonbounce" in desc_lower:
-                uses.append("EME")
-            if "satellite" in desc_lower:
-                uses.append("Satellite")
-            if "beacon" in desc_lower:
-                uses.append("Beacon")
-            if "emergency" in desc_lower or "ares" in desc_lower:
-                uses.append("Emergency")
-            
-            if uses:
-                band["typicalUses"] = uses
-    
-    return bands
+    return get_band_classifier().enrich_all(bands)
 
 
 def generate_index(bands: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -246,55 +252,611 @@ def generate_index(bands: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def entry_hash(entry: Dict[str, Any]) -> str:
+    """Content hash of a parsed, not yet enriched, band plan entry."""
+    return _sha256(json.dumps(entry, sort_keys=True, separators=(",", ":")))
+
+
+def write_file_atomic(path: Path, content: Union[str, bytes]) -> None:
+    """Replace ``path`` with ``content`` without rewriting it in place.
+
+    A running server maps the band plan image it serves, so the new file
+    is written beside it and renamed over it; the old file stays intact
+    until the last snapshot reading it is dropped.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    if isinstance(content, bytes):
+        tmp.write_bytes(content)
+    else:
+        tmp.write_text(content)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=None)
+def enrichment_version() -> str:
+    """Fingerprint of the code that turns XML entries into segments.
+
+    Cached enrichment results are only reused while this is unchanged, so
+    editing the parsing or enrichment rules forces a full rebuild.  The
+    first call in a process imports the ``hamops`` package.
+    """
+    from hamops.adapters import bandplan_classifier
+    
+    source = "".join(
+        inspect.getsource(code)
+        for code in (parse_frequency, _parse_entry, bandplan_classifier)
+    )
+    return _sha256(source)[:16]
+
+
+class BuildCache:
+    """Per-region state kept between runs in the cache directory.
+
+    Holds the last downloaded XML, its HTTP validators, a fingerprint of
+    the last build's inputs, and the enriched form of every entry keyed by
+    its content hash.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.xml_file = directory / "BandPlan.xml"
+        self.state_file = directory / "state.json"
+        self.entries_file = directory / "entries.json"
+        self.state: Dict[str, Any] = self._read(self.state_file)
+
+    @staticmethod
+    def _read(path: Path) -> Dict[str, Any]:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, path: Path, data: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        tmp.replace(path)
+
+    def validators(self) -> Dict[str, str]:
+        """ETag and Last-Modified of the cached XML, if any."""
+        if not self.xml_file.exists():
+            return {}
+        return self.state.get("validators", {})
+
+    def read_xml(self) -> Optional[str]:
+        """Return the cached XML, or None if nothing has been fetched yet."""
+        try:
+            return self.xml_file.read_text()
+        except OSError:
+            return None
+
+    def store_xml(
+        self, xml_content: str, validators: Dict[str, str], upstream_dir: str
+    ) -> None:
+        """Cache a downloaded XML together with its validators and origin."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.xml_file.write_text(xml_content)
+        self.state["validators"] = validators
+        self.state["upstreamDir"] = upstream_dir
+        self._write(self.state_file, self.state)
+
+    def build_key(self) -> Optional[str]:
+        return self.state.get("buildKey")
+
+    def store_build_key(self, key: str) -> None:
+        self.state["buildKey"] = key
+        self._write(self.state_file, self.state)
+
+    def entries(self, version: str) -> Dict[str, Dict[str, Any]]:
+        """Enriched entries from the last build, if made by the same code."""
+        cached = self._read(self.entries_file)
+        if cached.get("version") != version:
+            return {}
+        return cached.get("entries", {})
+
+    def store_entries(self, version: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        self._write(self.entries_file, {"version": version, "entries": entries})
+
+
+def enrich_incremental(
+    bands: List[Dict[str, Any]], cache: BuildCache
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Enrich entries, reusing cached results for unchanged ones.
+
+    ``enrich_band_data`` treats every entry on its own, so an entry whose
+    content hash was seen in the previous build gets the same result.
+
+    Returns:
+        The enriched entries and how many of them had to be enriched
+    """
+    version = enrichment_version()
+    cached = cache.entries(version)
+    hashes = [entry_hash(band) for band in bands]
+    fresh = [band for band, digest in zip(bands, hashes) if digest not in cached]
+    enriched = dict(zip(
+        (digest for digest in hashes if digest not in cached),
+        enrich_band_data(fresh),
+    ))
+    result = []
+    for digest in hashes:
+        band = enriched.get(digest) or cached[digest]
+        # Copy so duplicate entries do not share one dict
+        result.append(dict(band))
+    cache.store_entries(version, {**{d: cached[d] for d in hashes if d in cached}, **enriched})
+    return result, len(fresh)
+
+
+def _segment_key(band: Dict[str, Any]) -> Tuple[int, int]:
+    return band["minFrequency"], band["maxFrequency"]
+
+
+def diff_bands(
+    previous: List[Dict[str, Any]], current: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Compare two segment lists keyed by their frequency edges.
+
+    Segments with the same edges are matched in order, so repeated edges
+    still pair up.  Changed segments list only the fields that differ.
+    """
+    def keyed(bands: List[Dict[str, Any]]) -> Dict[Tuple[int, int, int], Dict[str, Any]]:
+        seen: Dict[Tuple[int, int], int] = {}
+        out = {}
+        for band in bands:
+            key = _segment_key(band)
+            seen[key] = seen.get(key, 0) + 1
+            out[key + (seen[key],)] = band
+        return out
+
+    before = keyed(previous)
+    after = keyed(current)
+    changed = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        fields = sorted(k for k in old.keys() | new.keys() if old.get(k) != new.get(k))
+        if fields:
+            changed.append({
+                "minFrequency": key[0],
+                "maxFrequency": key[1],
+                "before": {k: old[k] for k in fields if k in old},
+                "after": {k: new[k] for k in fields if k in new},
+            })
+    return {
+        "added": [after[k] for k in sorted(after.keys() - before.keys())],
+        "removed": [before[k] for k in sorted(before.keys() - after.keys())],
+        "changed": changed,
+        "unchanged": len(before.keys() & after.keys()) - len(changed),
+    }
+
+
+def write_bandplan_image(json_file: Path) -> Path:
+    """Build the binary image for a band plan JSON file.
+
+    The plan is loaded through ``BandPlanSnapshot`` so the image carries
+    exactly the indices the API would otherwise build at startup.
+    """
+    from hamops.adapters.bandplan import BandPlanSnapshot
+    from hamops.adapters.bandplan_binary import pack_bandplan
+
+    snapshot = BandPlanSnapshot(data_file=json_file, prefer_image=False)
+    if not snapshot.bands:
+        raise RuntimeError(f"No band plan segments loaded from {json_file}")
+
+    image_file = json_file.with_suffix(".bin")
+    write_file_atomic(image_file, pack_bandplan(snapshot))
+    return image_file
+
+
+def image_is_current(json_file: Path) -> bool:
+    """Whether ``json_file`` has an image of this format built from it.
+
+    The plan hash is that of the JSON file's bytes, as the API computes
+    it when deciding whether to map the image.
+    """
+    from hamops.adapters.bandplan_binary import read_image_meta
+
+    meta = read_image_meta(json_file.with_suffix(".bin"))
+    return meta is not None and meta.get("planHash") == _file_sha256(json_file)[:16]
+
+
+def region_code(upstream_dir: str) -> str:
+    """Derive the API region code from an upstream folder name."""
+    return re.sub(r"[^a-z0-9_-]+", "-", upstream_dir.lower()).strip("-_")
+
+
+def local_bandplan_file(source_dir: Path, upstream_dir: str) -> Path:
+    """Path of a region's band plan XML in a local SDR-Band-Plans checkout."""
+    return source_dir / upstream_dir / "SDR#" / "BandPlan.xml"
+
+
+def discover_regions(source_dir: Optional[Path] = None) -> List[str]:
+    """List the upstream folders that hold an SDR# band plan, sorted.
+
+    Reads a local checkout when ``source_dir`` is given; otherwise asks
+    the GitHub API for the repository tree in a single request.
+    """
+    if source_dir is not None:
+        return sorted(
+            path.parent.parent.name
+            for path in source_dir.glob("*/SDR#/BandPlan.xml")
+        )
+    print(f"Listing regions from: {UPSTREAM_TREE_URL}")
+    with httpx.Client() as client:
+        response = client.get(UPSTREAM_TREE_URL, follow_redirects=True)
+        response.raise_for_status()
+    return sorted(
+        item["path"].split("/")[0]
+        for item in response.json().get("tree", [])
+        if re.fullmatch(r"[^/]+/SDR#/BandPlan\.xml", item["path"])
+    )
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_region(
+    region: str,
+    country: str,
+    upstream_dir: str,
+    data_dir: Path,
+    cache_dir: Path,
+    source_file: Optional[Path] = None,
+    upstream_url: str = UPSTREAM_URL,
+    offline: bool = False,
+    force: bool = False,
+    diff_file: Optional[Path] = None,
+    prefix: str = "",
+) -> Dict[str, Any]:
+    """Fetch, parse, enrich, index and write one region's band plan.
+
+    Runs in a worker process when several regions are built at once, so
+    it takes and returns only plain picklable values.  The XML comes from
+    ``source_file`` when given, from the cache when ``offline``, and from
+    GitHub otherwise.
+
+    Returns:
+        Outcome and per-stage timings (ms) for the region
+    """
+    started = time.perf_counter()
+    stats: Dict[str, Any] = {"region": region, "country": country, "timings": {}}
+    
+    def log(message: str) -> None:
+        # One write per line keeps lines whole when workers share stdout
+        print(f"{prefix}{message}\n", end="", flush=True)
+    
+    def lap(stage: str, since: float) -> float:
+        now = time.perf_counter()
+        stats["timings"][stage] = round((now - since) * 1000, 2)
+        return now
+    
+    def finish(status: str) -> Dict[str, Any]:
+        stats["status"] = status
+        lap("total", started)
+        return stats
+    
+    output_file = data_dir / f"{region}_bandplan.json"
+    image_file = output_file.with_suffix(".bin")
+    cache = BuildCache(cache_dir / region)
+    diff_file = diff_file or cache.directory / "diff.json"
+    have_output = output_file.exists() and image_file.exists()
+    stats["output"] = str(output_file)
+    
+    # Fetch the XML, or reuse the local or cached copy
+    mark = time.perf_counter()
+    if source_file is not None:
+        source: Union[str, Path] = source_file
+        source_hash = _file_sha256(source_file)
+        log(f"Reading band plan XML from {source_file}")
+    elif offline:
+        if not cache.xml_file.exists():
+            raise RuntimeError(f"No cached XML in {cache.directory}; run once online")
+        source = cache.xml_file
+        source_hash = _file_sha256(source)
+        log(f"Using cached band plan XML from {cache.xml_file}")
+    else:
+        log(f"Fetching {country} band plan...")
+        validators = {} if force or not have_output else cache.validators()
+        xml_content, validators = fetch_bandplan_xml(
+            upstream_dir, validators, upstream_url
+        )
+        if xml_content is None:
+            log("✓ Upstream band plan not modified (304); nothing to do")
+            lap("fetch", mark)
+            return finish("not-modified")
+        cache.store_xml(xml_content, validators, upstream_dir)
+        source = xml_content
+        source_hash = _sha256(xml_content)
+    mark = lap("fetch", mark)
+    
+    # Skip the build when its inputs are exactly those of the last one
+    # (timed on its own: the first call in a process imports hamops)
+    build_key = _sha256(
+        json.dumps([source_hash, country, region, enrichment_version()])
+    )
+    mark = lap("key", mark)
+    if have_output and not force and build_key == cache.build_key():
+        if image_is_current(output_file):
+            log("✓ Band plan XML unchanged since the last build; nothing to do")
+            return finish("unchanged")
+        image_file = write_bandplan_image(output_file)
+        log(f"✓ Band plan XML unchanged; rebuilt stale image {image_file}")
+        lap("image", mark)
+        return finish("image-rebuilt")
+    
+    # Parse the XML
+    log("Parsing band plan XML...")
+    bands = parse_bandplan_xml(source)
+    stats["segments"] = len(bands)
+    log(f"Found {len(bands)} band entries")
+    mark = lap("parse", mark)
+    
+    # Enrich with additional metadata, reusing unchanged entries
+    log("Enriching band data...")
+    bands, enriched = enrich_incremental(bands, cache)
+    stats["enriched"] = enriched
+    log(f"  Enriched {enriched} new or changed entries, reused {len(bands) - enriched}")
+    mark = lap("enrich", mark)
+    
+    # Generate indices
+    log("Generating search indices...")
+    indices = generate_index(bands)
+    mark = lap("index", mark)
+    
+    # Combine into final structure
+    bandplan_data = {
+        "version": "1.0",
+        "source": "https://github.com/Arrin-KN1E/SDR-Band-Plans",
+        "country": country,
+        "region": region,
+        "bands": bands,
+        "indices": indices
+    }
+    
+    # Compare with the previous build
+    try:
+        with open(output_file) as f:
+            previous = json.load(f).get("bands", [])
+    except (OSError, ValueError):
+        previous = []
+    diff = diff_bands(previous, bands)
+    diff_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(diff_file, "w") as f:
+        json.dump({
+            "region": region,
+            "generatedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            **diff,
+        }, f, indent=2)
+    stats["diff"] = {
+        key: len(diff[key]) for key in ("added", "removed", "changed")
+    }
+    log(
+        f"  Diff: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+        f"{len(diff['changed'])} changed ({diff_file})"
+    )
+    mark = lap("diff", mark)
+    
+    # Write to JSON file, only if its content changed
+    content = json.dumps(bandplan_data, indent=2)
+    if have_output and output_file.read_text() == content:
+        log(f"✓ {output_file} already up to date")
+        status = "up-to-date"
+        if not image_is_current(output_file):
+            image_file = write_bandplan_image(output_file)
+            log(f"✓ Rebuilt stale image {image_file}")
+            mark = lap("image", mark)
+            status = "image-rebuilt"
+    else:
+        log(f"Writing to {output_file}...")
+        write_file_atomic(output_file, content)
+        log(f"✓ Successfully generated band plan with {len(bands)} entries")
+        mark = lap("write", mark)
+        
+        # Write the binary image used for fast startup
+        image_file = write_bandplan_image(output_file)
+        log(f"✓ Wrote {image_file} ({image_file.stat().st_size:,} bytes)")
+        mark = lap("image", mark)
+        status = "built"
+    cache.store_build_key(build_key)
+    
+    # Print some statistics
+    band_names = set(b.get("bandName") for b in bands if "bandName" in b)
+    modes = set(b.get("mode") for b in bands if "mode" in b)
+    
+    log(f"  Amateur bands covered: {', '.join(sorted(band_names))}")
+    log(f"  Modes found: {', '.join(sorted(modes))}")
+    return finish(status)
+
+
+def _build_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run ``build_region`` in a worker, reporting failures as results."""
+    try:
+        return build_region(**job)
+    except Exception as e:
+        print(f"{job['prefix']}✗ Error generating band plan: {e}\n", end="", flush=True)
+        return {"region": job["region"], "status": "failed", "error": str(e)}
+
+
+def build_all_regions(jobs: List[Dict[str, Any]], workers: Optional[int]) -> List[Dict[str, Any]]:
+    """Build several regions in parallel, one process per region at a time.
+
+    Parsing, enrichment and indexing are CPU-bound Python, so regions are
+    fanned out over a ``ProcessPoolExecutor`` rather than threads.
+    Results come back in the order of ``jobs``.
+    """
+    if workers == 1 or len(jobs) < 2:
+        return [_build_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_job, jobs))
+
+
+def print_build_stats(results: List[Dict[str, Any]], elapsed_ms: float) -> None:
+    """Print one line of timings per region and the overall wall time."""
+    stages = ("fetch", "key", "parse", "enrich", "index", "diff", "write", "image", "total")
+    print(f"{'region':<12}{'status':<14}{'segments':>9}" + "".join(f"{s:>9}" for s in stages))
+    for result in results:
+        timings = result.get("timings", {})
+        print(
+            f"{result['region']:<12}{result['status']:<14}{result.get('segments', ''):>9}"
+            + "".join(f"{timings.get(s, ''):>9}" for s in stages)
+        )
+    serial = sum(r.get("timings", {}).get("total", 0) for r in results)
+    print(f"Built {len(results)} regions in {elapsed_ms:.0f} ms ({serial:.0f} ms of region work)")
+
+
 def main():
     """Main script execution."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--image-only",
+        action="store_true",
+        help="Rebuild the binary image from the existing JSON without fetching",
+    )
+    parser.add_argument(
+        "--region",
+        default="us",
+        help="Region code the API serves the plan under (default: us)",
+    )
+    parser.add_argument(
+        "--upstream-dir",
+        help="Region folder in SDR-Band-Plans (default: region code in upper case)",
+    )
+    parser.add_argument(
+        "--country",
+        help="Country name recorded in the plan metadata",
+    )
+    parser.add_argument(
+        "--all-regions",
+        action="store_true",
+        help="Build every region in SDR-Band-Plans, in parallel",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for --all-regions (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--source-dir",
+        type=Path,
+        help="Build from a local SDR-Band-Plans checkout instead of GitHub",
+    )
+    parser.add_argument(
+        "--upstream-url",
+        default=UPSTREAM_URL,
+        help="Base URL of the SDR-Band-Plans repository or a mirror of it",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(".cache/bandplan"),
+        help="Where downloads and per-entry results are kept between runs",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Build from the cached XML without contacting GitHub",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Fetch and rebuild everything even if nothing changed",
+    )
+    parser.add_argument(
+        "--diff-file",
+        type=Path,
+        help="Where to write the segment diff (default: <cache-dir>/<region>/diff.json)",
+    )
+    args = parser.parse_args()
+    
     # Create data directory if it doesn't exist
     data_dir = Path("hamops/data")
     data_dir.mkdir(parents=True, exist_ok=True)
     
-    output_file = data_dir / "us_bandplan.json"
+    common = {
+        "data_dir": data_dir,
+        "cache_dir": args.cache_dir,
+        "upstream_url": args.upstream_url,
+        "offline": args.offline,
+        "force": args.force,
+    }
+    
+    if args.all_regions:
+        if args.country or args.upstream_dir or args.diff_file or args.image_only:
+            parser.error(
+                "--all-regions cannot be combined with --country, --upstream-dir, "
+                "--diff-file or --image-only"
+            )
+        if args.offline and args.source_dir is None:
+            upstream_dirs = sorted(
+                json.loads((path / "state.json").read_text()).get("upstreamDir", "")
+                for path in args.cache_dir.glob("*")
+                if (path / "BandPlan.xml").exists() and (path / "state.json").exists()
+            )
+        else:
+            upstream_dirs = discover_regions(args.source_dir)
+        jobs = []
+        for upstream_dir in filter(None, upstream_dirs):
+            region = region_code(upstream_dir)
+            if not REGION_CODE.fullmatch(region):
+                print(f"Skipping {upstream_dir!r}: no usable region code")
+                continue
+            jobs.append({
+                **common,
+                "region": region,
+                "country": COUNTRY_NAMES.get(region, upstream_dir),
+                "upstream_dir": upstream_dir,
+                "source_file": (
+                    local_bandplan_file(args.source_dir, upstream_dir)
+                    if args.source_dir else None
+                ),
+                "prefix": f"[{region}] ",
+            })
+        print(f"Building {len(jobs)} regions...")
+        started = time.perf_counter()
+        results = build_all_regions(jobs, args.jobs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print_build_stats(results, elapsed_ms)
+        stats_file = args.cache_dir / "build_stats.json"
+        stats_file.parent.mkdir(parents=True, exist_ok=True)
+        stats_file.write_text(json.dumps(
+            {"elapsedMs": round(elapsed_ms, 2), "regions": results}, indent=2
+        ))
+        print(f"Timing statistics written to {stats_file}")
+        if any(result["status"] == "failed" for result in results):
+            sys.exit(1)
+        return
+    
+    region = args.region.strip().lower()
+    if not REGION_CODE.fullmatch(region):
+        parser.error(f"invalid region code: {args.region!r}")
+    upstream_dir = args.upstream_dir or region.upper()
+    country = args.country or COUNTRY_NAMES.get(region, upstream_dir)
+    output_file = data_dir / f"{region}_bandplan.json"
+    
+    if args.image_only:
+        image_file = write_bandplan_image(output_file)
+        print(f"✓ Wrote {image_file} ({image_file.stat().st_size:,} bytes)")
+        return
     
     try:
-        # Fetch the XML
-        print("Fetching US Amateur Radio band plan...")
-        xml_content = fetch_bandplan_xml()
-        
-        # Parse the XML
-        print("Parsing band plan XML...")
-        bands = parse_bandplan_xml(xml_content)
-        print(f"Found {len(bands)} band entries")
-        
-        # Enrich with additional metadata
-        print("Enriching band data...")
-        bands = enrich_band_data(bands)
-        
-        # Generate indices
-        print("Generating search indices...")
-        indices = generate_index(bands)
-        
-        # Combine into final structure
-        bandplan_data = {
-            "version": "1.0",
-            "source": "https://github.com/Arrin-KN1E/SDR-Band-Plans",
-            "country": "United States",
-            "bands": bands,
-            "indices": indices
-        }
-        
-        # Write to JSON file
-        print(f"Writing to {output_file}...")
-        with open(output_file, "w") as f:
-            json.dump(bandplan_data, f, indent=2)
-        
-        print(f"✓ Successfully generated band plan with {len(bands)} entries")
-        
-        # Print some statistics
-        band_names = set(b.get("bandName") for b in bands if "bandName" in b)
-        modes = set(b.get("mode") for b in bands if "mode" in b)
-        
-        print(f"  Amateur bands covered: {', '.join(sorted(band_names))}")
-        print(f"  Modes found: {', '.join(sorted(modes))}")
-        
+        build_region(
+            **common,
+            region=region,
+            country=country,
+            upstream_dir=upstream_dir,
+            source_file=(
+                local_bandplan_file(args.source_dir, upstream_dir)
+                if args.source_dir else None
+            ),
+            diff_file=args.diff_file,
+        )
     except Exception as e:
         print(f"✗ Error generating band plan: {e}")
         raise
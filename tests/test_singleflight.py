@@ -0,0 +1,105 @@
+"""Concurrent identical upstream requests share a single call."""
+
+import asyncio
+
+import pytest
+
+from hamops.adapters import aprs, callsign
+from hamops.cache import SingleFlight
+
+CALLERS = 50
+
+
+class CountingUpstream:
+    """Stand-in for an upstream request that counts calls and takes a while."""
+
+    def __init__(self, result=None, error=None, delay=0.05):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self, *args):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Give every test an empty aprs.fi cache and fresh coalescers."""
+    aprs.get_aprs_cache().clear()
+    monkeypatch.setattr(aprs, "_aprs_flights", SingleFlight())
+    monkeypatch.setattr(callsign, "_lookups", SingleFlight())
+
+
+def test_concurrent_aprs_queries_make_one_upstream_call(monkeypatch):
+    response = {"result": "ok", "entries": [{"name": "N0CALL", "lat": "1", "lng": "2"}]}
+    upstream = CountingUpstream(result=response)
+    monkeypatch.setattr(aprs, "_request_aprs", upstream)
+
+    async def run():
+        return await asyncio.gather(
+            *(aprs.get_aprs_locations("n0call") for _ in range(CALLERS))
+        )
+
+    results = asyncio.run(run())
+    assert upstream.calls == 1
+    assert all(records == results[0] for records in results)
+    assert results[0][0].name == "N0CALL"
+
+
+def test_concurrent_callsign_lookups_make_one_upstream_call(monkeypatch):
+    upstream = CountingUpstream(result="record")
+    monkeypatch.setattr(callsign, "_lookup_callsign", upstream)
+
+    async def run():
+        return await asyncio.gather(
+            *(callsign.lookup_callsign(c) for c in ["K1ABC", "k1abc"] * (CALLERS // 2))
+        )
+
+    assert asyncio.run(run()) == ["record"] * CALLERS
+    assert upstream.calls == 1
+
+
+def test_error_reaches_every_waiter(monkeypatch):
+    upstream = CountingUpstream(error=RuntimeError("upstream down"))
+    monkeypatch.setattr(callsign, "_lookup_callsign", upstream)
+
+    async def run():
+        return await asyncio.gather(
+            *(callsign.lookup_callsign("K1ABC") for _ in range(CALLERS)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert upstream.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    # Failures are not remembered: the next call goes upstream again
+    assert callsign._lookups.stats()["inflight"] == 0
+    with pytest.raises(RuntimeError):
+        asyncio.run(callsign.lookup_callsign("K1ABC"))
+    assert upstream.calls == 2
+
+
+def test_cancelled_leader_does_not_cancel_the_shared_call(monkeypatch):
+    upstream = CountingUpstream(result="record")
+    monkeypatch.setattr(callsign, "_lookup_callsign", upstream)
+
+    async def run():
+        leader = asyncio.create_task(callsign.lookup_callsign("K1ABC"))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(callsign.lookup_callsign("K1ABC"))
+            for _ in range(CALLERS - 1)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(run()) == ["record"] * (CALLERS - 1)
+    assert upstream.calls == 1